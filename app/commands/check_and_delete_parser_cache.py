@@ -2,6 +2,8 @@
 from API since a certain amount of time. It can be run in the background.
 """
 
+import asyncio
+
 from app.common.cache_manager import CacheManager
 from app.common.logging import logger
 from app.config import settings
@@ -10,20 +12,21 @@ from app.config import settings
 cache_manager = CacheManager()
 
 
-def get_soon_expired_cache_keys() -> set[str]:
+async def get_soon_expired_cache_keys() -> set[str]:
     """Get a set of keys for values in Parser Cache which should be deleted"""
-    return set(
-        cache_manager.get_soon_expired_cache_keys(
+    return {
+        key
+        async for key in cache_manager.get_soon_expired_cache_keys(
             settings.parser_cache_last_update_key_prefix,
-        ),
-    )
+        )
+    }
 
 
-def delete_parser_cache_keys(parser_keys: set[str]) -> None:
+async def delete_parser_cache_keys(parser_keys: set[str]) -> None:
     """Delete all Parser Cache related keys : the ones prefixed for the
     Parser Cache data, and the ones used and retrieved in this process.
     """
-    cache_manager.delete_keys(
+    await cache_manager.delete_keys(
         f"{prefix}:{key}"
         for key in parser_keys
         for prefix in (
@@ -33,17 +36,17 @@ def delete_parser_cache_keys(parser_keys: set[str]) -> None:
     )
 
 
-def main():
-    """Main function of the script"""
+async def main():
+    """Main coroutine of the script"""
     logger.info("Starting Parser Cache expiration system...")
-    parser_keys = get_soon_expired_cache_keys()
+    parser_keys = await get_soon_expired_cache_keys()
     logger.info("Parser keys retrieval done !")
     if not parser_keys:
         logger.info("No Parser key to delete, closing")
         raise SystemExit
 
     logger.info("Deleting {} keys from Redis...", len(parser_keys))
-    delete_parser_cache_keys(parser_keys)
+    await delete_parser_cache_keys(parser_keys)
     logger.info("Parser Cache cleaning done !")
 
 
@@ -51,4 +54,4 @@ if __name__ == "__main__":  # pragma: no cover
     logger = logger.patch(
         lambda record: record.update(name="check_and_delete_parser_cache"),
     )
-    main()
+    asyncio.run(main())
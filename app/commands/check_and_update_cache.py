@@ -44,49 +44,42 @@ cache_manager = CacheManager()
 sem = asyncio.Semaphore(settings.max_concurrent_requests)
 
 
-def get_soon_expired_cache_keys() -> set[str]:
+async def get_soon_expired_cache_keys() -> set[str]:
     """Get a set of URIs for values in Parser Cache which are obsolete
-    or will need to be updated.
+    or will need to be updated. Only the ones which have been read recently
+    are kept, other ones will be refreshed when they're read again.
     """
-    return set(
-        cache_manager.get_soon_expired_cache_keys(settings.parser_cache_key_prefix),
+    soon_expired_cache_keys = [
+        key
+        async for key in cache_manager.get_soon_expired_cache_keys(
+            settings.parser_cache_key_prefix,
+        )
+    ]
+    return (
+        await cache_manager.get_read_parser_cache_keys(
+            soon_expired_cache_keys,
+            settings.expired_cache_refresh_read_window,
+        )
+        or set()
     )
 
 
-def get_request_parser_class(cache_key: str) -> tuple[type, dict]:
-    """Get the request parser class and cache kwargs to use for instanciation"""
-    cache_kwargs = {}
-
-    parser_class_name = cache_key.split("-")[0]
-    cache_parser_class = PARSER_CLASSES_MAPPING[parser_class_name]
-
-    # If the cache is related to local data
-    if settings.blizzard_host not in cache_key:
-        return cache_parser_class, cache_kwargs
-
-    uri = cache_key.removeprefix(f"{parser_class_name}-{settings.blizzard_host}").split(
-        "/",
-    )
-    cache_kwargs["locale"] = uri[1]
-    if "Player" in parser_class_name:
-        cache_kwargs["player_id"] = uri[3]
-    elif parser_class_name == "NamecardParser":
-        cache_kwargs["player_id"] = uri[4].replace("#", "-")
-    elif parser_class_name == "HeroParser":
-        cache_kwargs["hero_key"] = uri[3]
-
-    return cache_parser_class, cache_kwargs
+def get_request_parser(metadata: dict) -> AbstractParser:
+    """Instanciate the request parser using the metadata stored with its cache"""
+    parser_class = PARSER_CLASSES_MAPPING[metadata["parser"]]
+    return parser_class(**metadata["kwargs"])
 
 
 async def retrieve_data(key: str, parser: AbstractParser):
     """Coroutine for retrieving data for a single parser. We're using a semaphore
-    to limit the number of concurrent requests.
+    to limit the number of concurrent requests. The Parser Cache lock is used, as
+    the application may be refreshing the same data in the background.
     """
     async with sem:
         logger.info("Updating data for {} key...", key)
 
         try:
-            await parser.retrieve_and_parse_data()
+            await parser.refresh()
         except ParserBlizzardError as error:
             logger.exception(
                 "Failed to instanciate Parser when refreshing : {}",
@@ -102,13 +95,22 @@ async def main():
     """Main coroutine of the script"""
     logger.info("Starting Redis cache update...")
 
-    keys_to_update = get_soon_expired_cache_keys()
+    keys_to_update = await get_soon_expired_cache_keys()
     logger.info("Done ! Retrieved keys : {}", len(keys_to_update))
 
+    # Parser class and kwargs are stored with the Parser Cache
+    keys_metadata = await cache_manager.get_parser_cache_metadata(
+        list(keys_to_update),
+    )
+
     tasks = []
     for key in keys_to_update:
-        parser_class, kwargs = get_request_parser_class(key)
-        parser = parser_class(**kwargs)
+        metadata = (keys_metadata or {}).get(key)
+        if not metadata:
+            logger.warning("No metadata found for {} key, it won't be updated", key)
+            continue
+
+        parser = get_request_parser(metadata)
         tasks.append(retrieve_data(key, parser))
 
     await asyncio.gather(*tasks)
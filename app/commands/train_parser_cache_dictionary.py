@@ -0,0 +1,72 @@
+"""Command used in order to train the zstd dictionary used to compress Parser Cache
+values, using parsed data of test fixtures. A dictionary must never be modified once
+it has been used, so the Parser Cache codec version must be bumped before training
+a new one.
+"""
+
+import json
+from collections.abc import Iterator
+from pathlib import Path
+
+import zstandard
+
+from app.common.helpers import (
+    dumps_json_value,
+    get_zstd_dictionary_path,
+    json_value_codec_version,
+)
+from app.common.logging import logger
+from app.config import settings
+
+# Size of the trained dictionary, default one recommended by zstd
+dictionary_size = 112640
+
+# Maximum size of a training sample. Big parsed values (career pages) are split
+# into smaller ones, as zstd training works better with a lot of small samples.
+max_sample_size = 16384
+
+
+def get_training_samples(value: dict | list) -> Iterator[bytes]:
+    """Split a parsed value into serialized samples small enough for training"""
+    serialized_value = dumps_json_value(value)
+    if len(serialized_value) <= max_sample_size:
+        yield serialized_value
+        return
+
+    for child_value in value.values() if isinstance(value, dict) else value:
+        if isinstance(child_value, dict | list):
+            yield from get_training_samples(child_value)
+
+
+def main():
+    """Main method of the script"""
+    dictionary_path = get_zstd_dictionary_path(json_value_codec_version)
+    if dictionary_path.exists():
+        logger.error(
+            "Dictionary {} already exists, bump the codec version to train a new one",
+            dictionary_path,
+        )
+        raise SystemExit
+
+    logger.info("Training Parser Cache dictionary...")
+
+    samples = [
+        sample
+        for fixture_path in sorted(
+            Path(f"{settings.test_fixtures_root_path}/json").rglob("*.json")
+        )
+        for sample in get_training_samples(json.loads(fixture_path.read_text()))
+    ]
+    logger.info("{} samples found in test fixtures", len(samples))
+
+    dictionary = zstandard.train_dictionary(dictionary_size, samples)
+    dictionary_path.write_bytes(dictionary.as_bytes())
+
+    logger.info("Dictionary {} saved !", dictionary_path)
+
+
+if __name__ == "__main__":  # pragma: no cover
+    logger = logger.patch(
+        lambda record: record.update(name="train_parser_cache_dictionary")
+    )
+    main()
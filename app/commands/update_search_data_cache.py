@@ -1,5 +1,6 @@
 """Command used in order to retrieve the last version of the namecards"""
 
+import asyncio
 import json
 import re
 
@@ -8,7 +9,7 @@ import httpx
 from app.common.cache_manager import CacheManager
 from app.common.enums import Locale, SearchDataType
 from app.common.exceptions import SearchDataRetrievalError
-from app.common.helpers import send_discord_webhook_message
+from app.common.helpers import overfast_client, send_discord_webhook_message
 from app.common.logging import logger
 from app.config import settings
 
@@ -23,9 +24,9 @@ variable_name_mapping: dict[SearchDataType, str] = {
 }
 
 
-def get_search_page() -> httpx.Response:
+async def get_search_page() -> httpx.Response:
     try:
-        response = httpx.get(
+        response = await overfast_client.get(
             f"{settings.blizzard_host}/{Locale.ENGLISH_US}{settings.search_data_path}"
         )
     except httpx.RequestError as error:
@@ -75,12 +76,12 @@ def transform_search_data(
     }
 
 
-def retrieve_search_data(
+async def retrieve_search_data(
     data_type: SearchDataType, search_page: httpx.Response | None = None
 ) -> dict[str, str]:
     if not search_page:
         logger.info("Retrieving Blizzard search page...")
-        search_page = get_search_page()
+        search_page = await get_search_page()
 
     logger.info("Extracting {} data from HTML data...", data_type)
     search_data = extract_search_data(search_page.text, data_type)
@@ -89,29 +90,36 @@ def retrieve_search_data(
     return transform_search_data(search_data, data_type)
 
 
-def update_search_data_cache():
-    """Main method of the script"""
-    try:
-        logger.info("Retrieving Blizzard search page...")
-        search_page = get_search_page()
+async def retrieve_all_search_data() -> dict[SearchDataType, dict[str, str]]:
+    """Retrieve every type of search data from the Blizzard search page, which
+    is only requested once. Raises SearchDataRetrievalError in case of error.
+    """
+    logger.info("Retrieving Blizzard search page...")
+    search_page = await get_search_page()
 
-        logger.info("Retrieving search data...")
-        search_data = {
-            data_type: retrieve_search_data(data_type, search_page)
-            for data_type in SearchDataType
-        }
+    logger.info("Retrieving search data...")
+    return {
+        data_type: await retrieve_search_data(data_type, search_page)
+        for data_type in SearchDataType
+    }
+
+
+async def update_search_data_cache():
+    """Retrieve search data from Blizzard and store it in the cache"""
+    try:
+        search_data = await retrieve_all_search_data()
     except SearchDataRetrievalError as error:
         raise SystemExit from error
 
     logger.info("Saving search data...")
-    cache_manager.update_search_data_cache(search_data)
+    await cache_manager.update_search_data_cache(search_data)
 
 
-def main():
-    """Main method of the script"""
-    update_search_data_cache()
+async def main():
+    """Main coroutine of the script"""
+    await update_search_data_cache()
 
 
 if __name__ == "__main__":  # pragma: no cover
     logger = logger.patch(lambda record: record.update(name="update_search_data_cache"))
-    main()
+    asyncio.run(main())
@@ -10,60 +10,191 @@ Examples :
 api-cache:/heroes => "[{...}]"
 api-cache:/heroes?role=damage => "[{...}]"
 
+Keys are canonical : query parameters are sorted, and the ones having their
+default value are removed (/heroes?locale=en-us is stored as /heroes).
+
+The body of "not found" responses (unknown players) is stored with a short TTL
+in separated keys, served with a 404 status by nginx.
+
+Example :
+api-cache-not-found:/players/Unknown-1234 => "{"error":"Player not found"}"
+
+Compressed variants of every API Cache value are stored as well, one for each
+supported content encoding, so nginx can serve them without compressing anything.
+
+Examples :
+api-cache-br:/heroes => <brotli compressed "[{...}]">
+api-cache-gzip:/heroes => <gzip compressed "[{...}]">
+
 ----
 
-Parser Cache data will rarely expire and just be invalidated using MD5 hash check.
-It simply contains a JSON string representation of parsed data of a given Blizzard
-HTML page. MD5 hash is calculated using the HTML ready to be parsed
-(only the part used for parsing).
+Parser Cache data contains a compressed JSON string representation of parsed data
+of a given Blizzard HTML page, prefixed by the version of the codec used (orjson
+and zstd with a dictionary trained on parsed data). Its metadata (parser class and
+kwargs, MD5 hash of the Blizzard page) is stored in a separated hash. When
+refreshing, if the MD5 hash of the page didn't change, the Parser Cache expiration
+is just extended.
+
+Values are kept in Redis during a grace period after their expiration, in order to
+be served as stale data if Blizzard is slow or unavailable. Their expiration
+timestamp is the score of the key in the Parser Cache expiry index.
 
 Examples :
-parser-cache:https://overwatch.blizzard.com/en-us/heroes
-=> {"hash": "12345abcdef", "data": "[{...}]"}
-parser-cache:https://overwatch.blizzard.com/en-us/heroes/ana
-=> {"hash": "12345abcdef", "data": "[{...}]"}
-"""
+parser-cache:HeroesParser-https://overwatch.blizzard.com/en-us/heroes
+=> "[{...}]"
+parser-cache-metadata
+=> {"HeroesParser-https://overwatch.blizzard.com/en-us/heroes": "{"hash": ...}"}
 
-import json
-from collections.abc import Callable, Iterable, Iterator
+Missing Blizzard pages (unknown players) are stored as "not found" entries with a
+short TTL, containing the error message, so they're not requested again meanwhile.
 
-import redis
+Example :
+parser-cache-not-found:PlayerParser-https://overwatch.blizzard.com/en-us/career/Unknown-1234/
+=> "Player not found"
+
+----
+
+Search data (avatars, namecards, titles) is stored in one hash per data type, and
+loaded in the memory of every application process.
+
+Example :
+search-data-cache:namecard => {"0x0250000000005510": "https://..."}
+"""
+
+import asyncio
+import secrets
+import time
+from collections.abc import AsyncIterator, Callable, Iterable, Mapping
+from functools import wraps
+from operator import itemgetter
+from types import MappingProxyType
+from typing import ClassVar
+from urllib.parse import urlencode
+
+import orjson
 from fastapi import Request
+from redis import asyncio as aioredis
+from redis.exceptions import RedisError
 
 from app.common.enums import SearchDataType
 from app.config import settings
 
-from .helpers import compress_json_value, decompress_json_value, get_spread_value
+from .helpers import (
+    compress_api_cache_value,
+    compress_json_value,
+    decompress_json_value,
+    dumps_json_value,
+    get_spread_value,
+    is_outdated_json_value,
+)
+from .local_cache import LocalBloomFilter, LocalCache
 from .logging import logger
 from .metaclasses import Singleton
 
+# Lua script releasing a lock (compare-and-delete) and notifying the processes
+# waiting for it, only if it's still held by the process (same token)
+release_lock_script = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    redis.call("del", KEYS[1])
+    redis.call("publish", KEYS[1], 1)
+    return 1
+end
+return 0
+"""
+
 
 class CacheManager(metaclass=Singleton):
     """Cache manager main class, containing methods to retrieve
     and store cache values for both Parser and API Cache from Redis.
     """
 
-    # Redis server global variable
+    # Redis server global variable. The asyncio client relies on a connection
+    # pool shared by every coroutine of the process : when all connections are
+    # in use, callers wait for a free one instead of opening new sockets.
     redis_server = (
-        redis.Redis(host=settings.redis_host, port=settings.redis_port)
+        aioredis.Redis(
+            connection_pool=aioredis.BlockingConnectionPool(
+                host=settings.redis_host,
+                port=settings.redis_port,
+                max_connections=settings.redis_max_connections,
+                timeout=settings.redis_pool_timeout,
+                socket_timeout=settings.redis_socket_timeout,
+                socket_connect_timeout=settings.redis_socket_timeout,
+                socket_keepalive=True,
+                health_check_interval=settings.redis_health_check_interval,
+            ),
+        )
         if settings.redis_caching_enabled
         else None
     )
 
+    # Local in-memory Parser Cache of the process, in front of Redis. Values are
+    # invalidated using Redis pub/sub whenever the Parser Cache is updated.
+    local_parser_cache = LocalCache(max_size=settings.local_parser_cache_max_size)
+
+    # Bloom filters of player ids of the process : the ones Blizzard reported as
+    # not found, and the ones known to exist (search results, career pages)
+    players_missing_filter = LocalBloomFilter(
+        size=settings.players_bloom_filter_size,
+        hash_count=settings.players_bloom_filter_hash_count,
+        timeout=settings.players_bloom_filter_timeout,
+    )
+    players_existing_filter = LocalBloomFilter(
+        size=settings.players_bloom_filter_size,
+        hash_count=settings.players_bloom_filter_hash_count,
+        timeout=settings.players_bloom_filter_timeout,
+    )
+
+    # In-process search data (avatars, namecards, titles), by data type. It's
+    # never modified, but replaced as a whole when search data is updated.
+    search_data: Mapping[SearchDataType, Mapping[str, str]] = MappingProxyType({})
+
+    # Tokens of the Parser Cache locks held by the process, by Parser Cache key
+    parser_cache_lock_tokens: ClassVar[dict[str, str]] = {}
+
+    # Coroutines of the process waiting for Parser Cache locks to be released, by
+    # Parser Cache key, and the listener of lock releases they're sharing (task
+    # and event set once it's subscribed)
+    parser_cache_lock_waiters: ClassVar[dict[str, set[asyncio.Future]]] = {}
+    parser_cache_locks_listener: ClassVar[tuple[asyncio.Task, asyncio.Event] | None] = (
+        None
+    )
+
     # Whenever we encounter an error on Redis connection, this variable is set
     # to False to prevent trying to reach the Redis server multiple times.
     is_redis_server_up = settings.redis_caching_enabled
 
     @staticmethod
-    def log_warning(err: redis.exceptions.RedisError) -> None:
+    def log_warning(err: RedisError) -> None:
         logger.warning("Redis server error : {}", str(err))
 
     @staticmethod
     def get_cache_key_from_request(request: Request) -> str:
-        """Get the cache key associated with a user request"""
-        return request.url.path + (
-            f"?{request.query_params}" if request.query_params else ""
+        """Get the canonical cache key associated with a user request. Query
+        parameters are sorted by name, enumeration values are lowercased and the
+        ones equal to their default value are removed, in order for equivalent
+        requests to share the same cache key.
+        """
+        query_params = (
+            (
+                key,
+                value.lower()
+                if key in settings.api_cache_case_insensitive_query_params
+                else value,
+            )
+            for key, value in request.query_params.multi_items()
         )
+        query_string = urlencode(
+            sorted(
+                (
+                    (key, value)
+                    for key, value in query_params
+                    if settings.api_cache_default_query_params.get(key) != value
+                ),
+                key=itemgetter(0),
+            )
+        )
+        return request.url.path + (f"?{query_string}" if query_string else "")
 
     @staticmethod
     def redis_connection_handler(func: Callable):
@@ -71,49 +202,162 @@ class CacheManager(metaclass=Singleton):
         Errors are logged and the process continues even if Redis can't be joined.
         """
 
-        def wrapper(self, *args, **kwargs):
+        @wraps(func)
+        async def wrapper(self, *args, **kwargs):
             if not self.is_redis_server_up:
                 return None
             try:
-                return func(self, *args, **kwargs)
-            except redis.exceptions.RedisError as err:
+                return await func(self, *args, **kwargs)
+            except RedisError as err:
                 self.log_warning(err)
                 return None
 
         return wrapper
 
+    async def close(self) -> None:
+        """Close the connections of the Redis connection pool"""
+        if self.redis_server is not None:
+            await self.redis_server.aclose()
+
+    @staticmethod
+    def get_expiry_index_key(cache_key_prefix: str) -> str:
+        """Get the key of the sorted set indexing the keys of a given prefix by
+        their expiration timestamp, used to retrieve the ones expiring soon.
+        """
+        return f"{cache_key_prefix}-{settings.expiry_index_key_suffix}"
+
     @redis_connection_handler
-    def get_api_cache(self, cache_key: str) -> str | None:
+    async def get_api_cache(self, cache_key: str) -> bytes | None:
         """Get the API Cache value associated with a given cache key"""
-        return self.redis_server.get(f"{settings.api_cache_key_prefix}:{cache_key}")
+        return await self.redis_server.get(
+            f"{settings.api_cache_key_prefix}:{cache_key}"
+        )
+
+    @staticmethod
+    def get_local_parser_cache_timeout(cache_key: str) -> int | None:
+        """Get the local Parser Cache timeout associated with a given cache key,
+        depending on the parser class name. None if it's not cached locally.
+        """
+        return settings.local_parser_cache_timeouts.get(cache_key.split("-")[0])
 
     @redis_connection_handler
-    def get_parser_cache(self, cache_key: str) -> dict | list | None:
-        """Get the Parser Cache value associated with a given cache key"""
-        parser_cache = self.redis_server.get(
-            f"{settings.parser_cache_key_prefix}:{cache_key}",
-        )
-        return decompress_json_value(parser_cache) if parser_cache else None
+    async def get_parser_cache(self, cache_key: str) -> dict | list | None:
+        """Get the Parser Cache value associated with a given cache key, if it
+        hasn't expired
+        """
+        parser_cache = await self.get_parser_cache_entry(cache_key)
+        if not parser_cache or self.is_expired_parser_cache_ttl(parser_cache[1]):
+            return None
+        return parser_cache[0]
+
+    @staticmethod
+    def is_expired_parser_cache_ttl(parser_cache_ttl: int | None) -> bool:
+        """Whether the TTL of a Parser Cache entry means the value has expired,
+        and is only kept as stale data
+        """
+        return parser_cache_ttl is not None and parser_cache_ttl <= 0
+
+    @redis_connection_handler
+    async def get_parser_cache_entry(
+        self, cache_key: str
+    ) -> tuple[dict | list | None, int | None, bool, dict | None]:
+        """Get the Parser Cache value associated with a given cache key, its
+        remaining TTL, whether it has been validated and its metadata (values
+        seeded from search results don't have any), in a single round trip.
+        The TTL is negative or zero once the value has expired, during the grace
+        period it's kept as stale data. Local Parser Cache is used first if the
+        value can be stored in it, without any TTL in this case. Reads from Redis
+        are tracked, in order to only refresh values which are still used.
+        """
+        local_timeout = self.get_local_parser_cache_timeout(cache_key)
+        if local_timeout and (local_entry := self.local_parser_cache.get(cache_key)):
+            value, is_validated, metadata = local_entry
+            return value, None, is_validated, metadata
+
+        async with self.redis_server.pipeline(transaction=False) as pipe:
+            pipe.get(f"{settings.parser_cache_key_prefix}:{cache_key}")
+            pipe.ttl(f"{settings.parser_cache_key_prefix}:{cache_key}")
+            pipe.zscore(
+                self.get_expiry_index_key(settings.parser_cache_key_prefix), cache_key
+            )
+            pipe.hget(settings.parser_cache_metadata_key, cache_key)
+            pipe.zadd(settings.parser_cache_reads_key, {cache_key: time.time()})
+            parser_cache, key_ttl, expiration, metadata, _ = await pipe.execute()
+
+        if not parser_cache:
+            return None, None, False, None
+
+        # Values which aren't indexed (seeded ones) have no grace period
+        if expiration is not None:
+            parser_cache_ttl = int(expiration - time.time())
+        else:
+            parser_cache_ttl = key_ttl if key_ttl >= 0 else None
+
+        value = decompress_json_value(parser_cache)
+        metadata = orjson.loads(metadata) if metadata is not None else None
+        is_validated = bool(metadata) and metadata.get("validated", False)
+        if local_timeout and not self.is_expired_parser_cache_ttl(parser_cache_ttl):
+            self.local_parser_cache.set(
+                cache_key, (value, is_validated, metadata), local_timeout
+            )
+        return value, parser_cache_ttl, is_validated, metadata
 
     @redis_connection_handler
-    def update_api_cache(self, cache_key: str, value: dict | list, expire: int) -> None:
-        """Update or set an API Cache value with an expiration value (in seconds)"""
+    async def update_api_cache(self, cache_key: str, value: bytes, expire: int) -> None:
+        """Update or set an API Cache value (JSON bytes of the final response) with
+        an expiration value (in seconds), along with its compressed variants.
+        """
 
-        # Compress the JSON string
-        str_value = json.dumps(value, separators=(",", ":"))
+        # Store it in API Cache, with its compressed variants
+        async with self.redis_server.pipeline() as pipe:
+            pipe.set(f"{settings.api_cache_key_prefix}:{cache_key}", value, ex=expire)
+            for encoding in settings.api_cache_encodings:
+                pipe.set(
+                    f"{settings.api_cache_key_prefix}-{encoding}:{cache_key}",
+                    compress_api_cache_value(value, encoding),
+                    ex=expire,
+                )
+            pipe.delete(f"{settings.api_cache_not_found_key_prefix}:{cache_key}")
+            await pipe.execute()
 
-        # Store it in API Cache
-        self.redis_server.set(
-            f"{settings.api_cache_key_prefix}:{cache_key}",
-            str_value,
-            ex=expire,
+    @redis_connection_handler
+    async def get_api_cache_or_not_found(
+        self, cache_key: str, encoding: str | None = None
+    ) -> tuple[bytes | None, bytes | None] | None:
+        """Get both the API Cache value (or its compressed variant) and the body of
+        the "not found" response associated with a given cache key, in a single
+        Redis roundtrip. Used when serving a request without knowing which one
+        may exist.
+        """
+        key_prefix = settings.api_cache_key_prefix + (
+            f"-{encoding}" if encoding else ""
+        )
+        api_cache, api_cache_not_found = await self.redis_server.mget(
+            f"{key_prefix}:{cache_key}",
+            f"{settings.api_cache_not_found_key_prefix}:{cache_key}",
         )
+        return api_cache, api_cache_not_found
 
     @redis_connection_handler
-    def update_parser_cache(self, cache_key: str, value: dict, expire: int) -> None:
+    async def update_api_cache_not_found(
+        self, cache_key: str, value: bytes, expire: int
+    ) -> None:
+        """Store the body of a "not found" response for a given cache key, with an
+        expiration value (in seconds). Served with a 404 status by nginx.
+        """
+        await self.redis_server.set(
+            f"{settings.api_cache_not_found_key_prefix}:{cache_key}", value, ex=expire
+        )
+
+    @redis_connection_handler
+    async def update_parser_cache(
+        self, cache_key: str, value: dict, expire: int, metadata: dict | None = None
+    ) -> None:
         """Update or set a Parser Cache value with an expire value. In order to
         fluidify the refresh and to avoid having a lot in the same time, we're
-        using a random percentage spread value for the expiration value.
+        using a random percentage spread value for the expiration value. Optional
+        metadata (parser class and kwargs) is used when refreshing the value. The
+        value is kept during a grace period after its expiration, as stale data.
         """
         compressed_value = compress_json_value(value)
 
@@ -123,72 +367,592 @@ class CacheManager(metaclass=Singleton):
             settings.parser_cache_expiration_spreading_percentage,
         )
 
-        self.redis_server.set(
-            f"{settings.parser_cache_key_prefix}:{cache_key}",
-            value=compressed_value,
-            ex=expiration,
+        # Store the value, and notify every process if it can be stored in their
+        # local Parser Cache (values of other parsers are never stored locally)
+        is_local_value = self.get_local_parser_cache_timeout(cache_key) is not None
+        self.local_parser_cache.delete(cache_key)
+        async with self.redis_server.pipeline() as pipe:
+            pipe.set(
+                f"{settings.parser_cache_key_prefix}:{cache_key}",
+                value=compressed_value,
+                ex=expiration + settings.parser_cache_stale_grace_period,
+            )
+            pipe.zadd(
+                self.get_expiry_index_key(settings.parser_cache_key_prefix),
+                {cache_key: time.time() + expiration},
+            )
+            if metadata is not None:
+                pipe.hset(
+                    settings.parser_cache_metadata_key,
+                    cache_key,
+                    dumps_json_value(metadata),
+                )
+            pipe.delete(f"{settings.parser_cache_not_found_key_prefix}:{cache_key}")
+            if is_local_value:
+                pipe.publish(settings.parser_cache_invalidation_channel, cache_key)
+            await pipe.execute()
+
+    @redis_connection_handler
+    async def seed_parser_cache(self, values: dict[str, dict], expire: int) -> None:
+        """Store Parser Cache values retrieved without their parser (from another
+        Blizzard page), in a single round trip. Existing values are kept. Seeded
+        values don't have any metadata, so they're not refreshed in the background
+        and are used until they expire, unless they're retrieved by their parser.
+        """
+        async with self.redis_server.pipeline(transaction=False) as pipe:
+            for cache_key, value in values.items():
+                pipe.set(
+                    f"{settings.parser_cache_key_prefix}:{cache_key}",
+                    value=compress_json_value(value),
+                    ex=get_spread_value(
+                        expire, settings.parser_cache_expiration_spreading_percentage
+                    ),
+                    nx=True,
+                )
+            await pipe.execute()
+
+    @redis_connection_handler
+    async def get_parser_cache_metadata(
+        self, cache_keys: list[str]
+    ) -> dict[str, dict] | None:
+        """Get the metadata stored with the given Parser Cache keys, in a single
+        call. Keys without any metadata are not in the returned dict.
+        """
+        if not cache_keys:
+            return {}
+
+        metadata_values = await self.redis_server.hmget(
+            settings.parser_cache_metadata_key,
+            cache_keys,
+        )
+        return {
+            cache_key: orjson.loads(metadata)
+            for cache_key, metadata in zip(cache_keys, metadata_values, strict=True)
+            if metadata
+        }
+
+    async def listen_cache_updates(self) -> None:
+        """Listen to Parser Cache and search data updates notifications, in order
+        to invalidate the associated local Parser Cache values, and to reload the
+        in-process search data. It's running in the background for the application
+        lifetime, and reconnects in case of Redis server error.
+        """
+        while self.is_redis_server_up:
+            try:
+                async with self.redis_server.pubsub() as pubsub:
+                    await pubsub.subscribe(
+                        settings.parser_cache_invalidation_channel,
+                        settings.search_data_update_channel,
+                    )
+
+                    # Updates may have been missed before being subscribed
+                    await self.load_search_data()
+
+                    while True:
+                        message = await pubsub.get_message(
+                            ignore_subscribe_messages=True,
+                            timeout=settings.redis_health_check_interval,
+                        )
+                        if not message:
+                            continue
+
+                        channel = message["channel"].decode("utf-8")
+                        if channel == settings.search_data_update_channel:
+                            await self.load_search_data()
+                        else:
+                            self.local_parser_cache.delete(
+                                message["data"].decode("utf-8"),
+                            )
+            except RedisError as err:
+                self.log_warning(err)
+
+                # Notifications may have been missed while being disconnected
+                self.local_parser_cache.clear()
+                await asyncio.sleep(settings.redis_socket_timeout)
+
+    @redis_connection_handler
+    async def extend_parser_cache(
+        self, cache_key: str, expire: int
+    ) -> dict | list | None:
+        """Extend the expiration of a Parser Cache value which is still up-to-date,
+        without compressing and storing the data again. It can be done while the
+        value has already expired, during its grace period. If it has been stored
+        with a previous codec version, it's migrated. Returns the value, or None if
+        there is nothing to extend.
+        """
+        compressed_value = await self.redis_server.get(
+            f"{settings.parser_cache_key_prefix}:{cache_key}"
+        )
+        if not compressed_value:
+            return None
+
+        value = decompress_json_value(compressed_value)
+        if is_outdated_json_value(compressed_value):
+            compressed_value = compress_json_value(value)
+
+        expiration = get_spread_value(
+            expire,
+            settings.parser_cache_expiration_spreading_percentage,
+        )
+        async with self.redis_server.pipeline() as pipe:
+            pipe.set(
+                f"{settings.parser_cache_key_prefix}:{cache_key}",
+                value=compressed_value,
+                ex=expiration + settings.parser_cache_stale_grace_period,
+            )
+            pipe.zadd(
+                self.get_expiry_index_key(settings.parser_cache_key_prefix),
+                {cache_key: time.time() + expiration},
+            )
+            await pipe.execute()
+
+        return value
+
+    @redis_connection_handler
+    async def get_read_parser_cache_keys(
+        self, cache_keys: list[str], read_window: int
+    ) -> set[str] | None:
+        """Get the given Parser Cache keys which have been read during the last
+        seconds of the given window, in a single round trip. Older reads are
+        forgotten.
+        """
+        if not cache_keys:
+            return set()
+
+        async with self.redis_server.pipeline(transaction=False) as pipe:
+            pipe.zremrangebyscore(
+                settings.parser_cache_reads_key, "-inf", time.time() - read_window
+            )
+            pipe.zmscore(settings.parser_cache_reads_key, cache_keys)
+            _, reads = await pipe.execute()
+
+        return {
+            cache_key
+            for cache_key, read in zip(cache_keys, reads, strict=True)
+            if read is not None
+        }
+
+    @redis_connection_handler
+    async def get_existing_parser_cache_keys(
+        self, cache_keys: list[str]
+    ) -> set[str] | None:
+        """Get the given cache keys having a Parser Cache value, in a single
+        round trip and without retrieving the values
+        """
+        async with self.redis_server.pipeline(transaction=False) as pipe:
+            for cache_key in cache_keys:
+                pipe.exists(f"{settings.parser_cache_key_prefix}:{cache_key}")
+            keys_existence = await pipe.execute()
+
+        return {
+            cache_key
+            for cache_key, key_exists in zip(cache_keys, keys_existence, strict=True)
+            if key_exists
+        }
+
+    @redis_connection_handler
+    async def get_parser_cache_not_found(self, cache_key: str) -> str | None:
+        """Get the error message stored for a given Parser Cache key, if its
+        Blizzard page is known to be missing (unknown player for example)
+        """
+        message = await self.redis_server.get(
+            f"{settings.parser_cache_not_found_key_prefix}:{cache_key}",
         )
+        return message.decode("utf-8") if message else None
 
-    def get_soon_expired_cache_keys(self, cache_key_prefix: str) -> Iterator[str]:
+    @redis_connection_handler
+    async def update_parser_cache_not_found(
+        self, cache_key: str, message: str, expire: int
+    ) -> None:
+        """Store the error message of a missing Blizzard page for a given Parser
+        Cache key, with an expiration value (in seconds), so the page isn't
+        requested again in the meantime
+        """
+        await self.redis_server.set(
+            f"{settings.parser_cache_not_found_key_prefix}:{cache_key}",
+            message,
+            ex=expire,
+        )
+
+    @redis_connection_handler
+    async def acquire_parser_cache_lock(self, cache_key: str) -> bool:
+        """Try to acquire the lock used to retrieve and parse the data associated
+        with a given Parser Cache key. It's automatically released after a timeout,
+        in case the process holding it can't release it. A random token is stored
+        in the lock, so the process only releases it if it's still holding it.
+        """
+        lock_token = secrets.token_hex(16)
+        is_lock_acquired = bool(
+            await self.redis_server.set(
+                f"{settings.parser_cache_lock_key_prefix}:{cache_key}",
+                value=lock_token,
+                nx=True,
+                ex=settings.parser_cache_lock_timeout,
+            ),
+        )
+        if is_lock_acquired:
+            self.parser_cache_lock_tokens[cache_key] = lock_token
+        return is_lock_acquired
+
+    @redis_connection_handler
+    async def release_parser_cache_lock(self, cache_key: str) -> None:
+        """Release the Parser Cache lock and notify the processes waiting for it.
+        Nothing is done if the lock timed out and has been acquired by another
+        process meanwhile.
+        """
+        lock_token = self.parser_cache_lock_tokens.pop(cache_key, None)
+        if lock_token is None:
+            return
+
+        await self.redis_server.eval(
+            release_lock_script,
+            1,
+            f"{settings.parser_cache_lock_key_prefix}:{cache_key}",
+            lock_token,
+        )
+
+    @redis_connection_handler
+    async def wait_for_parser_cache(self, cache_key: str) -> dict | list | None:
+        """Wait for the process holding the Parser Cache lock to release it, and
+        return the Parser Cache value it stored. None is returned if the lock
+        timed out or if the process didn't store anything (error). Lock releases
+        are received by a single subscription shared by every waiting coroutine.
+        """
+        lock_released = asyncio.get_running_loop().create_future()
+        self.parser_cache_lock_waiters.setdefault(cache_key, set()).add(lock_released)
+        try:
+            await self.__subscribe_to_parser_cache_locks()
+
+            # The lock may have been released before our subscription, in
+            # this case there is nothing to wait for
+            if await self.redis_server.exists(
+                f"{settings.parser_cache_lock_key_prefix}:{cache_key}"
+            ):
+                try:
+                    async with asyncio.timeout(settings.parser_cache_lock_timeout):
+                        await lock_released
+                except TimeoutError:
+                    logger.warning("Timeout while waiting for {} lock", cache_key)
+        finally:
+            waiters = self.parser_cache_lock_waiters[cache_key]
+            waiters.discard(lock_released)
+            if not waiters:
+                del self.parser_cache_lock_waiters[cache_key]
+
+            # The subscription is only kept while coroutines are waiting
+            if not self.parser_cache_lock_waiters and (
+                listener := CacheManager.parser_cache_locks_listener
+            ):
+                CacheManager.parser_cache_locks_listener = None
+                listener[0].cancel()
+
+        return await self.get_parser_cache(cache_key)
+
+    async def __subscribe_to_parser_cache_locks(self) -> None:
+        """Start the listener of Parser Cache lock releases of the process if it's
+        not running yet, and wait for it to be subscribed
+        """
+        listener = CacheManager.parser_cache_locks_listener
+        if listener is None or listener[0].get_loop() is not asyncio.get_running_loop():
+            subscribed = asyncio.Event()
+            listener = (
+                asyncio.create_task(self.__listen_parser_cache_locks(subscribed)),
+                subscribed,
+            )
+            CacheManager.parser_cache_locks_listener = listener
+
+        await listener[1].wait()
+
+    async def __listen_parser_cache_locks(self, subscribed: asyncio.Event) -> None:
+        """Listen to the release of every Parser Cache lock using a single pattern
+        subscription, and notify the coroutines of the process waiting for them.
+        It's stopped once there is no waiting coroutine anymore. In case of Redis
+        server error, every waiting coroutine is notified, and the listener is
+        started again by the next one.
+        """
+        lock_channel_prefix = f"{settings.parser_cache_lock_key_prefix}:"
+        try:
+            async with self.redis_server.pubsub() as pubsub:
+                await pubsub.psubscribe(f"{lock_channel_prefix}*")
+                subscribed.set()
+
+                while True:
+                    message = await pubsub.get_message(
+                        ignore_subscribe_messages=True,
+                        timeout=settings.redis_health_check_interval,
+                    )
+                    if not message:
+                        continue
+
+                    cache_key = (
+                        message["channel"]
+                        .decode("utf-8")
+                        .removeprefix(lock_channel_prefix)
+                    )
+                    for lock_released in self.parser_cache_lock_waiters.get(
+                        cache_key, ()
+                    ):
+                        if not lock_released.done():
+                            lock_released.set_result(None)
+        except RedisError as err:
+            self.log_warning(err)
+        finally:
+            if CacheManager.parser_cache_locks_listener is not None and (
+                CacheManager.parser_cache_locks_listener[1] is subscribed
+            ):
+                CacheManager.parser_cache_locks_listener = None
+            subscribed.set()
+            for waiters in self.parser_cache_lock_waiters.values():
+                for lock_released in waiters:
+                    if not lock_released.done():
+                        lock_released.set_result(None)
+
+    async def get_soon_expired_cache_keys(
+        self, cache_key_prefix: str
+    ) -> AsyncIterator[str]:
         """Get a set of cache keys for values in cache which will expire soon, meaning
         the associated TTL is close to expiration. Only returns the key suffix."""
         if not self.is_redis_server_up:
-            yield from ()
             return
 
         try:
-            cache_keys = self.redis_server.keys(pattern=f"{cache_key_prefix}:*")
-        except redis.exceptions.RedisError as err:
+            cache_keys = await self.__get_soon_expired_cache_keys_from_index(
+                cache_key_prefix,
+            )
+            if cache_keys is None:
+                cache_keys = await self.__scan_soon_expired_cache_keys(
+                    cache_key_prefix,
+                )
+        except RedisError as err:
             self.log_warning(err)
-            yield from ()
             return
 
-        prefix_to_remove = f"{cache_key_prefix}:"
         for key in cache_keys:
-            # Get key TTL in redis
-            try:
-                key_ttl = self.redis_server.ttl(key)
-            except redis.exceptions.RedisError as err:
-                self.log_warning(err)
-                continue
+            yield key
+
+    async def __get_soon_expired_cache_keys_from_index(
+        self, cache_key_prefix: str
+    ) -> list[str] | None:
+        """Get the keys expiring soon using the expiry index, with a single range
+        query. Keys which don't exist anymore (expired, and after their grace period
+        for Parser Cache) are removed from the index. None is returned if the index
+        for the given prefix hasn't been built from the keyspace yet, as keys stored
+        before it was used wouldn't be in it.
+        """
+        index_key = self.get_expiry_index_key(cache_key_prefix)
+        now = time.time()
+        deleted_before = now - self.get_grace_period(cache_key_prefix)
+        async with self.redis_server.pipeline(transaction=False) as pipe:
+            pipe.exists(f"{index_key}-built")
+            pipe.zrangebyscore(index_key, "-inf", deleted_before)
+            pipe.zremrangebyscore(index_key, "-inf", deleted_before)
+            pipe.zrangebyscore(
+                index_key, now, now + settings.expired_cache_refresh_limit
+            )
+            is_index_built, expired_keys, _, cache_keys = await pipe.execute()
+
+        # Metadata of expired Parser Cache values is not needed anymore
+        if expired_keys and cache_key_prefix == settings.parser_cache_key_prefix:
+            await self.redis_server.hdel(
+                settings.parser_cache_metadata_key, *expired_keys
+            )
+
+        return [key.decode("utf-8") for key in cache_keys] if is_index_built else None
+
+    async def __scan_soon_expired_cache_keys(self, cache_key_prefix: str) -> list[str]:
+        """Get the keys expiring soon by iterating over the keyspace with SCAN and
+        retrieving TTLs in a pipeline. Every key is added to the expiry index at the
+        same time, which is then marked as built, so that next calls don't need to
+        scan.
+        """
+        prefix_to_remove = f"{cache_key_prefix}:"
+        cache_keys = [
+            key
+            async for key in self.redis_server.scan_iter(
+                match=f"{cache_key_prefix}:*",
+                count=settings.expiry_index_scan_count,
+            )
+        ]
+        index_key = self.get_expiry_index_key(cache_key_prefix)
+        if not cache_keys:
+            await self.redis_server.set(f"{index_key}-built", 1)
+            return []
+
+        async with self.redis_server.pipeline(transaction=False) as pipe:
+            for key in cache_keys:
+                pipe.ttl(key)
+            keys_ttl = await pipe.execute()
+
+        # Keys without any TTL are not expiring, we don't index them. Their TTL
+        # includes the grace period of Parser Cache values.
+        now = time.time()
+        grace_period = self.get_grace_period(cache_key_prefix)
+        keys_with_ttl = {
+            key.decode("utf-8").removeprefix(prefix_to_remove): key_ttl - grace_period
+            for key, key_ttl in zip(cache_keys, keys_ttl, strict=True)
+            if key_ttl >= 0
+        }
+        async with self.redis_server.pipeline() as pipe:
+            if keys_with_ttl:
+                pipe.zadd(
+                    index_key,
+                    {key: now + key_ttl for key, key_ttl in keys_with_ttl.items()},
+                )
+            pipe.set(f"{index_key}-built", 1)
+            await pipe.execute()
 
-            # If the key doesn't have any TTL or the limit is far, we don't do anything
-            if key_ttl < 0 or key_ttl > settings.expired_cache_refresh_limit:
-                continue
+        return [
+            key
+            for key, key_ttl in keys_with_ttl.items()
+            if 0 <= key_ttl <= settings.expired_cache_refresh_limit
+        ]
 
-            yield key.decode("utf-8").removeprefix(prefix_to_remove)
+    @staticmethod
+    def get_grace_period(cache_key_prefix: str) -> int:
+        """Get the time (seconds) during which keys of a given prefix are kept after
+        their expiration. Only Parser Cache values are kept, as stale data.
+        """
+        return (
+            settings.parser_cache_stale_grace_period
+            if cache_key_prefix == settings.parser_cache_key_prefix
+            else 0
+        )
+
+    @staticmethod
+    def get_search_data_key(data_type: SearchDataType) -> str:
+        """Get the key of the hash containing the search data of a given type"""
+        return f"{settings.search_data_cache_key_prefix}:{data_type}"
 
     @redis_connection_handler
-    def update_search_data_cache(
+    async def update_search_data_cache(
         self, search_data: dict[SearchDataType, dict[str, str]]
     ) -> None:
-        for data_type, data in search_data.items():
-            for data_key, data_value in data.items():
-                self.redis_server.set(
-                    f"{settings.search_data_cache_key_prefix}:{data_type}:{data_key}",
-                    value=data_value,
-                    ex=settings.search_data_timeout,
-                )
+        """Replace the search data of the given types in a single transaction, and
+        notify every process in order for them to reload their search data
+        """
+        async with self.redis_server.pipeline() as pipe:
+            for data_type, data in search_data.items():
+                search_data_key = self.get_search_data_key(data_type)
+                pipe.delete(search_data_key)
+                if data:
+                    pipe.hset(search_data_key, mapping=data)
+                    pipe.expire(search_data_key, settings.search_data_timeout)
+            pipe.publish(settings.search_data_update_channel, "")
+            await pipe.execute()
+
+        await self.load_search_data()
 
     @redis_connection_handler
-    def get_search_data_cache(
+    async def load_search_data(self) -> None:
+        """Load the whole search data into the process in a single round trip. The
+        previous in-process search data is atomically replaced by the new one.
+        """
+        async with self.redis_server.pipeline(transaction=False) as pipe:
+            for data_type in SearchDataType:
+                pipe.hgetall(self.get_search_data_key(data_type))
+            search_data = await pipe.execute()
+
+        CacheManager.search_data = MappingProxyType(
+            {
+                data_type: MappingProxyType(
+                    {
+                        data_key.decode("utf-8"): data_value.decode("utf-8")
+                        for data_key, data_value in data.items()
+                    }
+                )
+                for data_type, data in zip(SearchDataType, search_data, strict=True)
+            }
+        )
+
+    async def get_search_data_cache(
         self, data_type: SearchDataType, cache_key: str
     ) -> str | None:
-        data_cache = self.redis_server.get(
-            f"{settings.search_data_cache_key_prefix}:{data_type}:{cache_key}",
+        """Get a search data value from the in-process search data. It's loaded
+        from Redis first if it hasn't been yet.
+        """
+        if not self.search_data:
+            await self.load_search_data()
+        return self.search_data.get(data_type, {}).get(cache_key)
+
+    @redis_connection_handler
+    async def get_search_results_cache(self, name: str) -> list | None:
+        """Get the players found by Blizzard for a given searched name"""
+        search_results = await self.redis_server.get(
+            f"{settings.search_results_cache_key_prefix}:{name}"
         )
-        return data_cache.decode("utf-8") if data_cache else None
+        return decompress_json_value(search_results) if search_results else None
 
     @redis_connection_handler
-    def update_parser_cache_last_update(self, cache_key: str, expire: int) -> None:
-        # We just set a minimal value, we're just interested in
-        # the key and its expiration time
-        self.redis_server.set(
-            f"{settings.parser_cache_last_update_key_prefix}:{cache_key}",
-            value=0,
+    async def update_search_results_cache(
+        self, name: str, search_results: list, expire: int
+    ) -> None:
+        """Store the players found by Blizzard for a given searched name, with an
+        expiration value (in seconds)
+        """
+        await self.redis_server.set(
+            f"{settings.search_results_cache_key_prefix}:{name}",
+            compress_json_value(search_results),
             ex=expire,
         )
 
     @redis_connection_handler
-    def delete_keys(self, keys: Iterable[str]) -> None:
-        self.redis_server.delete(*keys)
+    async def update_parser_cache_last_update(
+        self, cache_key: str, expire: int, metadata: dict | None = None
+    ) -> None:
+        """Store the last update of a Parser Cache value, used by the Parser Cache
+        expiration system. Its metadata can be replaced at the same time.
+        """
+        # We just set a minimal value, we're just interested in
+        # the key and its expiration time
+        async with self.redis_server.pipeline() as pipe:
+            pipe.set(
+                f"{settings.parser_cache_last_update_key_prefix}:{cache_key}",
+                value=0,
+                ex=expire,
+            )
+            pipe.zadd(
+                self.get_expiry_index_key(settings.parser_cache_last_update_key_prefix),
+                {cache_key: time.time() + expire},
+            )
+            if metadata is not None:
+                pipe.hset(
+                    settings.parser_cache_metadata_key,
+                    cache_key,
+                    dumps_json_value(metadata),
+                )
+            await pipe.execute()
+
+    @redis_connection_handler
+    async def delete_keys(self, keys: Iterable[str]) -> None:
+        """Delete the given keys, and remove them from the expiry index of their
+        prefix if there is any. Parser Cache metadata and reads are deleted as well.
+        """
+        keys = list(keys)
+        async with self.redis_server.pipeline() as pipe:
+            pipe.delete(*keys)
+            for key in keys:
+                cache_key_prefix, _, cache_key = key.partition(":")
+                if cache_key_prefix in (
+                    settings.parser_cache_key_prefix,
+                    settings.parser_cache_last_update_key_prefix,
+                ):
+                    pipe.zrem(self.get_expiry_index_key(cache_key_prefix), cache_key)
+                if cache_key_prefix == settings.parser_cache_key_prefix:
+                    pipe.hdel(settings.parser_cache_metadata_key, cache_key)
+                    pipe.zrem(settings.parser_cache_reads_key, cache_key)
+            await pipe.execute()
+
+    async def is_unknown_player(self, player_id: str, cache_key: str) -> bool:
+        """Whether a player is known to be missing on Blizzard side. In-process
+        Bloom filters are used as a pre-check (in the one of missing players, and
+        not in the one of existing players), so it doesn't cost anything for most
+        players. As they give false positives and outlive the "not found" entries,
+        the one of the player Parser Cache key must still exist.
+        """
+        if (
+            player_id not in self.players_missing_filter
+            or player_id in self.players_existing_filter
+        ):
+            return False
+
+        return await self.get_parser_cache_not_found(cache_key) is not None
@@ -4,36 +4,72 @@ import time
 from collections.abc import Callable
 from functools import wraps
 
-from fastapi import Request
-from pydantic import ValidationError
+from fastapi import Request, Response
+from pydantic import TypeAdapter, ValidationError
+
+from app.config import settings
 
 from .logging import logger
 
 
-def validation_error_handler(response_model: type):
+def validation_error_handler(response_model: type, *, exclude_unset: bool = False):
     """Decorator used for checking if the value processed by parsers are valid and
     matches the pydantic model. It prevents FastAPI to immediatly return an error,
     and allows to expose a custom error to the user and send a Discord
     notification to the developer.
+
+    The validated value is serialized only once into JSON bytes, which are stored
+    in API Cache if the request handler allowed it, and returned as a raw response
+    without any FastAPI validation or serialization. If the value has already been
+    validated when it was stored in Parser Cache, it's directly serialized. The
+    response is flagged if it has been built using stale Parser Cache data.
     """
 
     # Have to make the import here to prevent circular import issue
-    from .helpers import overfast_internal_error
+    from .cache_manager import CacheManager
+    from .helpers import dumps_json_value, overfast_internal_error
+
+    response_adapter = TypeAdapter(response_model)
+    list_response_adapter = TypeAdapter(list[response_model])
 
     def validation_error_handler_inner(func: Callable):
         @wraps(func)
         async def wrapper(request: Request, *args, **kwargs):
             try:
                 result = await func(request, *args, **kwargs)
-                response = (
-                    [response_model(**res) for res in result]
-                    if isinstance(result, list)
-                    else response_model(**result)
-                )
+                if getattr(request.state, "is_validated_data", False):
+                    content = dumps_json_value(result)
+                elif isinstance(result, list):
+                    content = list_response_adapter.dump_json(
+                        [response_model(**res) for res in result],
+                        by_alias=True,
+                        exclude_unset=exclude_unset,
+                    )
+                else:
+                    content = response_adapter.dump_json(
+                        response_model(**result),
+                        by_alias=True,
+                        exclude_unset=exclude_unset,
+                    )
             except ValidationError as error:
                 raise overfast_internal_error(request.url.path, error) from error
-            else:
-                return response
+
+            # Store the exact response content in API Cache if allowed by the handler
+            if api_cache_timeout := getattr(request.state, "api_cache_timeout", None):
+                await CacheManager().update_api_cache(
+                    CacheManager.get_cache_key_from_request(request),
+                    content,
+                    api_cache_timeout,
+                )
+
+            headers = (
+                {settings.stale_data_header: "stale"}
+                if getattr(request.state, "is_stale_data", False)
+                else None
+            )
+            return Response(
+                content=content, media_type="application/json", headers=headers
+            )
 
         return wrapper
 
@@ -7,6 +7,19 @@ from enum import StrEnum
 
 from app.common.helpers import read_csv_data_file
 
+
+class CaseInsensitiveStrEnum(StrEnum):
+    """String enumeration accepting any letter case for its values. Used for the
+    ones exposed as query parameters, which are lowercased in API Cache keys.
+    """
+
+    @classmethod
+    def _missing_(cls, value: object) -> "CaseInsensitiveStrEnum | None":
+        if not isinstance(value, str):
+            return None
+        return cls._value2member_map_.get(value.lower())
+
+
 # Dynamically create the HeroKey enum by using the CSV File
 heroes_data = read_csv_data_file("heroes.csv")
 HeroKey = StrEnum(
@@ -56,7 +69,7 @@ class RouteTag(StrEnum):
 
 # Dynamically create the HeroKeyCareerFilter by using the existing
 # HeroKey enum and just adding the "all-heroes" option
-HeroKeyCareerFilter = StrEnum(
+HeroKeyCareerFilter = CaseInsensitiveStrEnum(
     "HeroKeyCareerFilter",
     {
         "ALL_HEROES": "all-heroes",
@@ -74,7 +87,7 @@ class MediaType(StrEnum):
     VIDEO = "video"
 
 
-class Role(StrEnum):
+class Role(CaseInsensitiveStrEnum):
     """Overwatch heroes roles"""
 
     DAMAGE = "damage"
@@ -94,14 +107,14 @@ CompetitiveRole = StrEnum(
 CompetitiveRole.__doc__ = "Competitive roles for ranks in stats summary"
 
 
-class PlayerGamemode(StrEnum):
+class PlayerGamemode(CaseInsensitiveStrEnum):
     """Gamemodes associated with players statistics"""
 
     QUICKPLAY = "quickplay"
     COMPETITIVE = "competitive"
 
 
-class PlayerPlatform(StrEnum):
+class PlayerPlatform(CaseInsensitiveStrEnum):
     """Players platforms"""
 
     CONSOLE = "console"
@@ -121,7 +134,7 @@ class CompetitiveDivision(StrEnum):
     ULTIMATE = "ultimate"
 
 
-class Locale(StrEnum):
+class Locale(CaseInsensitiveStrEnum):
     """Locales supported by Blizzard"""
 
     GERMAN = "de-de"
@@ -141,7 +154,7 @@ class Locale(StrEnum):
 
 # Dynamically create the MapGamemode enum by using the CSV File
 gamemodes_data = read_csv_data_file("gamemodes.csv")
-MapGamemode = StrEnum(
+MapGamemode = CaseInsensitiveStrEnum(
     "MapGamemode",
     {
         gamemode["key"].upper().replace("-", "_"): gamemode["key"]
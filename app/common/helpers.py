@@ -1,6 +1,7 @@
 """Parser Helpers module"""
 
 import csv
+import gzip
 import json
 import zlib
 from functools import cache
@@ -8,8 +9,12 @@ from pathlib import Path
 from random import randint
 from typing import TYPE_CHECKING, Any
 
+import brotli
 import httpx
+import orjson
+import zstandard
 from fastapi import HTTPException, Request, status
+from pydantic import TypeAdapter
 
 from app.config import settings
 from app.models.errors import BlizzardErrorMessage, InternalServerErrorMessage
@@ -63,11 +68,13 @@ overfast_client_settings = {
 overfast_client = httpx.AsyncClient(**overfast_client_settings)
 
 
-async def overfast_request(url: str) -> httpx.Response:
-    """Make an HTTP GET request with custom headers and retrieve the result"""
+async def overfast_request(url: str, headers: dict | None = None) -> httpx.Response:
+    """Make an HTTP GET request with custom headers and retrieve the result.
+    Additional headers can be given, for conditional requests for example.
+    """
     try:
         logger.debug("Requesting {}...", url)
-        response = await overfast_client.get(url)
+        response = await overfast_client.get(url, headers=headers)
     except httpx.TimeoutException as error:
         raise blizzard_response_error(
             status_code=0,
@@ -164,14 +171,88 @@ def read_csv_data_file(filepath: str) -> list[dict[str, str]]:
         return list(csv.DictReader(csv_file, delimiter=","))
 
 
-def compress_json_value(value: dict | list) -> str:
-    """Helper method to transform a value into compressed JSON data"""
-    return zlib.compress(json.dumps(value, separators=(",", ":")).encode("utf-8"))
+# Version of the codec used for Parser Cache values (orjson serialization and zstd
+# compression with a trained dictionary), stored as the first byte of every value.
+# Values stored with a previous codec can still be read, and are migrated when
+# they're stored again. Legacy values (stdlib json and zlib) don't have any version
+# byte, but they always start with the zlib header byte.
+json_value_codec_version = 1
+zlib_header_byte = 0x78
+
+
+def get_zstd_dictionary_path(version: int) -> Path:
+    """Get the path of the zstd dictionary used by a given Parser Cache codec
+    version. A dictionary must never be modified once it has been used.
+    """
+    return Path(f"{Path.cwd()}/app/data/parser-cache-v{version}.zstd-dict")
+
+
+@cache
+def get_zstd_dictionary(version: int) -> zstandard.ZstdCompressionDict:
+    """Get the zstd dictionary, trained on parsed data, of a given codec version"""
+    return zstandard.ZstdCompressionDict(get_zstd_dictionary_path(version).read_bytes())
+
+
+@cache
+def get_zstd_compressor() -> zstandard.ZstdCompressor:
+    """Get the zstd compressor of the current Parser Cache codec version"""
+    return zstandard.ZstdCompressor(
+        level=settings.parser_cache_zstd_level,
+        dict_data=get_zstd_dictionary(json_value_codec_version),
+    )
+
+
+@cache
+def get_zstd_decompressor(version: int) -> zstandard.ZstdDecompressor:
+    """Get the zstd decompressor of a given Parser Cache codec version"""
+    return zstandard.ZstdDecompressor(dict_data=get_zstd_dictionary(version))
+
+
+def dumps_json_value(value: dict | list) -> bytes:
+    """Helper method to serialize a value into compact JSON data"""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
 
 
-def decompress_json_value(value: str) -> dict | list:
-    """Helper method to retrieve a value from a compressed JSON data"""
-    return json.loads(zlib.decompress(value).decode("utf-8"))
+def compress_json_value(value: dict | list) -> bytes:
+    """Helper method to transform a value into compressed JSON data, prefixed by
+    the version of the codec used
+    """
+    return json_value_codec_version.to_bytes() + get_zstd_compressor().compress(
+        dumps_json_value(value)
+    )
+
+
+def decompress_json_value(value: bytes) -> dict | list:
+    """Helper method to retrieve a value from a compressed JSON data, depending
+    on the version of the codec used to store it
+    """
+    if value[0] == zlib_header_byte:
+        return orjson.loads(zlib.decompress(value))
+    return orjson.loads(get_zstd_decompressor(value[0]).decompress(value[1:]))
+
+
+def is_outdated_json_value(value: bytes) -> bool:
+    """Helper method to know if a compressed JSON data has been stored with a
+    previous version of the codec, and should be migrated
+    """
+    return value[0] != json_value_codec_version
+
+
+def compress_api_cache_value(value: bytes, encoding: str) -> bytes:
+    """Helper method to compress an API Cache value with the given content encoding
+    (br or gzip), in order to be directly served by nginx with Content-Encoding.
+    """
+    if encoding == "br":
+        return brotli.compress(value, quality=settings.api_cache_brotli_quality)
+    return gzip.compress(value, compresslevel=settings.api_cache_gzip_level)
+
+
+@cache
+def get_type_adapter(model: Any) -> TypeAdapter:
+    """Get the pydantic TypeAdapter of a given model, only built once as it's
+    an expensive operation
+    """
+    return TypeAdapter(model)
 
 
 def get_spread_value(value: int, spread_percentage: float) -> int:
@@ -0,0 +1,104 @@
+"""Local cache module, giving a bounded in-memory cache with expiration used by
+the Cache Manager in front of Redis, in order to avoid network round trips and
+decompression for data which is rarely updated. In-memory Bloom filters are
+used as well, for pre-checks which must not cost any round trip.
+"""
+
+import hashlib
+import time
+from collections import OrderedDict
+from collections.abc import Iterable
+from typing import Any
+
+
+class LocalCache:
+    """In-memory cache of a process, with a TTL for every value and a maximum
+    number of values. When the cache is full, the least recently used value is
+    evicted. Hits and misses are counted for monitoring purposes.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self.values: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Any | None:
+        """Get the value associated with a given key, if it's not expired"""
+        try:
+            expiration, value = self.values[key]
+        except KeyError:
+            self.misses += 1
+            return None
+
+        if expiration <= time.monotonic():
+            del self.values[key]
+            self.misses += 1
+            return None
+
+        self.values.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: str, value: Any, expire: int) -> None:
+        """Set a value with an expiration value (in seconds)"""
+        self.values[key] = (time.monotonic() + expire, value)
+        self.values.move_to_end(key)
+        while len(self.values) > self.max_size:
+            self.values.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        self.values.pop(key, None)
+
+    def clear(self) -> None:
+        self.values.clear()
+
+    @property
+    def stats(self) -> dict[str, int]:
+        return {"size": len(self.values), "hits": self.hits, "misses": self.misses}
+
+
+class LocalBloomFilter:
+    """In-memory Bloom filter of a process, using a single bit for each position.
+    False positives are possible, but not false negatives. Values can't be
+    removed : the filter is cleared once its timeout is reached, which bounds its
+    saturation and the lifetime of false positives.
+    """
+
+    def __init__(self, size: int, hash_count: int, timeout: int):
+        self.size = size
+        self.hash_count = hash_count
+        self.timeout = timeout
+        self.clear()
+
+    def __contains__(self, value: str) -> bool:
+        self.__clear_if_expired()
+        return all(
+            self.bits[position >> 3] & (1 << (position & 7))
+            for position in self.get_positions(value)
+        )
+
+    def add(self, values: Iterable[str]) -> None:
+        self.__clear_if_expired()
+        for value in values:
+            for position in self.get_positions(value):
+                self.bits[position >> 3] |= 1 << (position & 7)
+
+    def clear(self) -> None:
+        self.bits = bytearray((self.size + 7) // 8)
+        self.expiration = time.monotonic() + self.timeout
+
+    def get_positions(self, value: str) -> list[int]:
+        """Get the bit positions associated with a value. They're computed using
+        double hashing, so a single hash of the value is needed.
+        """
+        digest = hashlib.blake2b(value.encode("utf-8"), digest_size=16).digest()
+        first_hash = int.from_bytes(digest[:8])
+        second_hash = int.from_bytes(digest[8:]) | 1
+        return [
+            (first_hash + i * second_hash) % self.size for i in range(self.hash_count)
+        ]
+
+    def __clear_if_expired(self) -> None:
+        if self.expiration <= time.monotonic():
+            self.clear()
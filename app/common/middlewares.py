@@ -0,0 +1,112 @@
+"""Middlewares module, containing ASGI middlewares used by the application"""
+
+import re
+from typing import ClassVar
+
+from starlette import status
+from starlette.requests import Request
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.config import settings
+
+from .cache_manager import CacheManager
+
+
+class ApiCacheMiddleware:
+    """Pure ASGI middleware serving API Cache values before any routing, the same
+    way nginx does with its Redis module. It's used for deployments without nginx
+    in front of the application (local development, standard ingress, etc.).
+    Known "not found" responses are served as well, with a 404 status. Every cache
+    miss, and every request outside of the API routes, is forwarded to the
+    application.
+    """
+
+    # Content encodings of API Cache variants, in order of preference
+    encoding_patterns: ClassVar[dict[str, re.Pattern]] = {
+        encoding: re.compile(rf"\b{encoding}\b", re.IGNORECASE)
+        for encoding in ("br", "gzip")
+    }
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        self.cache_manager = CacheManager()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or scope["method"] != "GET"
+            or not self.is_api_path(scope["path"])
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        request = Request(scope)
+        cache_key = CacheManager.get_cache_key_from_request(request)
+        encoding = self.get_api_cache_encoding(
+            request.headers.get("accept-encoding", "")
+        )
+
+        # Both keys are retrieved at once, as only one of them can exist
+        api_cache, api_cache_not_found = (
+            await self.cache_manager.get_api_cache_or_not_found(cache_key, encoding)
+            or (None, None)
+        )
+
+        if api_cache:
+            headers = [(b"vary", b"Accept-Encoding")]
+            if encoding:
+                headers.append((b"content-encoding", encoding.encode()))
+            await self.send_response(send, status.HTTP_200_OK, api_cache, headers)
+            return
+
+        # Unknown resources (players) are remembered for a while as well
+        if api_cache_not_found:
+            await self.send_response(
+                send, status.HTTP_404_NOT_FOUND, api_cache_not_found
+            )
+            return
+
+        await self.app(scope, receive, send)
+
+    @staticmethod
+    def is_api_path(path: str) -> bool:
+        """Whether the given request path is an API route, which may be cached"""
+        return any(
+            path == prefix or path.startswith(f"{prefix}/")
+            for prefix in settings.api_cache_middleware_path_prefixes
+        )
+
+    @staticmethod
+    async def send_response(
+        send: Send,
+        status_code: int,
+        body: bytes,
+        headers: list[tuple[bytes, bytes]] | None = None,
+    ) -> None:
+        """Send a JSON response with the given status code and raw body"""
+        await send(
+            {
+                "type": "http.response.start",
+                "status": status_code,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode()),
+                    *(headers or []),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
+
+    def get_api_cache_encoding(self, accept_encoding: str) -> str | None:
+        """Get the content encoding of the API Cache variant to serve, depending
+        on the Accept-Encoding header of the request. None for the plain value.
+        """
+        return next(
+            (
+                encoding
+                for encoding, pattern in self.encoding_patterns.items()
+                if encoding in settings.api_cache_encodings
+                and pattern.search(accept_encoding)
+            ),
+            None,
+        )
@@ -39,7 +39,8 @@ class Settings(BaseSettings):
     # Log level for Loguru
     log_level: str = "info"
 
-    # Max HTTPX concurrent requests for async calls to Blizzard (cache updates)
+    # Max HTTPX concurrent requests for async calls to Blizzard (cache updates,
+    # career prefetch)
     max_concurrent_requests: int = 5
 
     # Optional, status page URL if you have any to provide
@@ -60,6 +61,22 @@ class Settings(BaseSettings):
     # Redis server port
     redis_port: int = 6379
 
+    # Maximum number of connections in the Redis connection pool shared by all
+    # the coroutines of a process. When every connection is in use, callers wait
+    # for a free one (up to the pool timeout) instead of opening new ones.
+    redis_max_connections: int = 50
+
+    # Maximum time (seconds) to wait for a free connection in the Redis pool
+    redis_pool_timeout: float = 2.0
+
+    # Timeout (seconds) for connecting and reading a reply from the Redis server.
+    # A slow reply is handled as a cache miss instead of stalling the request.
+    redis_socket_timeout: float = 2.0
+
+    # Interval (seconds) after which an idle pooled connection is checked
+    # with a PING command before being used again
+    redis_health_check_interval: int = 30
+
     ############
     # CACHE CONFIGURATION
     ############
@@ -68,20 +85,154 @@ class Settings(BaseSettings):
     # Used by nginx as main API cache.
     api_cache_key_prefix: str = "api-cache"
 
+    # Content encodings of the compressed variants stored alongside every API Cache
+    # value, under "<api_cache_key_prefix>-<encoding>" keys. nginx directly serves
+    # the variant matching the Accept-Encoding header of the request. Must be
+    # kept consistent with the nginx configuration.
+    api_cache_encodings: list[str] = ["br", "gzip"]
+
+    # Query parameters whose values are case-insensitive (enumerations), and
+    # default values of query parameters, used to build canonical API Cache keys.
+    # Must be kept consistent with the nginx njs script building the same keys.
+    api_cache_case_insensitive_query_params: list[str] = [
+        "gamemode",
+        "hero",
+        "locale",
+        "platform",
+        "role",
+    ]
+    api_cache_default_query_params: dict[str, str] = {
+        "limit": "20",
+        "locale": "en-us",
+        "offset": "0",
+        "order_by": "name:asc",
+    }
+
+    # Prefix for keys in API Cache containing the body of "not found" responses
+    # (unknown players), served with a 404 status by nginx.
+    api_cache_not_found_key_prefix: str = "api-cache-not-found"
+
+    # Whether or not the application directly serves API Cache values before any
+    # routing, using an ASGI middleware. Only useful for deployments without the
+    # nginx Redis module in front of the application, which already does it.
+    api_cache_middleware_enabled: bool = False
+
+    # Path prefixes of API routes whose responses are stored in API Cache. Other
+    # requests (documentation, static files, etc.) are directly forwarded to the
+    # application by the middleware, without any Redis call.
+    api_cache_middleware_path_prefixes: list[str] = [
+        "/gamemodes",
+        "/heroes",
+        "/maps",
+        "/players",
+        "/roles",
+    ]
+
+    # Compression level used for brotli (0-11) and gzip (1-9) API Cache variants.
+    # Compression only happens when storing the value, not when serving it.
+    api_cache_brotli_quality: int = 5
+    api_cache_gzip_level: int = 6
+
     # Prefix for keys in Parser cache (Redis). Used by parser classes
     # in order to avoid parsing data which has already been parsed.
     parser_cache_key_prefix: str = "parser-cache"
 
+    # Prefix for keys of "not found" Parser Cache entries (Redis), storing the
+    # error message of Blizzard pages which don't exist (unknown players).
+    parser_cache_not_found_key_prefix: str = "parser-cache-not-found"
+
+    # Compression level of zstd for Parser Cache values. Compression only happens
+    # when storing a value, the decompression speed doesn't depend on the level.
+    parser_cache_zstd_level: int = 9
+
     # Prefix for keys in Parser cache last update (Redis).
     # Used by the Parser Cache expiration system, to avoid keeping Parser
     # Cache data which is not used anymore indefinitely.
     parser_cache_last_update_key_prefix: str = "parser-cache-last-update"
 
+    # Prefix for keys of Parser Cache locks (Redis). When Parser Cache is missing,
+    # only the process holding the lock retrieves and parses the Blizzard page.
+    # Others are notified on a channel with the same name once the data is stored.
+    parser_cache_lock_key_prefix: str = "parser-cache-lock"
+
+    # Maximum time (seconds) a Parser Cache lock is held, and the others
+    # processes are waiting for the data. It should be greater than the
+    # timeout of requests made to Blizzard.
+    parser_cache_lock_timeout: int = 15
+
+    # Channel (Redis pub/sub) on which Parser Cache updates are published, in
+    # order to invalidate the local Parser Cache of every application process.
+    parser_cache_invalidation_channel: str = "parser-cache-invalidation"
+
+    # Timeouts (seconds) of the local in-memory Parser Cache, depending on the
+    # parser class name (prefix of the cache key). Values of other parsers are
+    # not stored locally. It avoids Redis round trips and decompression for
+    # data which is rarely updated.
+    local_parser_cache_timeouts: dict[str, int] = {
+        "GamemodesParser": 600,
+        "HeroParser": 600,
+        "HeroesParser": 600,
+        "HeroesStatsParser": 600,
+        "MapsParser": 600,
+        "RolesParser": 600,
+    }
+
+    # Maximum number of values in the local Parser Cache of a process. The least
+    # recently used values are evicted first.
+    local_parser_cache_max_size: int = 1000
+
+    # Key of the hash containing Parser Cache metadata (Redis), by cache key : the
+    # parser class name and kwargs used to instanciate it when refreshing the cache
+    parser_cache_metadata_key: str = "parser-cache-metadata"
+
+    # Suffix of the keys of expiry indexes (Redis sorted sets), containing the
+    # Parser Cache keys scored by expiration timestamp. They're used to retrieve
+    # the keys expiring soon with a single query, without scanning the keyspace.
+    expiry_index_key_suffix: str = "expiry-index"
+
+    # Number of keys returned by each SCAN call when an expiry index hasn't been
+    # built from the keyspace yet (marked by a "-built" suffixed key)
+    expiry_index_scan_count: int = 1000
+
+    # Grace period (seconds) during which a Parser Cache value is kept after its
+    # expiration, in order to be served as stale data if Blizzard is slow or
+    # unavailable when retrieving the data again
+    parser_cache_stale_grace_period: int = 86400
+
+    # Maximum time (seconds) to wait for Blizzard data when a stale copy is
+    # available. Once exceeded, the stale copy is returned and the retrieval
+    # continues in the background in order to update the Parser Cache.
+    parser_cache_stale_latency_budget: float = 3.0
+
+    # Once Blizzard failed or exceeded the latency budget for an expired Parser
+    # Cache value, its stale data is directly served by the process for a while
+    # (seconds), without waiting for Blizzard again. Maximum number of values
+    # remembered by a process.
+    parser_cache_stale_retry_delay: int = 60
+    parser_cache_stale_retry_max_size: int = 10000
+
+    # Response header set when the response has been built using stale data
+    stale_data_header: str = "X-Cache-Status"
+
     # When a cache value is about the expire (less than the configured value),
     # we will refresh it in the automatic cronjob "check_and_update_cache"
     # which is launched every minute. The value is specified in seconds.
     expired_cache_refresh_limit: int = 3600
 
+    # The cronjob only refreshes values which have been read from Redis during
+    # the configured time window (seconds). Other ones are left to expire, and
+    # are refreshed when they're read again (see refresh ahead limit below, and
+    # stale data). Reads are tracked in a sorted set (Redis), scored by timestamp.
+    expired_cache_refresh_read_window: int = 21600
+    parser_cache_reads_key: str = "parser-cache-reads"
+
+    # When a Parser Cache value is retrieved and is about to expire (less than
+    # the configured value, in seconds), it's refreshed in the background while
+    # the cached value is returned, in order to keep popular values up-to-date.
+    # It covers values which weren't read during the cronjob read window, and
+    # which are requested again before their expiration.
+    parser_cache_refresh_ahead_limit: int = 3600
+
     # Cache TTL for heroes list data (seconds)
     heroes_path_cache_timeout: int = 86400
 
@@ -94,9 +245,50 @@ class Settings(BaseSettings):
     # Cache TTL for career pages data (seconds)
     career_path_cache_timeout: int = 7200
 
+    # Cache TTL for unknown players in Parser Cache and API Cache (seconds). Kept
+    # short, as the player can be created or can make its profile visible.
+    player_not_found_parser_cache_timeout: int = 900
+    player_not_found_api_cache_timeout: int = 300
+
+    # Bloom filters of player ids, in the memory of every process : the ones
+    # Blizzard reported as not found, and the ones known to exist (search results,
+    # career pages). Used as a pre-check in order to directly reject requests for
+    # unknown players, without any Redis call for the other ones.
+
+    # Number of bits of each Bloom filter (memory usage in bytes is an eighth of
+    # this value), and number of bits used for a player id. Default values give
+    # less than 0.1% of false positives for one million player ids.
+    players_bloom_filter_size: int = 16777216
+    players_bloom_filter_hash_count: int = 7
+
+    # Lifetime of the Bloom filters (seconds). They're cleared afterwards, which
+    # bounds their saturation and the lifetime of false positives.
+    players_bloom_filter_timeout: int = 86400
+
     # Cache TTL for search account data (seconds)
     search_account_path_cache_timeout: int = 3600
 
+    # Cache key prefix and TTL (seconds) for the players found by Blizzard for a
+    # searched name. They're shared by every ordering and page of results for
+    # this name, and kept for a short time as new players can be found.
+    search_results_cache_key_prefix: str = "search-results-cache"
+    search_results_cache_timeout: int = 600
+
+    # Speculative prefetch of the career pages of the first players found by a
+    # search (number of players), as users usually open one of them next. It's
+    # done in the background, only if there is enough Blizzard requests budget.
+    career_prefetch_enabled: bool = False
+    career_prefetch_players_count: int = 2
+
+    # Maximum number of career pages prefetched by a process in a minute
+    career_prefetch_max_per_minute: int = 30
+
+    # TTL for Parser Cache expiration system (seconds) of prefetched career pages.
+    # It's short, so pages nobody requested aren't refreshed in the background.
+    # It must be greater than expired_cache_refresh_limit, otherwise prefetched
+    # pages are deleted by the next run of the expiration system.
+    career_prefetch_expiration_timeout: int = 10800
+
     # TTL for Parser Cache expiration system (seconds)
     # Used in order to make the Parser Cache expire if the player career data
     # hasn't been retrieved from an API call since a certain amount of time
@@ -113,15 +305,26 @@ class Settings(BaseSettings):
     # SEARCH DATA (AVATARS, NAMECARDS, TITLES)
     ############
 
-    # Cache key for search data cache in Redis.
+    # Cache key prefix for search data cache in Redis. Search data is stored in
+    # one hash per data type (namecard, portrait, title).
     search_data_cache_key_prefix: str = "search-data-cache"
 
+    # Channel (Redis pub/sub) on which search data updates are published, in
+    # order to reload the in-process search data of every application process.
+    search_data_update_channel: str = "search-data-update"
+
     # URI of the page where search data are saved
     search_data_path: str = "/search/"
 
     # Cache TTL for search data list
     search_data_timeout: int = 7200
 
+    # Search data values still unknown after a refresh of the search data are
+    # remembered in every process for a while (seconds), in order to avoid
+    # refreshing it again for them. Maximum number of remembered values.
+    search_data_unknown_value_timeout: int = 600
+    search_data_unknown_values_max_size: int = 10000
+
     ############
     # BLIZZARD
     ############
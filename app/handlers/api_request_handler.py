@@ -1,12 +1,13 @@
 """Abstract API Request Handler module"""
 
+import asyncio
 from abc import ABC, abstractmethod
 
-from fastapi import HTTPException, Request
+from fastapi import HTTPException, Request, status
 
 from app.common.cache_manager import CacheManager
 from app.common.exceptions import ParserBlizzardError, ParserParsingError
-from app.common.helpers import overfast_internal_error
+from app.common.helpers import dumps_json_value, overfast_internal_error
 from app.common.logging import logger
 
 
@@ -14,14 +15,23 @@ class APIRequestHandler(ABC):
     """Generic abstract API Request Handler, containing attributes structure and methods
     in order to quickly be able to create concrete request handlers. A handler can
     be associated with several parsers (one parser = one Blizzard page parsing).
-    The API Cache system is handled here.
+    The API Cache update is allowed here, depending on the freshness of the data.
     """
 
-    # Generic cache manager class, used to manipulate Redis cache data
-    cache_manager = CacheManager()
+    # Timeout used for API Cache storage of "not found" responses (unknown
+    # players for example). None if they're not stored for this specific handler.
+    not_found_timeout: int | None = None
 
     def __init__(self, request: Request):
-        self.cache_key = CacheManager.get_cache_key_from_request(request)
+        self.request = request
+
+        # Whether some parsers returned stale data, because Blizzard data
+        # couldn't be retrieved in time
+        self.is_stale_data = False
+
+        # Whether every parser returned data validated when it was stored in
+        # Parser Cache, so it doesn't need to be validated again
+        self.is_validated_data = True
 
     @property
     @abstractmethod
@@ -41,43 +51,102 @@ class APIRequestHandler(ABC):
         - Instanciate the dedicated parser classes, each one will :
             - Check if Parser Cache is available. If so, use it
             - Else, get Blizzard HTML page, parse it and create the Parser Cache
+            - If Blizzard is unavailable or too slow, use stale Parser Cache if any
         - Filter the data using kwargs parameters, then merge the data from parsers
-        - Update related API Cache and return the final data
+        - Allow related API Cache update (if data isn't stale) once the final data
+          has been validated and serialized, and return the final data
         """
 
-        # Request the data from Blizzard page
-        parsers_data = []
-        for parser_class in self.parser_classes:
-            # Instanciate the parser, it will check if a Parser Cache is here.
-            # If not, it will retrieve its associated Blizzard
-            # page and use the kwargs to generate the appropriate URL
-            parser = parser_class(**kwargs)
-
-            # Do the parsing. Internally, it will check for Parser Cache
-            # before doing a real parsing using BeautifulSoup
-            try:
-                await parser.parse()
-            except ParserBlizzardError as error:
-                raise HTTPException(
-                    status_code=error.status_code,
-                    detail=error.message,
-                ) from error
-            except ParserParsingError as error:
-                raise overfast_internal_error(parser.blizzard_url, error) from error
-
-            # Filter the data to obtain final parser data
-            logger.info("Filtering the data using query...")
-            parsers_data.append(parser.filter_request_using_query(**kwargs))
+        # Request the data from Blizzard pages. Parsers are independent from each
+        # other, so they're running concurrently. In case of error, every parser
+        # is awaited in order to raise the same error whatever the timing is.
+        parsers_data = await asyncio.gather(
+            *(
+                self.__parse_data(parser_class, **kwargs)
+                for parser_class in self.parser_classes
+            ),
+            return_exceptions=True,
+        )
+        if errors := [
+            result for result in parsers_data if isinstance(result, BaseException)
+        ]:
+            raise min(errors, key=self.get_error_precedence)
 
         # Merge parsers data together
         computed_data = self.merge_parsers_data(parsers_data, **kwargs)
 
-        # Update API Cache
-        self.cache_manager.update_api_cache(self.cache_key, computed_data, self.timeout)
+        # Stale data is flagged in the response, and not stored in API Cache,
+        # so that next requests will try to retrieve up-to-date data
+        if self.is_stale_data:
+            self.request.state.is_stale_data = True
+        else:
+            self.request.state.api_cache_timeout = self.timeout
+
+        if self.is_validated_data:
+            self.request.state.is_validated_data = True
 
         logger.info("Done ! Returning filtered data...")
         return computed_data
 
+    @staticmethod
+    def get_error_precedence(error: BaseException) -> int:
+        """Precedence of a parser error (lowest first) : a missing Blizzard page
+        (unknown player for example) is authoritative, and wins over transient
+        errors of other parsers. Otherwise, the order of parsers is kept.
+        """
+        is_not_found_error = (
+            isinstance(error, HTTPException)
+            and error.status_code == status.HTTP_404_NOT_FOUND
+        )
+        return 0 if is_not_found_error else 1
+
+    async def __parse_data(self, parser_class: type, **kwargs) -> dict | list:
+        """Parse the data using the given parser class, and filter it using
+        kwargs. Raises an HTTPException in case of error.
+        """
+
+        # Instanciate the parser, it will check if a Parser Cache is here.
+        # If not, it will retrieve its associated Blizzard
+        # page and use the kwargs to generate the appropriate URL
+        parser = parser_class(**kwargs)
+
+        # Do the parsing. Internally, it will check for Parser Cache
+        # before doing a real parsing using BeautifulSoup
+        try:
+            await parser.parse()
+        except ParserBlizzardError as error:
+            if (
+                error.status_code == status.HTTP_404_NOT_FOUND
+                and self.not_found_timeout
+            ):
+                await self.__update_api_cache_not_found(error.message)
+            raise HTTPException(
+                status_code=error.status_code,
+                detail=error.message,
+            ) from error
+        except ParserParsingError as error:
+            raise overfast_internal_error(parser.blizzard_url, error) from error
+
+        if parser.is_stale_data:
+            self.is_stale_data = True
+
+        if not parser.is_validated_data:
+            self.is_validated_data = False
+
+        # Filter the data to obtain final parser data
+        logger.info("Filtering the data using query...")
+        return parser.filter_request_using_query(**kwargs)
+
+    async def __update_api_cache_not_found(self, message: str) -> None:
+        """Store the body of the "not found" response in API Cache, so the same
+        request is directly answered by nginx for a while
+        """
+        await CacheManager().update_api_cache_not_found(
+            CacheManager.get_cache_key_from_request(self.request),
+            dumps_json_value({"error": message}),
+            self.not_found_timeout,
+        )
+
     def merge_parsers_data(self, parsers_data: list[dict | list], **_) -> dict | list:
         """Merge parsers data together. It depends on the given route and datas,
         and needs to be overriden in case a given Request Handler has several
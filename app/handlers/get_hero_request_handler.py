@@ -39,14 +39,14 @@ class GetHeroRequestHandler(APIRequestHandler):
             # for example if the hero has been released but is not in the
             # heroes list yet, or the list cache is outdated
             portrait_value = None
-        else:
-            # We want to insert the portrait before the "role" key
-            hero_data = dict_insert_value_before_key(
-                hero_data,
-                "role",
-                "portrait",
-                portrait_value,
-            )
+
+        # We want to insert the portrait before the "role" key
+        hero_data = dict_insert_value_before_key(
+            hero_data,
+            "role",
+            "portrait",
+            portrait_value,
+        )
 
         try:
             hitpoints = heroes_stats_data[kwargs.get("hero_key")]["hitpoints"]
@@ -54,13 +54,11 @@ class GetHeroRequestHandler(APIRequestHandler):
             # Hero hitpoints may not be here if the CSV file
             # containing the data hasn't been updated
             hitpoints = None
-        else:
-            # We want to insert hitpoints before "abilities" key
-            hero_data = dict_insert_value_before_key(
-                hero_data,
-                "abilities",
-                "hitpoints",
-                hitpoints,
-            )
 
-        return hero_data
+        # We want to insert hitpoints before "abilities" key
+        return dict_insert_value_before_key(
+            hero_data,
+            "abilities",
+            "hitpoints",
+            hitpoints,
+        )
@@ -17,6 +17,7 @@ class GetPlayerCareerRequestHandler(APIRequestHandler):
 
     parser_classes: ClassVar[list] = [PlayerParser, NamecardParser]
     timeout = settings.career_path_cache_timeout
+    not_found_timeout = settings.player_not_found_api_cache_timeout
 
     def merge_parsers_data(self, parsers_data: list[dict], **kwargs) -> dict:
         """Merge parsers data together : PlayerParser for statistics data,
@@ -42,5 +43,10 @@ class GetPlayerCareerRequestHandler(APIRequestHandler):
         if kwargs.get("summary"):
             return summary
 
-        parsers_data[0]["summary"] = summary
-        return parsers_data[0]
+        # The Player model adds career stats of every hero, even the ones which
+        # haven't been played, so the data can't be returned without validation
+        self.is_validated_data = False
+
+        # Career page data is shared between parsers and concurrent requests,
+        # so we're building a new dict instead of updating it
+        return {**parsers_data[0], "summary": summary}
@@ -15,3 +15,4 @@ class GetPlayerCareerStatsRequestHandler(APIRequestHandler):
 
     parser_classes: ClassVar[list] = [PlayerCareerParser]
     timeout = settings.career_path_cache_timeout
+    not_found_timeout = settings.player_not_found_api_cache_timeout
@@ -16,3 +16,4 @@ class GetPlayerStatsSummaryRequestHandler(APIRequestHandler):
 
     parser_classes: ClassVar[list] = [PlayerStatsSummaryParser]
     timeout = settings.career_path_cache_timeout
+    not_found_timeout = settings.player_not_found_api_cache_timeout
@@ -1,11 +1,18 @@
 """Search Players Request Handler module"""
 
+import asyncio
+import heapq
+import time
+from collections import deque
 from collections.abc import Iterable
+from operator import itemgetter
+from typing import ClassVar
 
-from fastapi import Request, status
+from fastapi import HTTPException, Request, status
 
 from app.common.cache_manager import CacheManager
-from app.common.enums import Locale
+from app.common.enums import Locale, SearchDataType
+from app.common.exceptions import ParserBlizzardError, ParserParsingError
 from app.common.helpers import (
     blizzard_response_error_from_request,
     get_player_title,
@@ -13,69 +20,142 @@ from app.common.helpers import (
 )
 from app.common.logging import logger
 from app.config import settings
-from app.parsers.search_data_parser import NamecardParser, PortraitParser, TitleParser
+from app.parsers.generics.abstract_parser import AbstractParser
+from app.parsers.player_parser import PlayerParser
+from app.parsers.search_data_parser import (
+    NamecardParser,
+    PortraitParser,
+    SearchDataParser,
+    SearchDataResolver,
+    TitleParser,
+)
 
 
 class SearchPlayersRequestHandler:
     """Search Players Request Handler used in order to find an Overwatch player
 
     The APIRequestHandler class is not used here, as this is a very specific request,
-    depending on a Blizzard endpoint returning JSON Data. Some parsers are used,
-    but only to compute already downloaded data, we don't want them to retrieve
-    Blizzard data as when we call their general parse() method.
+    depending on a Blizzard endpoint returning JSON Data. Search data of found
+    players is resolved from the cache at once, instead of using a parser for
+    each one of them. Found players are cached for every page of results.
     """
 
     timeout = settings.search_account_path_cache_timeout
     cache_manager = CacheManager()
 
+    # Fields of a found player kept in the cache, others are deduced from them
+    search_result_fields: ClassVar[tuple[str, ...]] = (
+        "name",
+        "avatar",
+        "namecard",
+        "title",
+        "blizzard_id",
+    )
+
+    # Parsers of search data, using the Blizzard search of a single player
+    search_data_parser_classes: ClassVar[tuple[type[SearchDataParser], ...]] = (
+        NamecardParser,
+        PortraitParser,
+        TitleParser,
+    )
+
+    # Career prefetches running in the process, and their start time during the
+    # last minute (rate limit)
+    running_prefetches: ClassVar[set[asyncio.Task]] = set()
+    prefetch_history: ClassVar[deque[float]] = deque()
+
     def __init__(self, request: Request):
-        self.cache_key = CacheManager.get_cache_key_from_request(request)
+        self.request = request
+        self.search_data_resolver = SearchDataResolver()
 
     async def process_request(self, **kwargs) -> dict:
         """Main method used to process the request from user and return final data.
 
         The main steps are :
-        - Make a request to Blizzard URL
-        - Instanciate the dedicated parser class with Blizzard response
-        - Parse the page completely, apply filters, transformation and ordering
+        - Retrieve the players found for the name, from the cache or from Blizzard
+          (search data parsers of found players are updated accordingly)
+        - Select the requested page of players, with the given ordering
+        - Optionally prefetch the career pages of the first players
         - Update API Cache accordingly, and return the final result
         """
 
-        # Request the data from Blizzard URL
-        req = await overfast_request(self.get_blizzard_url(**kwargs))
-        if req.status_code != status.HTTP_200_OK:
-            raise blizzard_response_error_from_request(req)
+        players = await self.get_players(kwargs.get("name"))
 
-        players = req.json()
-
-        # Transform into PlayerSearchResult format
-        logger.info("Applying transformation..")
-        players = self.apply_transformations(players)
-
-        # Apply ordering
+        # Apply ordering, only on players needed for the requested page
         logger.info("Applying ordering..")
-        players = self.apply_ordering(players, kwargs.get("order_by"))
-
         offset = kwargs.get("offset")
         limit = kwargs.get("limit")
+        ordered_players = self.apply_ordering(
+            players, kwargs.get("order_by"), offset + limit
+        )
 
         players_list = {
             "total": len(players),
-            "results": players[offset : offset + limit],
+            "results": ordered_players[offset:],
         }
 
-        # Update API Cache
-        logger.info("Updating API Cache...")
-        self.cache_manager.update_api_cache(self.cache_key, players_list, self.timeout)
+        # Career pages of the first players are likely to be requested next
+        if settings.career_prefetch_enabled:
+            await self.prefetch_careers(players_list["results"])
+
+        # Allow API Cache update once the data has been validated and serialized
+        self.request.state.api_cache_timeout = self.timeout
 
         # Return filtered list
         logger.info("Done ! Returning players list...")
         return players_list
 
-    def apply_transformations(self, players: Iterable[dict]) -> list[dict]:
+    async def get_players(self, name: str) -> list[dict]:
+        """Get the players found for a given name. They're cached once for the
+        name, in a compact form, and shared by every ordering and page of results.
+        """
+        search_results = await self.cache_manager.get_search_results_cache(name)
+        if search_results is None:
+            search_results = await self.retrieve_search_results(name)
+
+        return [
+            self.get_player_from_search_result(search_result)
+            for search_result in search_results
+        ]
+
+    async def retrieve_search_results(self, name: str) -> list[list]:
+        """Retrieve the players found for a given name from Blizzard, transform
+        them and store them in the cache in a compact form
+        """
+        # Request the data from Blizzard URL
+        req = await overfast_request(self.get_blizzard_url(name=name))
+        if req.status_code != status.HTTP_200_OK:
+            raise blizzard_response_error_from_request(req)
+
+        # Transform into PlayerSearchResult format
+        logger.info("Applying transformation..")
+        blizzard_players = req.json()
+        players = await self.apply_transformations(blizzard_players)
+
+        # Search data parsers of found players can directly use the search data
+        await self.seed_search_data_parser_cache(blizzard_players)
+
+        # Found players are known to exist
+        self.cache_manager.players_existing_filter.add(
+            player["player_id"] for player in players
+        )
+
+        search_results = [
+            [player[field] for field in self.search_result_fields] for player in players
+        ]
+        await self.cache_manager.update_search_results_cache(
+            name, search_results, settings.search_results_cache_timeout
+        )
+        return search_results
+
+    async def apply_transformations(self, players: Iterable[dict]) -> list[dict]:
         """Apply transformations to found players in order to return the data
-        in the OverFast API format. We'll also retrieve some data from parsers.
+        in the OverFast API format. Search data (avatars, namecards and titles)
+        of every player is resolved at once.
         """
+        players = list(players)
+        await self.search_data_resolver.resolve(players)
+
         transformed_players = []
         for player in players:
             player_id = player["battleTag"].replace("#", "-")
@@ -83,24 +163,117 @@ class SearchPlayersRequestHandler:
                 {
                     "player_id": player_id,
                     "name": player["battleTag"],
-                    "avatar": self.get_avatar_url(player, player_id),
-                    "namecard": self.get_namecard_url(player, player_id),
-                    "title": self.get_title(player, player_id),
+                    "avatar": self.get_avatar_url(player),
+                    "namecard": self.get_namecard_url(player),
+                    "title": self.get_title(player),
                     "career_url": f"{settings.app_base_url}/players/{player_id}",
                     "blizzard_id": player["url"],
                 },
             )
         return transformed_players
 
+    async def seed_search_data_parser_cache(self, players: Iterable[dict]) -> None:
+        """Store the resolved search data of found players in the Parser Cache of
+        their search data parsers (namecard for career requests for example), so
+        they won't have to search the player on Blizzard again
+        """
+        await self.cache_manager.seed_parser_cache(
+            {
+                parser_class(
+                    player_id=player["battleTag"].replace("#", "-")
+                ).cache_key: {
+                    parser_class.data_type: self.search_data_resolver.get_data_value(
+                        player, parser_class.data_type
+                    )
+                }
+                for player in players
+                for parser_class in self.search_data_parser_classes
+            },
+            SearchDataParser.timeout,
+        )
+
+    async def prefetch_careers(self, players: list[dict]) -> None:
+        """Retrieve the career pages of the first given players in the background,
+        if they're not already in Parser Cache. Prefetching stops as soon as the
+        process has no budget left for it.
+        """
+        parsers = [
+            PlayerParser(player_id=player["player_id"])
+            for player in players[: settings.career_prefetch_players_count]
+        ]
+        cached_keys = await self.cache_manager.get_existing_parser_cache_keys(
+            [parser.cache_key for parser in parsers]
+        )
+        # Without Redis, prefetched career pages couldn't be used afterwards
+        if cached_keys is None:
+            return
+
+        for parser in parsers:
+            if (
+                parser.cache_key in cached_keys
+                or parser.cache_key in AbstractParser.running_retrievals
+            ):
+                continue
+
+            if not self.has_prefetch_budget():
+                logger.info("No budget left for career prefetch, skipping...")
+                return
+
+            logger.info("Prefetching career of player {}...", parser.player_id)
+            self.prefetch_history.append(time.monotonic())
+            prefetch = asyncio.create_task(self.prefetch_career(parser))
+            self.running_prefetches.add(prefetch)
+            prefetch.add_done_callback(self.running_prefetches.discard)
+
+    @classmethod
+    def has_prefetch_budget(cls) -> bool:
+        """Whether a career page can be prefetched : the rate limit of prefetches
+        mustn't be reached, and Blizzard data retrievals running in the process
+        (for users or prefetches) mustn't exceed the concurrency budget
+        """
+        now = time.monotonic()
+        while cls.prefetch_history and cls.prefetch_history[0] <= now - 60:
+            cls.prefetch_history.popleft()
+
+        return (
+            len(cls.prefetch_history) < settings.career_prefetch_max_per_minute
+            and len(AbstractParser.running_retrievals)
+            < settings.max_concurrent_requests
+        )
+
     @staticmethod
-    def apply_ordering(players: list[dict], order_by: str) -> list[dict]:
-        """Apply the given ordering to the list of found players."""
+    async def prefetch_career(parser: PlayerParser) -> None:
+        """Parse a career page, errors are logged by the parser if needed. The
+        Parser Cache expiration of prefetched pages is short, it's extended when
+        a user requests them for the first time.
+        """
+        parser.is_prefetch = True
+        try:
+            await parser.parse()
+        except (HTTPException, ParserBlizzardError, ParserParsingError):
+            logger.info("Career prefetch of player {} failed", parser.player_id)
+
+    @staticmethod
+    def apply_ordering(players: list[dict], order_by: str, count: int) -> list[dict]:
+        """Apply the given ordering to the list of found players, and only return
+        the first ones. A partial selection is made instead of a full sort, as
+        only the first pages of results are usually requested.
+        """
         order_field, order_arrangement = order_by.split(":")
-        players.sort(
-            key=lambda player: player[order_field],
-            reverse=order_arrangement == "desc",
+        select_players = (
+            heapq.nlargest if order_arrangement == "desc" else heapq.nsmallest
         )
-        return players
+        return select_players(count, players, key=itemgetter(order_field))
+
+    def get_player_from_search_result(self, search_result: list) -> dict:
+        """Get a found player in the OverFast API format from its cached form"""
+        player = dict(zip(self.search_result_fields, search_result, strict=True))
+        player_id = player["name"].replace("#", "-")
+        return {
+            "player_id": player_id,
+            **player,
+            "career_url": f"{settings.app_base_url}/players/{player_id}",
+        }
 
     @staticmethod
     def get_blizzard_url(**kwargs) -> str:
@@ -108,12 +281,12 @@ class SearchPlayersRequestHandler:
         locale = Locale.ENGLISH_US
         return f"{settings.blizzard_host}/{locale}{settings.search_account_path}/{kwargs.get('name')}/"
 
-    def get_avatar_url(self, player: dict, player_id: str) -> str | None:
-        return PortraitParser(player_id=player_id).retrieve_data_value(player)
+    def get_avatar_url(self, player: dict) -> str | None:
+        return self.search_data_resolver.get_data_value(player, SearchDataType.PORTRAIT)
 
-    def get_namecard_url(self, player: dict, player_id: str) -> str | None:
-        return NamecardParser(player_id=player_id).retrieve_data_value(player)
+    def get_namecard_url(self, player: dict) -> str | None:
+        return self.search_data_resolver.get_data_value(player, SearchDataType.NAMECARD)
 
-    def get_title(self, player: dict, player_id: str) -> str | None:
-        title = TitleParser(player_id=player_id).retrieve_data_value(player)
+    def get_title(self, player: dict) -> str | None:
+        title = self.search_data_resolver.get_data_value(player, SearchDataType.TITLE)
         return get_player_title(title)
@@ -1,5 +1,6 @@
 """Project main file containing FastAPI app and routes definitions"""
 
+import asyncio
 from contextlib import asynccontextmanager, suppress
 
 from fastapi import FastAPI, Request
@@ -10,8 +11,10 @@ from fastapi.staticfiles import StaticFiles
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
 from .commands.update_search_data_cache import update_search_data_cache
+from .common.cache_manager import CacheManager
 from .common.enums import RouteTag
 from .common.logging import logger
+from .common.middlewares import ApiCacheMiddleware
 from .config import settings
 from .routers import gamemodes, heroes, maps, players, roles
 
@@ -22,10 +25,25 @@ async def lifespan(_: FastAPI):  # pragma: no cover
     if settings.redis_caching_enabled:
         logger.info("Updating search data cache (avatars, namecards, titles)")
         with suppress(SystemExit):
-            update_search_data_cache()
+            await update_search_data_cache()
+
+    # Invalidate local Parser Cache values and reload search data when they're
+    # updated by any process
+    cache_manager = CacheManager()
+    invalidations_listener = asyncio.create_task(
+        cache_manager.listen_cache_updates(),
+    )
 
     yield
 
+    invalidations_listener.cancel()
+    with suppress(asyncio.CancelledError):
+        await invalidations_listener
+    logger.info("Local Parser Cache stats : {}", cache_manager.local_parser_cache.stats)
+
+    # Release the Redis connection pool used by the application
+    await cache_manager.close()
+
 
 app = FastAPI(title="OverFast API", docs_url=None, redoc_url=None, lifespan=lifespan)
 description = f"""OverFast API provides comprehensive data on Overwatch 2 heroes,
@@ -115,6 +133,11 @@ logger.info("OverFast API... Online !")
 logger.info("Version : {}", settings.app_version)
 
 
+# Serve API Cache values before any routing if nginx isn't doing it
+if settings.api_cache_middleware_enabled:
+    app.add_middleware(ApiCacheMiddleware)
+
+
 @app.exception_handler(StarletteHTTPException)
 async def http_exception_handler(_: Request, exc: StarletteHTTPException):
     return JSONResponse(content={"error": exc.detail}, status_code=exc.status_code)
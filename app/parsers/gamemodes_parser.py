@@ -1,5 +1,9 @@
 """Gamemodes Parser module"""
 
+from typing import Any
+
+from app.models.gamemodes import GamemodeDetails
+
 from .generics.csv_parser import CSVParser
 
 
@@ -25,3 +29,6 @@ class GamemodesParser(CSVParser):
             }
             for gamemode in self.csv_data
         ]
+
+    def get_validation_filters(self) -> list[tuple[Any, dict, dict]]:
+        return [(list[GamemodeDetails], {}, {})]
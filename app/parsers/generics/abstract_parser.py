@@ -1,10 +1,19 @@
 """Abstract API Parser module"""
 
+import asyncio
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
 from functools import cached_property
+from typing import Any, ClassVar
+
+from fastapi import HTTPException
+from pydantic import ValidationError
 
 from app.common.cache_manager import CacheManager
+from app.common.helpers import get_type_adapter, overfast_internal_error
+from app.common.local_cache import LocalCache
 from app.common.logging import logger
+from app.config import settings
 
 
 class AbstractParser(ABC):
@@ -16,9 +25,39 @@ class AbstractParser(ABC):
 
     cache_manager = CacheManager()
 
-    def __init__(self, **_):
+    # Data retrievals currently running in the process, by Parser Cache key.
+    # Concurrent parsers with the same cache key are waiting for the same result.
+    running_retrievals: ClassVar[dict[str, asyncio.Task]] = {}
+
+    # Parser Cache keys whose data Blizzard recently failed to return in time.
+    # Their stale data is directly returned meanwhile, without waiting for it.
+    postponed_retrievals = LocalCache(
+        max_size=settings.parser_cache_stale_retry_max_size
+    )
+
+    # Keyword arguments used to instanciate the parser, stored with the Parser
+    # Cache in order to instanciate it again when refreshing the cache
+    cache_kwargs_keys: ClassVar[tuple[str, ...]] = ()
+
+    def __init__(self, **kwargs):
         self.data: dict | list = None
 
+        # Whether the data is a stale copy of the Parser Cache, returned
+        # because Blizzard data couldn't be retrieved in time
+        self.is_stale_data = False
+
+        # Whether every filtered view of the data has been validated when it was
+        # stored in Parser Cache, so requests don't need to validate it again
+        self.is_validated_data = False
+
+        # Metadata stored with the Parser Cache value, if there is any
+        self.parser_cache_metadata: dict | None = None
+        self.cache_kwargs = {
+            key: kwargs[key]
+            for key in self.cache_kwargs_keys
+            if kwargs.get(key) is not None
+        }
+
     @property
     @abstractmethod
     def timeout(self) -> int:
@@ -29,6 +68,18 @@ class AbstractParser(ABC):
         """Key used for caching using Parser Cache"""
         return type(self).__name__
 
+    @property
+    def cache_metadata(self) -> dict:
+        """Metadata stored with the Parser Cache : the parser class name, the
+        keyword arguments needed to instanciate it again, and whether the data
+        has been validated.
+        """
+        return {
+            "parser": type(self).__name__,
+            "kwargs": self.cache_kwargs,
+            "validated": self.is_validated_data,
+        }
+
     @property
     def cache_expiration_timeout(self) -> int | None:
         """Timeout used for the optional Parser Cache expiration system"""
@@ -45,26 +96,210 @@ class AbstractParser(ABC):
         not, it's calling the main submethod to retrieve and parse data.
         """
         logger.info("Checking Parser Cache...")
-        parser_cache = self.cache_manager.get_parser_cache(self.cache_key)
-        if parser_cache is not None:
+        (
+            parser_cache,
+            parser_cache_ttl,
+            is_validated_parser_cache,
+            parser_cache_metadata,
+        ) = await self.cache_manager.get_parser_cache_entry(self.cache_key) or (
+            None,
+            None,
+            False,
+            None,
+        )
+        is_expired_parser_cache = self.cache_manager.is_expired_parser_cache_ttl(
+            parser_cache_ttl
+        )
+        if parser_cache is not None and not is_expired_parser_cache:
             # Parser cache is here
             logger.info("Parser Cache found !")
             self.data = parser_cache
+            self.is_validated_data = is_validated_parser_cache
+            self.parser_cache_metadata = parser_cache_metadata
+
+            # If it's about to expire, refresh it in the background using
+            # another parser, as the data of this one is used by the request
+            if (
+                parser_cache_ttl is not None
+                and 0 <= parser_cache_ttl <= settings.parser_cache_refresh_ahead_limit
+            ):
+                type(self)(**self.cache_kwargs).refresh_in_background()
             return
 
         # No cache is available, it's the first time the user requested the
         # data or the Parser Cache has expired : retrieve and parse data (
         # Blizzard page for API Parser or local file for others parsers)
-        await self.retrieve_and_parse_data()
+        self.data = await self.__retrieve_and_parse_data_or_stale_data(parser_cache)
+        self.parser_cache_metadata = None if self.is_stale_data else self.cache_metadata
 
         # As we updated parser cache from a real API call, store the current
         # date as last_update (used by the Parser Cache expiration system)
         if self.cache_expiration_timeout is not None:
-            self.cache_manager.update_parser_cache_last_update(
+            await self.cache_manager.update_parser_cache_last_update(
                 self.cache_key,
                 self.cache_expiration_timeout,
             )
 
+    async def __retrieve_and_parse_data_or_stale_data(
+        self, stale_data: dict | list | None
+    ) -> dict | list:
+        """Retrieve and parse data. If Blizzard is unavailable or exceeds the
+        latency budget, the expired Parser Cache value is returned instead if
+        there is any, and the retrieval continues in the background. It's then
+        directly returned for a while, without trying to retrieve data again.
+        """
+        if stale_data is not None and self.postponed_retrievals.get(self.cache_key):
+            logger.warning("Blizzard recently failed, using stale Parser Cache...")
+            return self.__use_stale_data(stale_data)
+
+        retrieval = self.__get_coalesced_retrieval()
+
+        # The task is shielded, a cancelled request (client disconnected for
+        # example) or the latency budget mustn't cancel the retrieval
+        try:
+            return await asyncio.wait_for(
+                asyncio.shield(retrieval),
+                timeout=settings.parser_cache_stale_latency_budget,
+            )
+        except TimeoutError:
+            if stale_data is None:
+                return await asyncio.shield(retrieval)
+            logger.warning("Blizzard is too slow, using stale Parser Cache...")
+        except HTTPException:
+            if stale_data is None:
+                raise
+            logger.warning("Blizzard is unavailable, using stale Parser Cache...")
+
+        self.postponed_retrievals.set(
+            self.cache_key, True, settings.parser_cache_stale_retry_delay
+        )
+        return self.__use_stale_data(stale_data)
+
+    def __use_stale_data(self, stale_data: dict | list) -> dict | list:
+        self.is_stale_data = True
+        self.is_validated_data = False
+        return stale_data
+
+    async def refresh(self) -> None:
+        """Retrieve and parse data in order to refresh the Parser Cache, unless
+        another process is already doing it (holding the Parser Cache lock)
+        """
+        is_lock_acquired = await self.cache_manager.acquire_parser_cache_lock(
+            self.cache_key,
+        )
+        if is_lock_acquired is False:
+            logger.info("Parser Cache is already being refreshed by another process")
+            return
+
+        try:
+            await self.retrieve_and_parse_data()
+        finally:
+            if is_lock_acquired:
+                await self.cache_manager.release_parser_cache_lock(self.cache_key)
+
+    def refresh_in_background(self) -> None:
+        """Retrieve and parse data in the background, in order to refresh the
+        Parser Cache. Nothing is done if a retrieval is already running.
+        """
+        if self.cache_key in self.running_retrievals:
+            return
+
+        logger.info("Refreshing Parser Cache in background...")
+        self.__get_coalesced_retrieval()
+
+    def __get_coalesced_retrieval(self) -> asyncio.Task:
+        """Retrieve and parse data only once for concurrent parsers sharing the
+        same cache key (single-flight). In the process, the first parser runs the
+        retrieval in a task, and the next ones are waiting for its result.
+        """
+        retrieval = self.running_retrievals.get(self.cache_key)
+        if retrieval is None:
+            retrieval = asyncio.create_task(self.__locked_retrieve_and_parse_data())
+            self.running_retrievals[self.cache_key] = retrieval
+            retrieval.add_done_callback(self.__remove_running_retrieval)
+        else:
+            logger.info("Waiting for data retrieved by another request...")
+        return retrieval
+
+    def __remove_running_retrieval(self, retrieval: asyncio.Task) -> None:
+        if self.running_retrievals.get(self.cache_key) is retrieval:
+            del self.running_retrievals[self.cache_key]
+
+        # The retrieval may have been continued in the background without anyone
+        # waiting for its result : mark its error as retrieved, Blizzard errors
+        # are already logged when they occur.
+        if not retrieval.cancelled():
+            retrieval.exception()
+
+    async def __locked_retrieve_and_parse_data(self) -> dict | list:
+        """Across processes, only the one holding the Parser Cache lock retrieves
+        and parses data. The others are waiting for it to be stored in Parser Cache,
+        and only do it themselves if it failed.
+        """
+        is_lock_acquired = await self.cache_manager.acquire_parser_cache_lock(
+            self.cache_key,
+        )
+        if is_lock_acquired is False:
+            logger.info("Waiting for data retrieved by another process...")
+            parser_cache = await self.cache_manager.wait_for_parser_cache(
+                self.cache_key,
+            )
+            if parser_cache is not None:
+                return parser_cache
+
+        try:
+            await self.retrieve_and_parse_data()
+        finally:
+            if is_lock_acquired:
+                await self.cache_manager.release_parser_cache_lock(self.cache_key)
+
+        return self.data
+
+    def get_validation_filters(self) -> list[tuple[Any, dict, dict]]:
+        """Pydantic model, query kwargs and serialization options of each filtered
+        view which can be derived from the parsed data. Options are the ones of
+        the route serving the view, and exclude the fields added by the request
+        handler. Data without any view to validate is never considered as
+        validated. This method should be redefined in child classes if needed.
+        """
+        return []
+
+    def get_validation_views(self) -> Iterator[tuple[Any, dict | list, dict]]:
+        """Pydantic model, data and serialization options of each filtered view"""
+        for model, filters, dump_options in self.get_validation_filters():
+            yield model, self.filter_request_using_query(**filters), dump_options
+
+    def validate_data(self) -> None:
+        """Validate every filtered view of the parsed data once, before storing
+        it in Parser Cache, instead of on every request using it. Views must be
+        valid, and unchanged by the validation and serialization of their route.
+        Otherwise, the data isn't marked as validated (the developer is notified
+        in case of error), and it will be validated on every request.
+        """
+        self.is_validated_data = False
+        try:
+            views = list(self.get_validation_views())
+            for model, view, dump_options in views:
+                type_adapter = get_type_adapter(model)
+                serialized_view = type_adapter.dump_python(
+                    type_adapter.validate_python(view),
+                    mode="json",
+                    by_alias=True,
+                    **dump_options,
+                )
+                if serialized_view != view:
+                    logger.warning(
+                        "Data of {} is modified by its validation, it won't be "
+                        "marked as validated",
+                        self.cache_key,
+                    )
+                    return
+        except ValidationError as error:
+            overfast_internal_error(self.cache_key, error)
+            return
+
+        self.is_validated_data = bool(views)
+
     def filter_request_using_query(self, **_) -> dict | list:
         """If the route contains subroutes accessible using GET queries, this method
         will filter data using the query data. This method should be
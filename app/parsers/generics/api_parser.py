@@ -1,15 +1,18 @@
 """Abstract API Parser module"""
 
+import hashlib
 from abc import abstractmethod
 from functools import cached_property
 from typing import ClassVar
 
+import httpx
 from bs4 import BeautifulSoup
 from fastapi import status
 
 from app.common.enums import Locale
-from app.common.exceptions import ParserParsingError
+from app.common.exceptions import ParserBlizzardError, ParserParsingError
 from app.common.helpers import blizzard_response_error_from_request, overfast_request
+from app.common.logging import logger
 from app.config import settings
 
 from .abstract_parser import AbstractParser
@@ -23,6 +26,12 @@ class APIParser(AbstractParser):
     # List of valid HTTP codes when retrieving Blizzard pages
     valid_http_codes: ClassVar[list] = [status.HTTP_200_OK]
 
+    cache_kwargs_keys: ClassVar[tuple[str, ...]] = ("locale",)
+
+    # Timeout used for storing "not found" Parser Cache entries when the Blizzard
+    # page doesn't exist. None if they're not stored for this specific parser.
+    not_found_cache_timeout: int | None = None
+
     def __init__(self, **kwargs):
         self.blizzard_url = self.get_blizzard_url(**kwargs)
         super().__init__(**kwargs)
@@ -51,23 +60,121 @@ class APIParser(AbstractParser):
         """Method used to retrieve data from Blizzard (HTML data), parsing it
         and storing it into self.data attribute.
         """
-        req = await overfast_request(self.blizzard_url)
+        # The page is known to be missing, no need to request it again
+        if self.not_found_cache_timeout and (
+            not_found_message := await self.cache_manager.get_parser_cache_not_found(
+                self.cache_key
+            )
+        ):
+            raise ParserBlizzardError(
+                status_code=status.HTTP_404_NOT_FOUND,
+                message=not_found_message,
+            )
+
+        keys_metadata = await self.cache_manager.get_parser_cache_metadata(
+            [self.cache_key],
+        )
+        metadata = (keys_metadata or {}).get(self.cache_key) or {}
+
+        # If the page didn't change since the last parsing (conditional request
+        # using stored validators, or same content hash), we just extend the
+        # Parser Cache expiration instead of downloading or parsing it again
+        req = await overfast_request(
+            self.blizzard_url, self.__get_conditional_headers(metadata)
+        )
+        if req.status_code == status.HTTP_304_NOT_MODIFIED:
+            if await self.__extend_parser_cache(metadata):
+                return
+
+            # Nothing to extend anymore, we need the whole page
+            req = await overfast_request(self.blizzard_url)
+
         if req.status_code not in self.valid_http_codes:
             raise blizzard_response_error_from_request(req)
 
+        content_hash = hashlib.md5(
+            req.text.encode("utf-8"), usedforsecurity=False
+        ).hexdigest()
+        if metadata.get("hash") == content_hash and await self.__extend_parser_cache(
+            metadata
+        ):
+            return
+
         # Initialize BeautifulSoup object
         self.root_tag = BeautifulSoup(req.text, "lxml").body.find(
             **self.root_tag_params,
         )
 
-        # Parse retrieved HTML data
+        # Parse retrieved HTML data. If the page doesn't exist, it's remembered
+        # for a while in order to avoid requesting it again.
         try:
             self.data = self.parse_data()
+        except ParserBlizzardError as error:
+            if (
+                error.status_code == status.HTTP_404_NOT_FOUND
+                and self.not_found_cache_timeout
+            ):
+                await self.cache_manager.update_parser_cache_not_found(
+                    self.cache_key, error.message, self.not_found_cache_timeout
+                )
+            raise
         except (AttributeError, KeyError, IndexError, TypeError) as error:
             raise ParserParsingError(repr(error)) from error
 
-        # Update the Parser Cache
-        self.cache_manager.update_parser_cache(self.cache_key, self.data, self.timeout)
+        # Validate the data once, and update the Parser Cache with the page
+        # hash and validators
+        self.validate_data()
+        await self.cache_manager.update_parser_cache(
+            self.cache_key,
+            self.data,
+            self.timeout,
+            {
+                **self.cache_metadata,
+                "hash": content_hash,
+                **self.__get_response_validators(req),
+            },
+        )
+
+    async def __extend_parser_cache(self, metadata: dict) -> bool:
+        """Extend the Parser Cache of the unchanged page, and use it as data. It
+        has already been validated if it was the case when it was stored.
+        """
+        parser_cache = await self.cache_manager.extend_parser_cache(
+            self.cache_key, self.timeout
+        )
+        if parser_cache is None:
+            return False
+
+        logger.info("Blizzard page didn't change, Parser Cache extended")
+        self.data = parser_cache
+        self.is_validated_data = metadata.get("validated", False)
+        return True
+
+    @staticmethod
+    def __get_conditional_headers(metadata: dict) -> dict:
+        """Headers used for a conditional request, using the validators
+        of the page retrieved when the Parser Cache was last stored
+        """
+        return {
+            header: metadata[key]
+            for key, header in (
+                ("etag", "If-None-Match"),
+                ("last_modified", "If-Modified-Since"),
+            )
+            if metadata.get(key)
+        }
+
+    @staticmethod
+    def __get_response_validators(req: httpx.Response) -> dict:
+        """Validators of the page, used for the next conditional requests"""
+        return {
+            key: value
+            for key, header in (
+                ("etag", "ETag"),
+                ("last_modified", "Last-Modified"),
+            )
+            if (value := req.headers.get(header))
+        }
 
     @abstractmethod
     def parse_data(self) -> dict | list[dict]:
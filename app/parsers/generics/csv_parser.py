@@ -31,8 +31,11 @@ class CSVParser(AbstractParser):
         # Parse the data
         self.data = self.parse_data()
 
-        # Update the Parser Cache
-        self.cache_manager.update_parser_cache(self.cache_key, self.data, self.timeout)
+        # Validate the data once, and update the Parser Cache
+        self.validate_data()
+        await self.cache_manager.update_parser_cache(
+            self.cache_key, self.data, self.timeout, self.cache_metadata
+        )
 
     @abstractmethod
     def parse_data(self) -> dict | list[dict]:
@@ -1,6 +1,6 @@
 """Hero page Parser module"""
 
-from typing import ClassVar
+from typing import Any, ClassVar
 
 from bs4 import Tag
 from fastapi import status
@@ -8,6 +8,7 @@ from fastapi import status
 from app.common.enums import MediaType
 from app.common.exceptions import ParserBlizzardError
 from app.config import settings
+from app.models.heroes import Hero
 
 from .generics.api_parser import APIParser
 from .helpers import get_birthday_and_age, get_full_url, get_role_from_icon_url
@@ -22,6 +23,7 @@ class HeroParser(APIParser):
         200,  # Classic response
         404,  # Hero Not Found response, we want to handle it here
     ]
+    cache_kwargs_keys: ClassVar[tuple[str, ...]] = ("locale", "hero_key")
 
     def get_blizzard_url(self, **kwargs) -> str:
         return f"{super().get_blizzard_url(**kwargs)}/{kwargs.get('hero_key')}"
@@ -49,6 +51,10 @@ class HeroParser(APIParser):
             "story": self.__get_story(lore_section),
         }
 
+    def get_validation_filters(self) -> list[tuple[Any, dict, dict]]:
+        # Portrait and hitpoints are added by the request handler
+        return [(Hero, {}, {"exclude": {"portrait", "hitpoints"}})]
+
     @staticmethod
     def __get_summary(overview_section: Tag) -> dict:
         header_section = overview_section.find("blz-header")
@@ -1,6 +1,10 @@
 """Heroes page Parser module"""
 
+from typing import Any
+
+from app.common.enums import Role
 from app.config import settings
+from app.models.heroes import HeroShort
 
 from .generics.api_parser import APIParser
 
@@ -27,6 +31,9 @@ class HeroesParser(APIParser):
             key=lambda hero: hero["key"],
         )
 
+    def get_validation_filters(self) -> list[tuple[Any, dict, dict]]:
+        return [(list[HeroShort], {"role": role}, {}) for role in [None, *Role]]
+
     def filter_request_using_query(self, **kwargs) -> list[dict]:
         role = kwargs.get("role")
         return (
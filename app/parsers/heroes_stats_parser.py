@@ -1,6 +1,8 @@
 """Heroes Stats Parser module"""
 
-from typing import ClassVar
+from typing import Any, ClassVar
+
+from app.models.heroes import HitPoints
 
 from .generics.csv_parser import CSVParser
 
@@ -17,6 +19,9 @@ class HeroesStatsParser(CSVParser):
             for hero_stats in self.csv_data
         }
 
+    def get_validation_filters(self) -> list[tuple[Any, dict, dict]]:
+        return [(dict[str, dict[str, HitPoints]], {}, {})]
+
     def __get_hitpoints(self, hero_stats: dict) -> dict:
         hitpoints = {hp_key: int(hero_stats[hp_key]) for hp_key in self.hitpoints_keys}
         hitpoints["total"] = sum(hitpoints.values())
@@ -1,5 +1,10 @@
 """Maps Parser module"""
 
+from typing import Any
+
+from app.common.enums import MapGamemode
+from app.models.maps import Map
+
 from .generics.csv_parser import CSVParser
 
 
@@ -20,6 +25,11 @@ class MapsParser(CSVParser):
             for map_dict in self.csv_data
         ]
 
+    def get_validation_filters(self) -> list[tuple[Any, dict, dict]]:
+        return [
+            (list[Map], {"gamemode": gamemode}, {}) for gamemode in [None, *MapGamemode]
+        ]
+
     def filter_request_using_query(self, **kwargs) -> list:
         gamemode = kwargs.get("gamemode")
         return (
@@ -1,8 +1,9 @@
 """Player stats summary Parser module"""
 
-from fastapi import status
+from typing import Any
 
-from app.common.exceptions import ParserBlizzardError
+from app.common.enums import PlayerGamemode, PlayerPlatform
+from app.models.players import PlayerCareerStats
 
 from .player_parser import PlayerParser
 
@@ -13,18 +14,21 @@ class PlayerCareerParser(PlayerParser):
     def filter_request_using_query(self, **kwargs) -> dict:
         return self._filter_stats(**kwargs) if self.data else {}
 
-    def parse_data(self) -> dict | None:
-        # We must check if we have the expected section for profile. If not,
-        # it means the player doesn't exist or hasn't been found.
-        if not self.root_tag.find("blz-section", class_="Profile-masthead"):
-            raise ParserBlizzardError(
-                status_code=status.HTTP_404_NOT_FOUND,
-                message="Player not found",
+    def get_validation_filters(self) -> list[tuple[Any, dict, dict]]:
+        return [
+            (
+                PlayerCareerStats,
+                {"platform": platform, "gamemode": gamemode},
+                {"exclude_unset": True},
             )
+            for platform in PlayerPlatform
+            for gamemode in PlayerGamemode
+        ]
 
+    def compute_career_page_data(self, career_page: dict) -> dict | None:
         # Only return heroes stats, which will be used for calculation
         # depending on the parameters
-        return self.__get_career_stats(self.get_stats())
+        return self.__get_career_stats(career_page["stats"])
 
     def __get_career_stats(self, raw_stats: dict | None) -> dict | None:
         if not raw_stats:
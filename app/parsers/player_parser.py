@@ -1,6 +1,8 @@
 """Player profile page Parser module"""
 
-from typing import ClassVar
+from collections.abc import Iterator
+from functools import cached_property
+from typing import Any, ClassVar
 
 from bs4 import Tag
 from fastapi import status
@@ -14,6 +16,7 @@ from app.common.enums import (
 from app.common.exceptions import ParserBlizzardError
 from app.common.helpers import get_player_title
 from app.config import settings
+from app.models.players import CareerStats, PlayerSummary
 
 from .generics.api_parser import APIParser
 from .helpers import (
@@ -40,7 +43,10 @@ gamemodes_div_mapping = {
 
 
 class PlayerParser(APIParser):
-    """Overwatch player profile page Parser class"""
+    """Overwatch player profile page Parser class. The parsed career page
+    (summary and stats) is shared by every player parser, which are only
+    computing their own data from it.
+    """
 
     root_path = settings.career_path
     timeout = settings.career_path_cache_timeout
@@ -48,15 +54,114 @@ class PlayerParser(APIParser):
         200,  # Classic response
         404,  # Player Not Found response, we want to handle it here
     ]
-    cache_expiration_timeout = settings.career_parser_cache_expiration_timeout
+    not_found_cache_timeout = settings.player_not_found_parser_cache_timeout
+    cache_kwargs_keys: ClassVar[tuple[str, ...]] = ("locale", "player_id")
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.player_id = kwargs.get("player_id")
 
+        # Whether the career page is speculatively retrieved, before any user
+        # requested it
+        self.is_prefetch = False
+
+    @property
+    def cache_expiration_timeout(self) -> int:
+        """Prefetched career pages are kept for a short time, unless a user
+        requests them afterwards
+        """
+        return (
+            settings.career_prefetch_expiration_timeout
+            if self.is_prefetch
+            else settings.career_parser_cache_expiration_timeout
+        )
+
+    @property
+    def cache_metadata(self) -> dict:
+        """Prefetched career pages are flagged in their metadata, in order to
+        recognize them when a user requests them for the first time
+        """
+        metadata = super().cache_metadata
+        if self.is_prefetch:
+            metadata["prefetched"] = True
+        return metadata
+
     def get_blizzard_url(self, **kwargs) -> str:
         return f"{super().get_blizzard_url(**kwargs)}/{kwargs.get('player_id')}/"
 
+    @cached_property
+    def cache_key(self) -> str:
+        """The same career page Parser Cache is used by every player parser,
+        so the Blizzard page is only retrieved and parsed once for a player.
+        """
+        return f"{PlayerParser.__name__}-{self.blizzard_url}"
+
+    async def parse(self) -> None:
+        await super().parse()
+
+        # First user request of a prefetched career page : its Parser Cache is
+        # now kept like the one of any other requested page
+        if (
+            not self.is_prefetch
+            and self.parser_cache_metadata
+            and self.parser_cache_metadata.get("prefetched")
+        ):
+            await self.cache_manager.update_parser_cache_last_update(
+                self.cache_key,
+                self.cache_expiration_timeout,
+                {**self.parser_cache_metadata, "prefetched": False},
+            )
+
+        self.data = self.compute_career_page_data(self.data)
+
+    async def retrieve_and_parse_data(self) -> None:
+        """Keep the Bloom filters of missing and existing players up-to-date
+        depending on the result of the career page retrieval
+        """
+        try:
+            await super().retrieve_and_parse_data()
+        except ParserBlizzardError as error:
+            if error.status_code == status.HTTP_404_NOT_FOUND:
+                self.cache_manager.players_missing_filter.add([self.player_id])
+            raise
+
+        # Values can't be removed from Bloom filters : if the player was missing,
+        # being in the one of existing players is enough
+        self.cache_manager.players_existing_filter.add([self.player_id])
+
+    def compute_career_page_data(self, career_page: dict) -> dict | None:
+        """Compute the data of the parser from the parsed career page, containing
+        the player summary and stats. The default is the career page itself.
+        """
+        return career_page
+
+    def get_validation_filters(self) -> list[tuple[Any, dict, dict]]:
+        # Namecard is added to the summary by the request handler, and the whole
+        # player data isn't validated here as the Player model adds career stats
+        # of every hero, the request handler doesn't use validated data for it.
+        return [
+            (PlayerSummary, {"summary": True}, {"exclude": {"namecard"}}),
+            *(
+                (
+                    CareerStats,
+                    {"stats": True, "platform": platform, "gamemode": gamemode},
+                    {"exclude_unset": True},
+                )
+                for platform in PlayerPlatform
+                for gamemode in PlayerGamemode
+            ),
+        ]
+
+    def get_validation_views(self) -> Iterator[tuple[Any, dict | list, dict]]:
+        """The career page Parser Cache is shared by every player parser, so the
+        filtered views of each one of them are validated.
+        """
+        for parser_class in (PlayerParser, *PlayerParser.__subclasses__()):
+            parser = parser_class(**self.cache_kwargs)
+            parser.data = parser.compute_career_page_data(self.data)
+            for model, filters, dump_options in parser.get_validation_filters():
+                yield model, parser.filter_request_using_query(**filters), dump_options
+
     def filter_request_using_query(self, **kwargs) -> dict:
         if kwargs.get("summary"):
             return self.data.get("summary")
@@ -2,12 +2,10 @@
 
 from collections import defaultdict
 from copy import deepcopy
-from typing import ClassVar
-
-from fastapi import status
+from typing import Any, ClassVar
 
 from app.common.enums import HeroKey, PlayerGamemode, PlayerPlatform, Role
-from app.common.exceptions import ParserBlizzardError
+from app.models.players import PlayerStatsSummary
 
 from .helpers import get_hero_role, get_plural_stat_key
 from .player_parser import PlayerParser
@@ -71,18 +69,21 @@ class PlayerStatsSummaryParser(PlayerParser):
             "heroes": heroes_stats,
         }
 
-    def parse_data(self) -> dict | None:
-        # We must check if we have the expected section for profile. If not,
-        # it means the player doesn't exist or hasn't been found.
-        if not self.root_tag.find("blz-section", class_="Profile-masthead"):
-            raise ParserBlizzardError(
-                status_code=status.HTTP_404_NOT_FOUND,
-                message="Player not found",
+    def get_validation_filters(self) -> list[tuple[Any, dict, dict]]:
+        return [
+            (
+                PlayerStatsSummary,
+                {"gamemode": gamemode, "platform": platform},
+                {"exclude_unset": True},
             )
+            for gamemode in [None, *PlayerGamemode]
+            for platform in [None, *PlayerPlatform]
+        ]
 
+    def compute_career_page_data(self, career_page: dict) -> dict | None:
         # Only return heroes stats, which will be used for calculation
         # depending on the parameters
-        return self.__get_heroes_stats(self.get_stats())
+        return self.__get_heroes_stats(career_page["stats"])
 
     def __compute_heroes_data(
         self,
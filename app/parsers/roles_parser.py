@@ -1,6 +1,9 @@
 """Roles Parser module"""
 
+from typing import Any
+
 from app.config import settings
+from app.models.heroes import RoleDetail
 
 from .generics.api_parser import APIParser
 from .helpers import get_role_from_icon_url
@@ -39,3 +42,6 @@ class RolesParser(APIParser):
                 enumerate(roles_container.find_all("blz-feature")),
             )[:3]
         ]
+
+    def get_validation_filters(self) -> list[tuple[Any, dict, dict]]:
+        return [(list[RoleDetail], {}, {})]
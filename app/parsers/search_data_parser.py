@@ -1,11 +1,18 @@
 """Search Data Parser module"""
 
+import asyncio
 from abc import ABC, abstractmethod
+from collections.abc import Iterable
+from typing import Any, ClassVar
 
-from app.commands.update_search_data_cache import retrieve_search_data
+from pydantic import HttpUrl
+
+from app.commands.update_search_data_cache import retrieve_all_search_data
+from app.common.cache_manager import CacheManager
 from app.common.enums import SearchDataType
 from app.common.exceptions import ParserParsingError, SearchDataRetrievalError
 from app.common.helpers import blizzard_response_error_from_request, overfast_request
+from app.common.local_cache import LocalCache
 from app.common.logging import logger
 from app.config import settings
 
@@ -18,6 +25,7 @@ class SearchDataParser(APIParser, ABC):
     root_path = settings.search_account_path
     timeout = settings.career_path_cache_timeout
     cache_expiration_timeout = settings.career_parser_cache_expiration_timeout
+    cache_kwargs_keys: ClassVar[tuple[str, ...]] = ("locale", "player_id")
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -28,6 +36,27 @@ class SearchDataParser(APIParser, ABC):
     def data_type(self) -> SearchDataType:
         """Data for which the Parser is implemented (namecard, title, etc.)"""
 
+    async def parse(self) -> None:
+        """Parser Cache values seeded from search results don't have any metadata.
+        Once used by a request, they're stored again as regular values, so they're
+        refreshed and expire like the ones retrieved by the parser.
+        """
+        await super().parse()
+        if (
+            self.data is None
+            or self.is_stale_data
+            or self.parser_cache_metadata is not None
+        ):
+            return
+
+        self.validate_data()
+        await self.cache_manager.update_parser_cache(
+            self.cache_key, self.data, self.timeout, self.cache_metadata
+        )
+        await self.cache_manager.update_parser_cache_last_update(
+            self.cache_key, self.cache_expiration_timeout
+        )
+
     async def retrieve_and_parse_data(self) -> None:
         """Method used to retrieve data from Blizzard (JSON data), parsing it
         and storing it into self.data attribute.
@@ -40,14 +69,17 @@ class SearchDataParser(APIParser, ABC):
 
         # Parse retrieved HTML data
         try:
-            self.data = self.parse_data()
+            self.data = await self.parse_data()
         except KeyError as error:
             raise ParserParsingError(repr(error)) from error
 
-        # Update the Parser Cache
-        self.cache_manager.update_parser_cache(self.cache_key, self.data, self.timeout)
+        # Validate the data once, and update the Parser Cache
+        self.validate_data()
+        await self.cache_manager.update_parser_cache(
+            self.cache_key, self.data, self.timeout, self.cache_metadata
+        )
 
-    def parse_data(self) -> dict:
+    async def parse_data(self) -> dict:
         # We'll use the battletag for searching
         player_battletag = self.player_id.replace("-", "#")
 
@@ -68,54 +100,26 @@ class SearchDataParser(APIParser, ABC):
             return {self.data_type: None}
 
         # Once we found the player, retrieve the data url
-        data_value = self.retrieve_data_value(player_data)
+        data_value = await self.retrieve_data_value(player_data)
         return {self.data_type: data_value}
 
+    def get_validation_filters(self) -> list[tuple[Any, dict, dict]]:
+        value_type = str if self.data_type == SearchDataType.TITLE else HttpUrl
+        return [(dict[str, value_type | None], {}, {})]
+
     def get_blizzard_url(self, **kwargs) -> str:
         player_battletag = kwargs.get("player_id").replace("-", "#")
         return f"{super().get_blizzard_url(**kwargs)}/{player_battletag}"
 
-    def retrieve_data_value(self, player_data: dict) -> str | None:
+    async def retrieve_data_value(self, player_data: dict) -> str | None:
         # If the player doesn't have any related data, directly return nothing here
-        if (
-            self.data_type not in player_data
-            or player_data[self.data_type] == "0x0000000000000000"
-        ):
+        if not SearchDataResolver.has_data_value(player_data, self.data_type):
             logger.info("Player {} doesn't have any {}", self.player_id, self.data_type)
             return None
 
-        # Retrieve the possible matching value in the cache. If not in
-        # cache (or Redis disabled), try to retrieve it directly.
-        data_value = self.cache_manager.get_search_data_cache(
-            self.data_type, player_data[self.data_type]
-        )
-        if not data_value:
-            logger.warning(
-                "URL for {} {} of player {} not found in the cache",
-                self.data_type,
-                player_data[self.data_type],
-                self.player_id,
-            )
-
-            try:
-                data_list = retrieve_search_data(self.data_type)
-            except SearchDataRetrievalError:
-                data_list = {}
-
-            data_value = data_list.get(player_data[self.data_type])
-
-        # If we still didn't retrieve the URL, it means the player doesn't
-        # have one, or we had an issue, log it and return None
-        if not data_value:
-            logger.warning(
-                "URL for {} {} of player {} not found at all",
-                self.data_type,
-                player_data[self.data_type],
-                self.player_id,
-            )
-            return None
-
-        return data_value
+        resolver = SearchDataResolver()
+        await resolver.resolve([player_data], [self.data_type])
+        return resolver.get_data_value(player_data, self.data_type)
 
 
 class NamecardParser(SearchDataParser):
@@ -134,3 +138,111 @@ class TitleParser(SearchDataParser):
     """Title Parser class"""
 
     data_type = SearchDataType.TITLE
+
+
+class SearchDataResolver:
+    """Resolver of the search data values (portraits, namecards and titles) of
+    every player in a search result. Values are retrieved from the in-process
+    search data, and memoized for the lifetime of the resolver (a user request).
+
+    Values missing from the search data trigger a refresh of it, which is
+    only made once at a time in the process, whatever the number of resolvers
+    waiting for it. Values still missing after a successful refresh are
+    remembered for a while, in order to avoid refreshing it again and again
+    for them.
+    """
+
+    cache_manager = CacheManager()
+
+    # Refresh of the search data currently running in the process
+    running_refresh: ClassVar[asyncio.Task | None] = None
+
+    # Search data values which couldn't be found even after a refresh
+    unknown_values = LocalCache(max_size=settings.search_data_unknown_values_max_size)
+
+    def __init__(self):
+        self.values: dict[tuple[SearchDataType, str], str | None] = {}
+
+    async def resolve(
+        self,
+        players: Iterable[dict],
+        data_types: Iterable[SearchDataType] = tuple(SearchDataType),
+    ) -> None:
+        """Resolve the search data values of the given players, except the ones
+        which have already been resolved
+        """
+        data_keys = {
+            (data_type, player[data_type])
+            for player in players
+            for data_type in data_types
+            if self.has_data_value(player, data_type)
+        }
+
+        missing_data_keys = []
+        for data_type, data_key in data_keys - self.values.keys():
+            data_value = await self.cache_manager.get_search_data_cache(
+                data_type, data_key
+            )
+            if data_value or self.unknown_values.get(f"{data_type}:{data_key}"):
+                self.values[(data_type, data_key)] = data_value
+            else:
+                logger.warning(
+                    "URL for {} {} not found in the cache", data_type, data_key
+                )
+                missing_data_keys.append((data_type, data_key))
+
+        if not missing_data_keys:
+            return
+
+        # If not in cache (or Redis disabled), retrieve it from Blizzard. Values
+        # are only remembered as unknown if Blizzard data has been retrieved.
+        search_data = await self.refresh_search_data()
+        for data_type, data_key in missing_data_keys:
+            data_value = search_data.get(data_type, {}).get(data_key)
+            if not data_value:
+                logger.warning("URL for {} {} not found at all", data_type, data_key)
+            if not data_value and search_data:
+                self.unknown_values.set(
+                    f"{data_type}:{data_key}",
+                    True,
+                    settings.search_data_unknown_value_timeout,
+                )
+
+            self.values[(data_type, data_key)] = data_value
+
+    def get_data_value(self, player: dict, data_type: SearchDataType) -> str | None:
+        """Get the resolved search data value of a player"""
+        if not self.has_data_value(player, data_type):
+            return None
+        return self.values.get((data_type, player[data_type]))
+
+    @staticmethod
+    def has_data_value(player: dict, data_type: SearchDataType) -> bool:
+        return player.get(data_type, "0x0000000000000000") != "0x0000000000000000"
+
+    @classmethod
+    async def refresh_search_data(cls) -> dict[SearchDataType, dict[str, str]]:
+        """Retrieve search data from Blizzard and update the cache with it. If
+        a refresh is already running in the process, wait for its result instead.
+        An empty dict is returned if the retrieval failed.
+        """
+        if cls.running_refresh is None:
+            cls.running_refresh = asyncio.create_task(cls.__refresh_search_data())
+            cls.running_refresh.add_done_callback(cls.__clear_running_refresh)
+
+        # Shielded, as other resolvers may still be waiting for the refresh
+        return await asyncio.shield(cls.running_refresh)
+
+    @classmethod
+    async def __refresh_search_data(cls) -> dict[SearchDataType, dict[str, str]]:
+        try:
+            search_data = await retrieve_all_search_data()
+        except SearchDataRetrievalError:
+            return {}
+
+        await cls.cache_manager.update_search_data_cache(search_data)
+        return search_data
+
+    @classmethod
+    def __clear_running_refresh(cls, _: asyncio.Task) -> None:
+        cls.running_refresh = None
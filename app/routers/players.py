@@ -1,7 +1,8 @@
 """Players endpoints router : players search, players career, statistics, etc."""
 
-from fastapi import APIRouter, Depends, Path, Query, Request, status
+from fastapi import APIRouter, Depends, HTTPException, Path, Query, Request, status
 
+from app.common.cache_manager import CacheManager
 from app.common.decorators import validation_error_handler
 from app.common.enums import (
     HeroKeyCareerFilter,
@@ -27,6 +28,7 @@ from app.models.players import (
     PlayerStatsSummary,
     PlayerSummary,
 )
+from app.parsers.player_parser import PlayerParser
 
 # Custom route responses for player careers
 career_routes_responses = {
@@ -48,6 +50,14 @@ async def get_player_common_parameters(
         examples=["TeKrop-2217"],
     ),
 ):
+    # Players known to be missing are directly rejected, without any Blizzard call
+    # and without instanciating the handler and its parsers
+    if await CacheManager().is_unknown_player(
+        player_id, PlayerParser(player_id=player_id).cache_key
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Player not found"
+        )
     return {"player_id": player_id}
 
 
@@ -148,7 +158,6 @@ async def get_player_summary(
 
 @router.get(
     "/{player_id}/stats/summary",
-    response_model_exclude_unset=True,
     responses=career_routes_responses,
     tags=[RouteTag.PLAYERS],
     summary="Get player stats summary",
@@ -164,7 +173,7 @@ async def get_player_summary(
     ),
     operation_id="get_player_stats_summary",
 )
-@validation_error_handler(response_model=PlayerStatsSummary)
+@validation_error_handler(response_model=PlayerStatsSummary, exclude_unset=True)
 async def get_player_stats_summary(
     request: Request,
     commons: dict = Depends(get_player_common_parameters),
@@ -196,7 +205,6 @@ async def get_player_stats_summary(
 
 @router.get(
     "/{player_id}/stats/career",
-    response_model_exclude_unset=True,
     responses=career_routes_responses,
     tags=[RouteTag.PLAYERS],
     summary="Get player career stats",
@@ -209,7 +217,7 @@ async def get_player_stats_summary(
     ),
     operation_id="get_player_career_stats",
 )
-@validation_error_handler(response_model=PlayerCareerStats)
+@validation_error_handler(response_model=PlayerCareerStats, exclude_unset=True)
 async def get_player_career_stats(
     request: Request,
     commons: dict = Depends(get_player_career_common_parameters),
@@ -222,7 +230,6 @@ async def get_player_career_stats(
 
 @router.get(
     "/{player_id}/stats",
-    response_model_exclude_unset=True,
     responses=career_routes_responses,
     tags=[RouteTag.PLAYERS],
     summary="Get player stats with labels",
@@ -233,7 +240,7 @@ async def get_player_career_stats(
     ),
     operation_id="get_player_stats",
 )
-@validation_error_handler(response_model=CareerStats)
+@validation_error_handler(response_model=CareerStats, exclude_unset=True)
 async def get_player_stats(
     request: Request,
     commons: dict = Depends(get_player_career_common_parameters),
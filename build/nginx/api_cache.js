@@ -0,0 +1,74 @@
+// Canonical API Cache key of a request : query parameters are sorted by name,
+// enumeration values are lowercased and the ones equal to their default value
+// are removed. Must be kept consistent with the application settings and the
+// CacheManager.get_cache_key_from_request method.
+
+const caseInsensitiveParams = ["gamemode", "hero", "locale", "platform", "role"];
+const defaultParams = {
+  limit: "20",
+  locale: "en-us",
+  offset: "0",
+  order_by: "name:asc",
+};
+
+// Decode a query string component, the same way Python parse_qsl does
+function decode(value) {
+  try {
+    return decodeURIComponent(value.replace(/\+/g, " "));
+  } catch (e) {
+    return value;
+  }
+}
+
+// Encode a query string component, the same way Python urlencode does
+function encode(value) {
+  return encodeURIComponent(value)
+    .replace(/[!'()*]/g, (char) => "%" + char.charCodeAt(0).toString(16).toUpperCase())
+    .replace(/%20/g, "+");
+}
+
+function key(r) {
+  const params = (r.variables.args || "")
+    .split("&")
+    .filter((param) => param)
+    .map((param, index) => {
+      const separatorIndex = param.indexOf("=");
+      const name = decode(separatorIndex === -1 ? param : param.slice(0, separatorIndex));
+      const value = separatorIndex === -1 ? "" : decode(param.slice(separatorIndex + 1));
+      return {
+        name: name,
+        value: caseInsensitiveParams.includes(name) ? value.toLowerCase() : value,
+        index: index,
+      };
+    })
+    .filter((param) => defaultParams[param.name] !== param.value)
+    .sort((a, b) => (a.name < b.name ? -1 : a.name > b.name ? 1 : a.index - b.index));
+
+  const queryString = params
+    .map((param) => encode(param.name) + "=" + encode(param.value))
+    .join("&");
+  return r.uri + (queryString ? "?" + queryString : "");
+}
+
+// Key of the "not found" API Cache, given by the notFound handler subrequest
+function notFoundKey(r) {
+  return decode(r.variables.arg_key || "");
+}
+
+// Serve the known "not found" response of the request with a 404 status, as the
+// Redis module can only serve values with a 200 status. If there is none, the
+// request is forwarded to the application.
+async function notFound(r) {
+  const reply = await r.subrequest("/api-cache-not-found", {
+    args: "key=" + encodeURIComponent(key(r)),
+  });
+  if (reply.status !== 200) {
+    r.internalRedirect("@fallback");
+    return;
+  }
+
+  r.headersOut["Content-Type"] = "application/json";
+  r.return(404, reply.responseText);
+}
+
+export default { key, notFoundKey, notFound };
@@ -21,7 +21,8 @@ def locale():
     return Locale.ENGLISH_US
 
 
-def test_check_and_delete_parser_cache_some_to_delete(
+@pytest.mark.asyncio()
+async def test_check_and_delete_parser_cache_some_to_delete(
     cache_manager: CacheManager,
     locale: str,
 ):
@@ -34,12 +35,12 @@ def test_check_and_delete_parser_cache_some_to_delete(
     # Parser Cache is up-to-date, but it hasn't been retrieved from API
     # call since a long time : we'll delete it
     first_cache_key = f"{cache_key_prefix}/Player-0001"
-    cache_manager.update_parser_cache(
+    await cache_manager.update_parser_cache(
         first_cache_key,
         {},
         settings.expired_cache_refresh_limit + 10,
     )
-    cache_manager.update_parser_cache_last_update(
+    await cache_manager.update_parser_cache_last_update(
         first_cache_key,
         settings.expired_cache_refresh_limit - 10,
     )
@@ -47,12 +48,12 @@ def test_check_and_delete_parser_cache_some_to_delete(
     # Parser Cache is up-to-date and has been recently retrieved from API call,
     # no need to delete it.
     second_cache_key = f"{cache_key_prefix}/Player-0002"
-    cache_manager.update_parser_cache(
+    await cache_manager.update_parser_cache(
         second_cache_key,
         {},
         settings.expired_cache_refresh_limit + 10,
     )
-    cache_manager.update_parser_cache_last_update(
+    await cache_manager.update_parser_cache_last_update(
         second_cache_key,
         settings.expired_cache_refresh_limit + 10,
     )
@@ -60,12 +61,12 @@ def test_check_and_delete_parser_cache_some_to_delete(
     # Parser Cache is outdated and has been recently retrieved from API call,
     # no need to delete it.
     third_cache_key = f"{cache_key_prefix}/Player-0003"
-    cache_manager.update_parser_cache(
+    await cache_manager.update_parser_cache(
         third_cache_key,
         {},
         settings.expired_cache_refresh_limit - 10,
     )
-    cache_manager.update_parser_cache_last_update(
+    await cache_manager.update_parser_cache_last_update(
         third_cache_key,
         settings.expired_cache_refresh_limit + 10,
     )
@@ -73,55 +74,56 @@ def test_check_and_delete_parser_cache_some_to_delete(
     # Parser Cache is outdated and it hasn't been retrieved from API
     # call since a long time : we'll delete it
     fourth_cache_key = f"{cache_key_prefix}/Player-0004"
-    cache_manager.update_parser_cache(
+    await cache_manager.update_parser_cache(
         fourth_cache_key,
         {},
         settings.expired_cache_refresh_limit - 10,
     )
-    cache_manager.update_parser_cache_last_update(
+    await cache_manager.update_parser_cache_last_update(
         fourth_cache_key,
         settings.expired_cache_refresh_limit - 10,
     )
 
     # Only the first and fourth keys should be deleted
-    assert get_soon_expired_cache_keys() == {first_cache_key, fourth_cache_key}
-    assert cache_manager.get_parser_cache(first_cache_key) == {}
-    assert cache_manager.get_parser_cache(second_cache_key) == {}
-    assert cache_manager.get_parser_cache(third_cache_key) == {}
-    assert cache_manager.get_parser_cache(fourth_cache_key) == {}
+    assert await get_soon_expired_cache_keys() == {first_cache_key, fourth_cache_key}
+    assert await cache_manager.get_parser_cache(first_cache_key) == {}
+    assert await cache_manager.get_parser_cache(second_cache_key) == {}
+    assert await cache_manager.get_parser_cache(third_cache_key) == {}
+    assert await cache_manager.get_parser_cache(fourth_cache_key) == {}
 
     # check and delete, we should delete the first player
     logger_info_mock = Mock()
     with patch("app.common.logging.logger.info", logger_info_mock):
-        check_and_delete_parser_cache_main()
+        await check_and_delete_parser_cache_main()
 
     # Check data in db (assert we created API Cache for subroutes)
     logger_info_mock.assert_any_call("Deleting {} keys from Redis...", 2)
 
-    assert get_soon_expired_cache_keys() == set()
-    assert cache_manager.get_parser_cache(first_cache_key) is None
-    assert cache_manager.get_parser_cache(second_cache_key) == {}
-    assert cache_manager.get_parser_cache(third_cache_key) == {}
-    assert cache_manager.get_parser_cache(fourth_cache_key) is None
+    assert await get_soon_expired_cache_keys() == set()
+    assert await cache_manager.get_parser_cache(first_cache_key) is None
+    assert await cache_manager.get_parser_cache(second_cache_key) == {}
+    assert await cache_manager.get_parser_cache(third_cache_key) == {}
+    assert await cache_manager.get_parser_cache(fourth_cache_key) is None
 
 
-def test_check_and_delete_parser_cache_no_cache_to_delete(
+@pytest.mark.asyncio()
+async def test_check_and_delete_parser_cache_no_cache_to_delete(
     cache_manager: CacheManager,
     locale: str,
 ):
     # Add some data which is not expiring
     cache_key = f"PlayerParser-{settings.blizzard_host}/{locale}{settings.career_path}/TeKrop-2217"
-    cache_manager.update_parser_cache(
+    await cache_manager.update_parser_cache(
         cache_key,
         {},
         settings.expired_cache_refresh_limit + 30,
     )
-    cache_manager.update_parser_cache_last_update(
+    await cache_manager.update_parser_cache_last_update(
         cache_key,
         settings.expired_cache_refresh_limit + 30,
     )
 
-    assert get_soon_expired_cache_keys() == set()
+    assert await get_soon_expired_cache_keys() == set()
 
     # check and delete (no delete)
     logger_info_mock = Mock()
@@ -132,7 +134,7 @@ def test_check_and_delete_parser_cache_no_cache_to_delete(
             logger_info_mock,
         ),
     ):
-        check_and_delete_parser_cache_main()
+        await check_and_delete_parser_cache_main()
 
-    assert get_soon_expired_cache_keys() == set()
+    assert await get_soon_expired_cache_keys() == set()
     logger_info_mock.assert_any_call("No Parser key to delete, closing")
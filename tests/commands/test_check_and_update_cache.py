@@ -1,5 +1,5 @@
-import asyncio
 import json
+import time
 from unittest.mock import Mock, patch
 
 import pytest
@@ -12,6 +12,7 @@ from app.common.cache_manager import CacheManager
 from app.common.enums import Locale
 from app.common.helpers import overfast_client
 from app.config import settings
+from app.parsers.player_stats_summary_parser import PlayerStatsSummaryParser
 
 
 @pytest.fixture()
@@ -33,7 +34,8 @@ def _set_no_spread_percentage():
         yield
 
 
-def test_check_and_update_gamemodes_cache_to_update(
+@pytest.mark.asyncio()
+async def test_check_and_update_gamemodes_cache_to_update(
     cache_manager: CacheManager,
     locale: str,
     home_html_data: list,
@@ -42,23 +44,31 @@ def test_check_and_update_gamemodes_cache_to_update(
     gamemodes_cache_key = "GamemodesParser"
 
     # Add some data (to update and not to update)
-    cache_manager.update_parser_cache(
+    await cache_manager.update_parser_cache(
         f"PlayerParser-{settings.blizzard_host}/{locale}{settings.career_path}/TeKrop-2217",
         {},
         settings.expired_cache_refresh_limit + 30,
+        {
+            "parser": "PlayerParser",
+            "kwargs": {"locale": locale, "player_id": "TeKrop-2217"},
+        },
     )
-    cache_manager.update_parser_cache(
+    await cache_manager.update_parser_cache(
         f"HeroParser-{settings.blizzard_host}/{locale}{settings.heroes_path}/ana",
         {},
         settings.expired_cache_refresh_limit + 5,
+        {"parser": "HeroParser", "kwargs": {"locale": locale, "hero_key": "ana"}},
     )
-    cache_manager.update_parser_cache(
+    await cache_manager.update_parser_cache(
         gamemodes_cache_key,
         [],
         settings.expired_cache_refresh_limit - 5,
+        {"parser": "GamemodesParser", "kwargs": {}},
     )
 
-    assert get_soon_expired_cache_keys() == {gamemodes_cache_key}
+    # Values are only refreshed if they've been read recently
+    await cache_manager.get_parser_cache(gamemodes_cache_key)
+    assert await get_soon_expired_cache_keys() == {gamemodes_cache_key}
 
     # check and update (only gamemodes should be updated)
     logger_info_mock = Mock()
@@ -66,17 +76,21 @@ def test_check_and_update_gamemodes_cache_to_update(
         patch.object(
             overfast_client,
             "get",
-            return_value=Mock(status_code=status.HTTP_200_OK, text=home_html_data),
+            return_value=Mock(
+                status_code=status.HTTP_200_OK, text=home_html_data, headers={}
+            ),
         ),
         patch("app.common.logging.logger.info", logger_info_mock),
     ):
-        asyncio.run(check_and_update_cache_main())
+        await check_and_update_cache_main()
 
     # Check data in db (assert we created API Cache for subroutes)
     logger_info_mock.assert_any_call("Done ! Retrieved keys : {}", 1)
     logger_info_mock.assert_any_call("Updating data for {} key...", gamemodes_cache_key)
 
-    assert cache_manager.get_parser_cache(gamemodes_cache_key) == gamemodes_json_data
+    assert (
+        await cache_manager.get_parser_cache(gamemodes_cache_key) == gamemodes_json_data
+    )
 
 
 @pytest.mark.parametrize(
@@ -84,7 +98,8 @@ def test_check_and_update_gamemodes_cache_to_update(
     [("ana", "ana")],
     indirect=["hero_html_data", "hero_json_data"],
 )
-def test_check_and_update_specific_hero_to_update(
+@pytest.mark.asyncio()
+async def test_check_and_update_specific_hero_to_update(
     cache_manager: CacheManager,
     locale: str,
     hero_html_data: str,
@@ -95,15 +110,16 @@ def test_check_and_update_specific_hero_to_update(
     )
 
     # Add some data (to update and not to update)
-    cache_manager.update_parser_cache(
+    await cache_manager.update_parser_cache(
         ana_cache_key,
         {},
         settings.expired_cache_refresh_limit - 5,
+        {"parser": "HeroParser", "kwargs": {"locale": locale, "hero_key": "ana"}},
     )
 
     # Check data in db (assert no Parser Cache data)
-    assert cache_manager.get_parser_cache(ana_cache_key) == {}
-    assert get_soon_expired_cache_keys() == {ana_cache_key}
+    assert await cache_manager.get_parser_cache(ana_cache_key) == {}
+    assert await get_soon_expired_cache_keys() == {ana_cache_key}
 
     # check and update (only maps should be updated)
     logger_info_mock = Mock()
@@ -111,11 +127,13 @@ def test_check_and_update_specific_hero_to_update(
         patch.object(
             overfast_client,
             "get",
-            return_value=Mock(status_code=status.HTTP_200_OK, text=hero_html_data),
+            return_value=Mock(
+                status_code=status.HTTP_200_OK, text=hero_html_data, headers={}
+            ),
         ),
         patch("app.common.logging.logger.info", logger_info_mock),
     ):
-        asyncio.run(check_and_update_cache_main())
+        await check_and_update_cache_main()
 
     # Check data in db (assert we created API Cache for subroutes)
     logger_info_mock.assert_any_call("Done ! Retrieved keys : {}", 1)
@@ -126,62 +144,95 @@ def test_check_and_update_specific_hero_to_update(
     del hero_data["portrait"]
     del hero_data["hitpoints"]
 
-    assert cache_manager.get_parser_cache(ana_cache_key) == hero_data
+    assert await cache_manager.get_parser_cache(ana_cache_key) == hero_data
 
 
-def test_check_and_update_maps_to_update(
+@pytest.mark.asyncio()
+async def test_check_and_update_maps_to_update(
     cache_manager: CacheManager,
     maps_json_data: dict,
 ):
     cache_key = "MapsParser"
 
     # Add some data (to update and not to update)
-    cache_manager.update_parser_cache(
+    await cache_manager.update_parser_cache(
         cache_key,
         [],
         settings.expired_cache_refresh_limit - 5,
+        {"parser": "MapsParser", "kwargs": {}},
     )
 
     # Check data in db (assert no Parser Cache data)
-    assert cache_manager.get_parser_cache(cache_key) == []
-    assert get_soon_expired_cache_keys() == {cache_key}
+    assert await cache_manager.get_parser_cache(cache_key) == []
+    assert await get_soon_expired_cache_keys() == {cache_key}
 
     # check and update (only maps should be updated)
     logger_info_mock = Mock()
     with patch("app.common.logging.logger.info", logger_info_mock):
-        asyncio.run(check_and_update_cache_main())
+        await check_and_update_cache_main()
 
     # Check data in db (assert we created API Cache for subroutes)
     logger_info_mock.assert_any_call("Done ! Retrieved keys : {}", 1)
     logger_info_mock.assert_any_call("Updating data for {} key...", cache_key)
 
-    assert cache_manager.get_parser_cache(cache_key) == maps_json_data
+    assert await cache_manager.get_parser_cache(cache_key) == maps_json_data
+
+
+@pytest.mark.asyncio()
+async def test_check_and_update_cache_without_metadata(cache_manager: CacheManager):
+    # Parser Cache stored without any metadata can't be refreshed
+    cache_key = "MapsParser"
+    await cache_manager.update_parser_cache(
+        cache_key,
+        [],
+        settings.expired_cache_refresh_limit - 5,
+    )
+    await cache_manager.get_parser_cache(cache_key)
+    assert await get_soon_expired_cache_keys() == {cache_key}
+
+    logger_warning_mock = Mock()
+    with patch("app.common.logging.logger.warning", logger_warning_mock):
+        await check_and_update_cache_main()
+
+    logger_warning_mock.assert_any_call(
+        "No metadata found for {} key, it won't be updated", cache_key
+    )
+    assert await cache_manager.get_parser_cache(cache_key) == []
 
 
-def test_check_and_update_cache_no_update(cache_manager: CacheManager, locale: str):
+@pytest.mark.asyncio()
+async def test_check_and_update_cache_no_update(
+    cache_manager: CacheManager, locale: str
+):
     # Add some data (to update and not to update)
-    cache_manager.update_parser_cache(
+    await cache_manager.update_parser_cache(
         f"PlayerParser-{settings.blizzard_host}/{locale}{settings.career_path}/TeKrop-2217",
         {},
         settings.expired_cache_refresh_limit + 30,
+        {
+            "parser": "PlayerParser",
+            "kwargs": {"locale": locale, "player_id": "TeKrop-2217"},
+        },
     )
-    cache_manager.update_parser_cache(
+    await cache_manager.update_parser_cache(
         f"HeroParser-{settings.blizzard_host}/{locale}{settings.heroes_path}/ana",
         {},
         settings.expired_cache_refresh_limit + 5,
+        {"parser": "HeroParser", "kwargs": {"locale": locale, "hero_key": "ana"}},
     )
-    cache_manager.update_parser_cache(
+    await cache_manager.update_parser_cache(
         "GamemodesParser",
         [],
         settings.expired_cache_refresh_limit + 10,
+        {"parser": "GamemodesParser", "kwargs": {}},
     )
 
-    assert get_soon_expired_cache_keys() == set()
+    assert await get_soon_expired_cache_keys() == set()
 
     # check and update (no update)
     logger_info_mock = Mock()
     with patch("app.common.logging.logger.info", logger_info_mock):
-        asyncio.run(check_and_update_cache_main())
+        await check_and_update_cache_main()
 
     logger_info_mock.assert_any_call("Done ! Retrieved keys : {}", 0)
 
@@ -191,7 +242,8 @@ def test_check_and_update_cache_no_update(cache_manager: CacheManager, locale: s
     [("TeKrop-2217")],
     indirect=["player_html_data"],
 )
-def test_check_and_update_specific_player_to_update(
+@pytest.mark.asyncio()
+async def test_check_and_update_specific_player_to_update(
     cache_manager: CacheManager,
     locale: str,
     player_html_data: str,
@@ -199,25 +251,31 @@ def test_check_and_update_specific_player_to_update(
     player_cache_key = f"PlayerParser-{settings.blizzard_host}/{locale}{settings.career_path}/TeKrop-2217/"
 
     # Add some data (to update and not to update)
-    cache_manager.update_parser_cache(
+    await cache_manager.update_parser_cache(
         player_cache_key,
         {},
         settings.expired_cache_refresh_limit - 5,
+        {
+            "parser": "PlayerParser",
+            "kwargs": {"locale": locale, "player_id": "TeKrop-2217"},
+        },
     )
-    cache_manager.update_parser_cache(
+    await cache_manager.update_parser_cache(
         f"HeroParser-{settings.blizzard_host}/{locale}{settings.heroes_path}/ana",
         {},
         settings.expired_cache_refresh_limit + 5,
+        {"parser": "HeroParser", "kwargs": {"locale": locale, "hero_key": "ana"}},
     )
-    cache_manager.update_parser_cache(
+    await cache_manager.update_parser_cache(
         "GamemodesParser",
         [],
         settings.expired_cache_refresh_limit + 10,
+        {"parser": "GamemodesParser", "kwargs": {}},
     )
 
     # Check data in db (assert no Parser Cache data)
-    assert cache_manager.get_parser_cache(player_cache_key) == {}
-    assert get_soon_expired_cache_keys() == {player_cache_key}
+    assert await cache_manager.get_parser_cache(player_cache_key) == {}
+    assert await get_soon_expired_cache_keys() == {player_cache_key}
 
     # check and update (only maps should be updated)
     logger_info_mock = Mock()
@@ -225,17 +283,19 @@ def test_check_and_update_specific_player_to_update(
         patch.object(
             overfast_client,
             "get",
-            return_value=Mock(status_code=status.HTTP_200_OK, text=player_html_data),
+            return_value=Mock(
+                status_code=status.HTTP_200_OK, text=player_html_data, headers={}
+            ),
         ),
         patch("app.common.logging.logger.info", logger_info_mock),
     ):
-        asyncio.run(check_and_update_cache_main())
+        await check_and_update_cache_main()
 
     # Check data in db (assert we created API Cache for subroutes)
     logger_info_mock.assert_any_call("Done ! Retrieved keys : {}", 1)
     logger_info_mock.assert_any_call("Updating data for {} key...", player_cache_key)
 
-    assert cache_manager.get_parser_cache(player_cache_key) != {}
+    assert await cache_manager.get_parser_cache(player_cache_key) != {}
 
 
 @pytest.mark.parametrize(
@@ -243,34 +303,42 @@ def test_check_and_update_specific_player_to_update(
     [("TeKrop-2217", "TeKrop-2217")],
     indirect=["player_html_data", "player_stats_json_data"],
 )
-def test_check_and_update_player_stats_summary_to_update(
+@pytest.mark.asyncio()
+async def test_check_and_update_player_stats_summary_to_update(
     cache_manager: CacheManager,
     locale: str,
     player_html_data: str,
     player_stats_json_data: dict,
 ):
     player_stats_cache_key = f"PlayerStatsSummaryParser-{settings.blizzard_host}/{locale}{settings.career_path}/TeKrop-2217/"
+    player_cache_key = f"PlayerParser-{settings.blizzard_host}/{locale}{settings.career_path}/TeKrop-2217/"
 
     # Add some data (to update and not to update)
-    cache_manager.update_parser_cache(
+    await cache_manager.update_parser_cache(
         player_stats_cache_key,
         {},
         settings.expired_cache_refresh_limit - 5,
+        {
+            "parser": "PlayerStatsSummaryParser",
+            "kwargs": {"locale": locale, "player_id": "TeKrop-2217"},
+        },
     )
-    cache_manager.update_parser_cache(
+    await cache_manager.update_parser_cache(
         f"HeroParser-{settings.blizzard_host}/{locale}{settings.heroes_path}/ana",
         {},
         settings.expired_cache_refresh_limit + 5,
+        {"parser": "HeroParser", "kwargs": {"locale": locale, "hero_key": "ana"}},
     )
-    cache_manager.update_parser_cache(
+    await cache_manager.update_parser_cache(
         "GamemodesParser",
         [],
         settings.expired_cache_refresh_limit + 10,
+        {"parser": "GamemodesParser", "kwargs": {}},
     )
 
     # Check data in db (assert no Parser Cache data)
-    assert cache_manager.get_parser_cache(player_stats_cache_key) == {}
-    assert get_soon_expired_cache_keys() == {player_stats_cache_key}
+    assert await cache_manager.get_parser_cache(player_stats_cache_key) == {}
+    assert await get_soon_expired_cache_keys() == {player_stats_cache_key}
 
     # check and update (only maps should be updated)
     logger_info_mock = Mock()
@@ -279,13 +347,12 @@ def test_check_and_update_player_stats_summary_to_update(
             overfast_client,
             "get",
             return_value=Mock(
-                status_code=status.HTTP_200_OK,
-                text=player_html_data,
+                status_code=status.HTTP_200_OK, text=player_html_data, headers={}
             ),
         ),
         patch("app.common.logging.logger.info", logger_info_mock),
     ):
-        asyncio.run(check_and_update_cache_main())
+        await check_and_update_cache_main()
 
     # Check data in db (assert we created API Cache for subroutes)
     logger_info_mock.assert_any_call("Done ! Retrieved keys : {}", 1)
@@ -294,17 +361,27 @@ def test_check_and_update_player_stats_summary_to_update(
         player_stats_cache_key,
     )
 
-    assert (
-        cache_manager.get_parser_cache(player_stats_cache_key) == player_stats_json_data
-    )
+    # The career page Parser Cache shared by player parsers has been updated
+    assert await cache_manager.get_parser_cache(player_cache_key) != {}
 
+    player_stats_parser = PlayerStatsSummaryParser(player_id="TeKrop-2217")
+    await player_stats_parser.parse()
+    assert player_stats_parser.data == player_stats_json_data
 
-def test_check_internal_error_from_blizzard(cache_manager: CacheManager, locale: str):
+
+@pytest.mark.asyncio()
+async def test_check_internal_error_from_blizzard(
+    cache_manager: CacheManager, locale: str
+):
     # Add some data (to update and not to update)
-    cache_manager.update_parser_cache(
+    await cache_manager.update_parser_cache(
         f"HeroParser-{settings.blizzard_host}/{locale}{settings.heroes_path}/ana",
         {},
         settings.expired_cache_refresh_limit - 5,
+        {"parser": "HeroParser", "kwargs": {"locale": locale, "hero_key": "ana"}},
+    )
+    await cache_manager.get_parser_cache(
+        f"HeroParser-{settings.blizzard_host}/{locale}{settings.heroes_path}/ana"
     )
 
     logger_error_mock = Mock()
@@ -315,11 +392,12 @@ def test_check_internal_error_from_blizzard(cache_manager: CacheManager, locale:
             return_value=Mock(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 text="Internal Server Error",
+                headers={},
             ),
         ),
         patch("app.common.logging.logger.error", logger_error_mock),
     ):
-        asyncio.run(check_and_update_cache_main())
+        await check_and_update_cache_main()
 
     logger_error_mock.assert_any_call(
         "Received an error from Blizzard. HTTP {} : {}",
@@ -328,12 +406,17 @@ def test_check_internal_error_from_blizzard(cache_manager: CacheManager, locale:
     )
 
 
-def test_check_timeout_from_blizzard(cache_manager: CacheManager, locale: str):
+@pytest.mark.asyncio()
+async def test_check_timeout_from_blizzard(cache_manager: CacheManager, locale: str):
     # Add some data (to update and not to update)
-    cache_manager.update_parser_cache(
+    await cache_manager.update_parser_cache(
         f"HeroParser-{settings.blizzard_host}/{locale}{settings.heroes_path}/ana",
         {},
         settings.expired_cache_refresh_limit - 5,
+        {"parser": "HeroParser", "kwargs": {"locale": locale, "hero_key": "ana"}},
+    )
+    await cache_manager.get_parser_cache(
+        f"HeroParser-{settings.blizzard_host}/{locale}{settings.heroes_path}/ana"
     )
 
     logger_error_mock = Mock()
@@ -348,7 +431,7 @@ def test_check_timeout_from_blizzard(cache_manager: CacheManager, locale: str):
         ),
         patch("app.common.logging.logger.error", logger_error_mock),
     ):
-        asyncio.run(check_and_update_cache_main())
+        await check_and_update_cache_main()
 
     logger_error_mock.assert_any_call(
         "Received an error from Blizzard. HTTP {} : {}",
@@ -358,16 +441,24 @@ def test_check_timeout_from_blizzard(cache_manager: CacheManager, locale: str):
 
 
 @pytest.mark.parametrize("player_html_data", ["TeKrop-2217"], indirect=True)
-def test_check_parser_parsing_error(
+@pytest.mark.asyncio()
+async def test_check_parser_parsing_error(
     cache_manager: CacheManager,
     locale: str,
     player_html_data: str,
 ):
     # Add some data (to update and not to update)
-    cache_manager.update_parser_cache(
+    await cache_manager.update_parser_cache(
         f"PlayerParser-{settings.blizzard_host}/{locale}{settings.career_path}/TeKrop-2217",
         {},
         settings.expired_cache_refresh_limit - 5,
+        {
+            "parser": "PlayerParser",
+            "kwargs": {"locale": locale, "player_id": "TeKrop-2217"},
+        },
+    )
+    await cache_manager.get_parser_cache(
+        f"PlayerParser-{settings.blizzard_host}/{locale}{settings.career_path}/TeKrop-2217"
     )
 
     logger_critical_mock = Mock()
@@ -380,11 +471,13 @@ def test_check_parser_parsing_error(
         patch.object(
             overfast_client,
             "get",
-            return_value=Mock(status_code=status.HTTP_200_OK, text=player_attr_error),
+            return_value=Mock(
+                status_code=status.HTTP_200_OK, text=player_attr_error, headers={}
+            ),
         ),
         patch("app.common.logging.logger.critical", logger_critical_mock),
     ):
-        asyncio.run(check_and_update_cache_main())
+        await check_and_update_cache_main()
 
     logger_critical_mock.assert_called_with(
         "Internal server error for URL {} : {}",
@@ -394,16 +487,24 @@ def test_check_parser_parsing_error(
 
 
 @pytest.mark.parametrize("player_html_data", ["Unknown-1234"], indirect=True)
-def test_check_parser_init_error(
+@pytest.mark.asyncio()
+async def test_check_parser_init_error(
     cache_manager: CacheManager,
     locale: str,
     player_html_data: str,
 ):
     # Add some data (to update and not to update)
-    cache_manager.update_parser_cache(
+    await cache_manager.update_parser_cache(
         f"PlayerParser-{settings.blizzard_host}/{locale}{settings.career_path}/TeKrop-2217",
         {},
         settings.expired_cache_refresh_limit - 5,
+        {
+            "parser": "PlayerParser",
+            "kwargs": {"locale": locale, "player_id": "TeKrop-2217"},
+        },
+    )
+    await cache_manager.get_parser_cache(
+        f"PlayerParser-{settings.blizzard_host}/{locale}{settings.career_path}/TeKrop-2217"
     )
 
     logger_exception_mock = Mock()
@@ -411,11 +512,13 @@ def test_check_parser_init_error(
         patch.object(
             overfast_client,
             "get",
-            return_value=Mock(status_code=status.HTTP_200_OK, text=player_html_data),
+            return_value=Mock(
+                status_code=status.HTTP_200_OK, text=player_html_data, headers={}
+            ),
         ),
         patch("app.common.logging.logger.exception", logger_exception_mock),
     ):
-        asyncio.run(check_and_update_cache_main())
+        await check_and_update_cache_main()
 
     logger_exception_mock.assert_any_call(
         "Failed to instanciate Parser when refreshing : {}",
@@ -423,7 +526,8 @@ def test_check_parser_init_error(
     )
 
 
-def test_check_and_update_several_to_update(
+@pytest.mark.asyncio()
+async def test_check_and_update_several_to_update(
     cache_manager: CacheManager,
     home_html_data: list,
     gamemodes_json_data: dict,
@@ -433,18 +537,22 @@ def test_check_and_update_several_to_update(
     maps_cache_key = "MapsParser"
 
     # Add some data to update
-    cache_manager.update_parser_cache(
+    await cache_manager.update_parser_cache(
         gamemodes_cache_key,
         [],
         settings.expired_cache_refresh_limit - 5,
+        {"parser": "GamemodesParser", "kwargs": {}},
     )
-    cache_manager.update_parser_cache(
+    await cache_manager.update_parser_cache(
         maps_cache_key,
         [],
         settings.expired_cache_refresh_limit - 5,
+        {"parser": "MapsParser", "kwargs": {}},
     )
 
-    assert get_soon_expired_cache_keys() == {gamemodes_cache_key, maps_cache_key}
+    await cache_manager.get_parser_cache(gamemodes_cache_key)
+    await cache_manager.get_parser_cache(maps_cache_key)
+    assert await get_soon_expired_cache_keys() == {gamemodes_cache_key, maps_cache_key}
 
     # check and update (only gamemodes should be updated)
     logger_info_mock = Mock()
@@ -452,22 +560,27 @@ def test_check_and_update_several_to_update(
         patch.object(
             overfast_client,
             "get",
-            return_value=Mock(status_code=status.HTTP_200_OK, text=home_html_data),
+            return_value=Mock(
+                status_code=status.HTTP_200_OK, text=home_html_data, headers={}
+            ),
         ),
         patch("app.common.logging.logger.info", logger_info_mock),
     ):
-        asyncio.run(check_and_update_cache_main())
+        await check_and_update_cache_main()
 
     # Check data in db (assert we created API Cache for subroutes)
     logger_info_mock.assert_any_call("Done ! Retrieved keys : {}", 2)
     logger_info_mock.assert_any_call("Updating data for {} key...", gamemodes_cache_key)
     logger_info_mock.assert_any_call("Updating data for {} key...", maps_cache_key)
 
-    assert cache_manager.get_parser_cache(gamemodes_cache_key) == gamemodes_json_data
-    assert cache_manager.get_parser_cache(maps_cache_key) == maps_json_data
+    assert (
+        await cache_manager.get_parser_cache(gamemodes_cache_key) == gamemodes_json_data
+    )
+    assert await cache_manager.get_parser_cache(maps_cache_key) == maps_json_data
 
 
-def test_check_and_update_namecard_to_update(
+@pytest.mark.asyncio()
+async def test_check_and_update_namecard_to_update(
     cache_manager: CacheManager,
     locale: str,
     search_tekrop_blizzard_json_data: dict,
@@ -476,28 +589,34 @@ def test_check_and_update_namecard_to_update(
     namecard_cache_key = f"NamecardParser-{settings.blizzard_host}/{locale}{settings.search_account_path}/TeKrop#2217"
 
     # Add search data + parser_cache key which needs an update
-    cache_manager.update_search_data_cache(search_data_json_data)
-    cache_manager.update_parser_cache(
+    await cache_manager.update_search_data_cache(search_data_json_data)
+    await cache_manager.update_parser_cache(
         namecard_cache_key,
         {},
         settings.expired_cache_refresh_limit - 5,
+        {
+            "parser": "NamecardParser",
+            "kwargs": {"locale": locale, "player_id": "TeKrop-2217"},
+        },
     )
 
     # Add some data which doesn't need update
-    cache_manager.update_parser_cache(
+    await cache_manager.update_parser_cache(
         f"HeroParser-{settings.blizzard_host}/{locale}{settings.heroes_path}/ana",
         {},
         settings.expired_cache_refresh_limit + 5,
+        {"parser": "HeroParser", "kwargs": {"locale": locale, "hero_key": "ana"}},
     )
-    cache_manager.update_parser_cache(
+    await cache_manager.update_parser_cache(
         "GamemodesParser",
         [],
         settings.expired_cache_refresh_limit + 10,
+        {"parser": "GamemodesParser", "kwargs": {}},
     )
 
     # Check data in db (assert no Parser Cache data)
-    assert cache_manager.get_parser_cache(namecard_cache_key) == {}
-    assert get_soon_expired_cache_keys() == {namecard_cache_key}
+    assert await cache_manager.get_parser_cache(namecard_cache_key) == {}
+    assert await get_soon_expired_cache_keys() == {namecard_cache_key}
 
     # check and update
     logger_info_mock = Mock()
@@ -509,16 +628,68 @@ def test_check_and_update_namecard_to_update(
                 status_code=status.HTTP_200_OK,
                 text=json.dumps(search_tekrop_blizzard_json_data),
                 json=lambda: search_tekrop_blizzard_json_data,
+                headers={},
             ),
         ),
         patch("app.common.logging.logger.info", logger_info_mock),
     ):
-        asyncio.run(check_and_update_cache_main())
+        await check_and_update_cache_main()
 
     # Check data in db (assert we created API Cache for subroutes)
     logger_info_mock.assert_any_call("Done ! Retrieved keys : {}", 1)
     logger_info_mock.assert_any_call("Updating data for {} key...", namecard_cache_key)
 
-    assert cache_manager.get_parser_cache(namecard_cache_key) == {
+    assert await cache_manager.get_parser_cache(namecard_cache_key) == {
         "namecard": "https://d15f34w2p8l1cc.cloudfront.net/overwatch/52ee742d4e2fc734e3cd7fdb74b0eac64bcdf26d58372a503c712839595802c5.png",
     }
+
+
+@pytest.mark.asyncio()
+async def test_check_and_update_cache_not_read_recently(cache_manager: CacheManager):
+    gamemodes_cache_key = "GamemodesParser"
+    maps_cache_key = "MapsParser"
+    for cache_key in (gamemodes_cache_key, maps_cache_key):
+        await cache_manager.update_parser_cache(
+            cache_key,
+            [],
+            settings.expired_cache_refresh_limit - 5,
+            {"parser": cache_key, "kwargs": {}},
+        )
+
+    # Maps have been read a long time ago, gamemodes have never been read
+    with patch(
+        "app.common.cache_manager.time.time",
+        return_value=time.time() - settings.expired_cache_refresh_read_window - 10,
+    ):
+        await cache_manager.get_parser_cache(maps_cache_key)
+
+    # Cold values are left to expire, and their reads are forgotten
+    assert await get_soon_expired_cache_keys() == set()
+    assert await cache_manager.redis_server.zcard(settings.parser_cache_reads_key) == 0
+
+
+@pytest.mark.asyncio()
+async def test_check_and_update_cache_refreshed_by_another_process(
+    cache_manager: CacheManager,
+):
+    cache_key = "MapsParser"
+    await cache_manager.update_parser_cache(
+        cache_key,
+        [],
+        settings.expired_cache_refresh_limit - 5,
+        {"parser": "MapsParser", "kwargs": {}},
+    )
+    await cache_manager.get_parser_cache(cache_key)
+
+    # The application is already refreshing it in the background
+    await cache_manager.redis_server.set(
+        f"{settings.parser_cache_lock_key_prefix}:{cache_key}", "token"
+    )
+
+    with patch(
+        "app.parsers.maps_parser.MapsParser.retrieve_and_parse_data"
+    ) as retrieve_and_parse_data_mock:
+        await check_and_update_cache_main()
+
+    retrieve_and_parse_data_mock.assert_not_called()
+    assert await cache_manager.get_parser_cache(cache_key) == []
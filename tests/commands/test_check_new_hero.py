@@ -23,7 +23,9 @@ def test_check_no_new_hero(heroes_html_data: str):
         patch.object(
             overfast_client,
             "get",
-            return_value=Mock(status_code=status.HTTP_200_OK, text=heroes_html_data),
+            return_value=Mock(
+                status_code=status.HTTP_200_OK, text=heroes_html_data, headers={}
+            ),
         ),
         patch("app.common.logging.logger.info", logger_info_mock),
     ):
@@ -0,0 +1,59 @@
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pytest
+import zstandard
+
+from app.commands.train_parser_cache_dictionary import (
+    dictionary_size,
+    get_training_samples,
+    max_sample_size,
+)
+from app.commands.train_parser_cache_dictionary import (
+    main as train_parser_cache_dictionary_main,
+)
+from app.common.helpers import dumps_json_value
+
+
+def test_train_parser_cache_dictionary(tmp_path: Path):
+    dictionary_path = tmp_path / "parser-cache-v1.zstd-dict"
+
+    with patch(
+        "app.commands.train_parser_cache_dictionary.get_zstd_dictionary_path",
+        return_value=dictionary_path,
+    ):
+        train_parser_cache_dictionary_main()
+
+    dictionary = zstandard.ZstdCompressionDict(dictionary_path.read_bytes())
+    assert len(dictionary) == dictionary_size
+
+
+def test_train_parser_cache_dictionary_already_exists(tmp_path: Path):
+    dictionary_path = tmp_path / "parser-cache-v1.zstd-dict"
+    dictionary_path.write_bytes(b"dictionary")
+
+    logger_error_mock = Mock()
+    with (
+        patch(
+            "app.commands.train_parser_cache_dictionary.get_zstd_dictionary_path",
+            return_value=dictionary_path,
+        ),
+        patch("app.common.logging.logger.error", logger_error_mock),
+        pytest.raises(SystemExit),
+    ):
+        train_parser_cache_dictionary_main()
+
+    logger_error_mock.assert_called_once()
+    assert dictionary_path.read_bytes() == b"dictionary"
+
+
+def test_get_training_samples():
+    value = {
+        "summary": {"username": "TeKrop"},
+        "stats": [{"key": "x" * max_sample_size}, {"key": "value"}],
+    }
+
+    assert list(get_training_samples(value)) == [
+        dumps_json_value({"username": "TeKrop"}),
+        dumps_json_value({"key": "value"}),
+    ]
@@ -1,12 +1,20 @@
-from time import sleep
+import asyncio
+import gzip
+import json
+import time
+import zlib
+from collections.abc import Callable
 from unittest.mock import Mock, patch
 
+import brotli
 import pytest
+from fakeredis import FakeAsyncRedis
 from fastapi import Request
 from redis.exceptions import RedisError
 
 from app.common.cache_manager import CacheManager
 from app.common.enums import Locale, SearchDataType
+from app.common.helpers import json_value_codec_version
 from app.config import settings
 
 
@@ -20,6 +28,14 @@ def locale():
     return Locale.ENGLISH_US
 
 
+async def get_soon_expired_cache_keys(
+    cache_manager: CacheManager, cache_key_prefix: str
+) -> set[str]:
+    return {
+        key async for key in cache_manager.get_soon_expired_cache_keys(cache_key_prefix)
+    }
+
+
 @pytest.fixture(autouse=True)
 def _set_no_spread_percentage():
     with patch(
@@ -30,41 +46,60 @@ def _set_no_spread_percentage():
 
 
 @pytest.mark.parametrize(
-    ("req", "expected"),
+    ("path", "query_string", "expected"),
     [
-        (Mock(url=Mock(path="/heroes"), query_params=None), "/heroes"),
+        ("/heroes", "", "/heroes"),
+        ("/heroes", "role=damage", "/heroes?role=damage"),
+        ("/players", "name=TeKrop", "/players?name=TeKrop"),
+        # Default values are removed
+        ("/heroes", "locale=en-us", "/heroes"),
+        ("/players", "name=TeKrop&offset=0&limit=20", "/players?name=TeKrop"),
+        # Parameters are sorted, enumeration values lowercased
         (
-            Mock(url=Mock(path="/heroes"), query_params="role=damage"),
-            "/heroes?role=damage",
+            "/players/TeKrop-2217/stats",
+            "platform=pc&gamemode=quickplay",
+            "/players/TeKrop-2217/stats?gamemode=quickplay&platform=pc",
         ),
+        ("/heroes", "role=Tank&locale=EN-US", "/heroes?role=tank"),
         (
-            Mock(url=Mock(path="/players"), query_params="name=TeKrop"),
-            "/players?name=TeKrop",
+            "/players",
+            "name=TeKrop&order_by=name:desc",
+            "/players?name=TeKrop&order_by=name%3Adesc",
         ),
     ],
 )
 def test_get_cache_key_from_request(
     cache_manager: CacheManager,
-    req: Request,
+    path: str,
+    query_string: str,
     expected: str,
 ):
+    req = Request(
+        {
+            "type": "http",
+            "path": path,
+            "query_string": query_string.encode(),
+            "headers": [],
+        }
+    )
     assert cache_manager.get_cache_key_from_request(req) == expected
 
 
 @pytest.mark.parametrize(
     ("is_redis_server_up", "cache_key", "value", "expire", "sleep_time", "expected"),
     [
-        (True, "/heroes", [{"name": "Sojourn"}], 10, None, b'[{"name":"Sojourn"}]'),
-        (True, "/heroes", [{"name": "Sojourn"}], 1, 1, None),
-        (False, "/heroes", [{"name": "Sojourn"}], 10, None, None),
-        (False, "/heroes", [{"name": "Sojourn"}], 1, 1, None),
+        (True, "/heroes", b'[{"name":"Sojourn"}]', 10, None, b'[{"name":"Sojourn"}]'),
+        (True, "/heroes", b'[{"name":"Sojourn"}]', 1, 1, None),
+        (False, "/heroes", b'[{"name":"Sojourn"}]', 10, None, None),
+        (False, "/heroes", b'[{"name":"Sojourn"}]', 1, 1, None),
     ],
 )
-def test_update_and_get_api_cache(
+@pytest.mark.asyncio()
+async def test_update_and_get_api_cache(
     cache_manager: CacheManager,
     is_redis_server_up: bool,
     cache_key: str,
-    value: list,
+    value: bytes,
     expire: int,
     sleep_time: int | None,
     expected: str | None,
@@ -74,16 +109,60 @@ def test_update_and_get_api_cache(
         is_redis_server_up,
     ):
         # Assert the value is not here before update
-        assert cache_manager.get_api_cache(cache_key) is None
+        assert await cache_manager.get_api_cache(cache_key) is None
 
         # Update the API Cache and sleep if needed
-        cache_manager.update_api_cache(cache_key, value, expire)
+        await cache_manager.update_api_cache(cache_key, value, expire)
         if sleep_time:
-            sleep(sleep_time)
+            await asyncio.sleep(sleep_time)
 
         # Assert the value matches
-        assert cache_manager.get_api_cache(cache_key) == expected
-        assert cache_manager.get_api_cache("another_cache_key") is None
+        assert await cache_manager.get_api_cache(cache_key) == expected
+        assert await cache_manager.get_api_cache("another_cache_key") is None
+
+
+@pytest.mark.parametrize(
+    ("encoding", "decompress"),
+    [
+        ("br", brotli.decompress),
+        ("gzip", gzip.decompress),
+    ],
+)
+@pytest.mark.asyncio()
+async def test_update_api_cache_compressed_variants(
+    cache_manager: CacheManager, encoding: str, decompress: Callable
+):
+    await cache_manager.update_api_cache("/heroes", b'[{"name":"Sojourn"}]', 10)
+
+    compressed_value = await cache_manager.redis_server.get(
+        f"{settings.api_cache_key_prefix}-{encoding}:/heroes"
+    )
+    assert decompress(compressed_value) == await cache_manager.get_api_cache("/heroes")
+    assert await cache_manager.redis_server.ttl(
+        f"{settings.api_cache_key_prefix}-{encoding}:/heroes"
+    ) == await cache_manager.redis_server.ttl(
+        f"{settings.api_cache_key_prefix}:/heroes"
+    )
+
+
+@pytest.mark.asyncio()
+async def test_get_api_cache_or_not_found(cache_manager: CacheManager):
+    await cache_manager.update_api_cache("/heroes", b"[]", 10)
+    await cache_manager.update_api_cache_not_found(
+        "/players/Unknown-1234", b'{"error":"Player not found"}', 10
+    )
+
+    assert await cache_manager.get_api_cache_or_not_found("/heroes") == (b"[]", None)
+    api_cache, api_cache_not_found = await cache_manager.get_api_cache_or_not_found(
+        "/heroes", "gzip"
+    )
+    assert gzip.decompress(api_cache) == b"[]"
+    assert api_cache_not_found is None
+    assert await cache_manager.get_api_cache_or_not_found("/players/Unknown-1234") == (
+        None,
+        b'{"error":"Player not found"}',
+    )
+    assert await cache_manager.get_api_cache_or_not_found("/maps") == (None, None)
 
 
 @pytest.mark.parametrize(
@@ -101,7 +180,8 @@ def test_update_and_get_api_cache(
         ),
     ],
 )
-def test_update_and_get_parser_cache(
+@pytest.mark.asyncio()
+async def test_update_and_get_parser_cache(
     cache_manager: CacheManager,
     is_redis_server_up: bool,
     cache_key: str,
@@ -124,13 +204,13 @@ def test_update_and_get_parser_cache(
         ) as randint_mock,
     ):
         # Assert the value is not here before update
-        assert cache_manager.get_parser_cache(cache_key) is None
+        assert await cache_manager.get_parser_cache(cache_key) is None
 
         # Update the Parser Cache and sleep if needed
-        cache_manager.update_parser_cache(cache_key, parser_data, timeout_value)
+        await cache_manager.update_parser_cache(cache_key, parser_data, timeout_value)
 
         # Assert the value matches
-        assert cache_manager.get_parser_cache(cache_key) == (
+        assert await cache_manager.get_parser_cache(cache_key) == (
             parser_data if is_redis_server_up else None
         )
 
@@ -158,7 +238,8 @@ def test_update_and_get_parser_cache(
         (False, set()),
     ],
 )
-def test_get_soon_expired_cache_keys(
+@pytest.mark.asyncio()
+async def test_get_soon_expired_cache_keys(
     cache_manager: CacheManager,
     is_redis_server_up: bool,
     expected: set[str],
@@ -167,33 +248,33 @@ def test_get_soon_expired_cache_keys(
         "app.common.cache_manager.CacheManager.is_redis_server_up",
         is_redis_server_up,
     ):
-        cache_manager.update_parser_cache(
+        await cache_manager.update_parser_cache(
             f"HeroParser-{settings.blizzard_host}/{locale}{settings.heroes_path}/ana",
             {},
             settings.expired_cache_refresh_limit + 5,
         )
-        cache_manager.update_parser_cache(
+        await cache_manager.update_parser_cache(
             f"GamemodesParser-{settings.blizzard_host}/{locale}{settings.home_path}",
             [],
             settings.expired_cache_refresh_limit - 5,
         )
-        cache_manager.update_parser_cache(
+        await cache_manager.update_parser_cache(
             f"HeroesParser-{settings.blizzard_host}/{locale}{settings.heroes_path}",
             [{"name": "Sojourn"}],
             settings.expired_cache_refresh_limit - 10,
         )
 
         assert (
-            set(
-                cache_manager.get_soon_expired_cache_keys(
-                    settings.parser_cache_key_prefix,
-                ),
+            await get_soon_expired_cache_keys(
+                cache_manager,
+                settings.parser_cache_key_prefix,
             )
             == expected
         )
 
 
-def test_redis_connection_error(cache_manager: CacheManager):
+@pytest.mark.asyncio()
+async def test_redis_connection_error(cache_manager: CacheManager):
     redis_connection_error = RedisError(
         "Error 111 connecting to 127.0.0.1:6379. Connection refused.",
     )
@@ -201,66 +282,67 @@ def test_redis_connection_error(cache_manager: CacheManager):
         f"HeroesParser-{settings.blizzard_host}/{locale}{settings.heroes_path}"
     )
     with patch(
-        "app.common.cache_manager.redis.Redis.get",
+        "app.common.cache_manager.aioredis.Redis.get",
         side_effect=redis_connection_error,
     ):
-        cache_manager.update_parser_cache(
+        await cache_manager.update_parser_cache(
             heroes_cache_key,
             [{"name": "Sojourn"}],
             settings.expired_cache_refresh_limit - 1,
         )
-        assert cache_manager.get_parser_cache(heroes_cache_key) is None
+        assert await cache_manager.get_parser_cache(heroes_cache_key) is None
 
     with patch(
-        "app.common.cache_manager.redis.Redis.keys",
+        "app.common.cache_manager.aioredis.client.Pipeline.execute",
         side_effect=redis_connection_error,
     ):
-        assert not set(
-            cache_manager.get_soon_expired_cache_keys(settings.parser_cache_key_prefix),
+        assert not await get_soon_expired_cache_keys(
+            cache_manager, settings.parser_cache_key_prefix
         )
 
+    # Without expiry index built, the keyspace is scanned
     with patch(
-        "app.common.cache_manager.redis.Redis.ttl",
+        "app.common.cache_manager.aioredis.Redis.scan_iter",
         side_effect=redis_connection_error,
     ):
-        assert not set(
-            cache_manager.get_soon_expired_cache_keys(settings.parser_cache_key_prefix),
+        assert not await get_soon_expired_cache_keys(
+            cache_manager, settings.parser_cache_key_prefix
         )
 
 
-def test_delete_keys(cache_manager: CacheManager):
+@pytest.mark.asyncio()
+async def test_delete_keys(cache_manager: CacheManager):
     # Set data in parser cache which which is actually expired
-    cache_manager.update_parser_cache(
+    await cache_manager.update_parser_cache(
         "/heroes",
         [{"name": "Sojourn"}],
         settings.expired_cache_refresh_limit - 1,
     )
-    cache_manager.update_parser_cache_last_update(
+    await cache_manager.update_parser_cache_last_update(
         "/heroes",
         settings.expired_cache_refresh_limit - 1,
     )
 
-    cache_manager.update_parser_cache(
+    await cache_manager.update_parser_cache(
         "/maps",
         [{"name": "Hanamura"}],
         settings.expired_cache_refresh_limit - 1,
     )
-    cache_manager.update_parser_cache_last_update(
+    await cache_manager.update_parser_cache_last_update(
         "/maps",
         settings.expired_cache_refresh_limit - 1,
     )
 
-    assert set(
-        cache_manager.get_soon_expired_cache_keys(settings.parser_cache_key_prefix),
+    assert await get_soon_expired_cache_keys(
+        cache_manager, settings.parser_cache_key_prefix
     ) == {"/heroes", "/maps"}
-    assert set(
-        cache_manager.get_soon_expired_cache_keys(
-            settings.parser_cache_last_update_key_prefix,
-        ),
+    assert await get_soon_expired_cache_keys(
+        cache_manager,
+        settings.parser_cache_last_update_key_prefix,
     ) == {"/heroes", "/maps"}
 
     # Now delete the heroes key
-    cache_manager.delete_keys(
+    await cache_manager.delete_keys(
         f"{prefix}:/heroes"
         for prefix in (
             settings.parser_cache_key_prefix,
@@ -269,29 +351,463 @@ def test_delete_keys(cache_manager: CacheManager):
     )
 
     # Check if the keys are not here anymore
-    assert set(
-        cache_manager.get_soon_expired_cache_keys(settings.parser_cache_key_prefix),
+    assert await get_soon_expired_cache_keys(
+        cache_manager, settings.parser_cache_key_prefix
     ) == {"/maps"}
-    assert set(
-        cache_manager.get_soon_expired_cache_keys(
-            settings.parser_cache_last_update_key_prefix,
-        ),
+    assert await get_soon_expired_cache_keys(
+        cache_manager,
+        settings.parser_cache_last_update_key_prefix,
     ) == {"/maps"}
 
 
 @pytest.mark.parametrize(("data_type"), list(SearchDataType))
-def test_search_data_update_and_get(
+@pytest.mark.asyncio()
+async def test_search_data_update_and_get(
     cache_manager: CacheManager, data_type: SearchDataType
 ):
     # Insert search data only for one data type
-    cache_manager.update_search_data_cache({data_type: {"key": "value"}})
+    await cache_manager.update_search_data_cache({data_type: {"key": "value"}})
 
     # Check we can retrieve the data by querying for this type
-    assert cache_manager.get_search_data_cache(data_type, "key") == "value"
+    assert await cache_manager.get_search_data_cache(data_type, "key") == "value"
 
     # Check we don't retrieve it for other types
     assert not any(
-        cache_manager.get_search_data_cache(search_type, "key")
-        for search_type in SearchDataType
-        if search_type != data_type
+        [
+            await cache_manager.get_search_data_cache(search_type, "key")
+            for search_type in SearchDataType
+            if search_type != data_type
+        ]
+    )
+
+
+@pytest.mark.asyncio()
+async def test_search_data_in_process(
+    cache_manager: CacheManager, async_redis_server: FakeAsyncRedis
+):
+    # Search data is stored in one hash per data type
+    await cache_manager.update_search_data_cache(
+        {SearchDataType.NAMECARD: {"key": "namecard"}}
+    )
+    assert await async_redis_server.hgetall(
+        cache_manager.get_search_data_key(SearchDataType.NAMECARD)
+    ) == {b"key": b"namecard"}
+
+    # Another process updated the search data, the in-process one is used
+    await async_redis_server.hset(
+        cache_manager.get_search_data_key(SearchDataType.NAMECARD), "key", "other"
+    )
+    assert (
+        await cache_manager.get_search_data_cache(SearchDataType.NAMECARD, "key")
+        == "namecard"
+    )
+
+    # Search data is loaded again from Redis at once
+    await cache_manager.load_search_data()
+    assert (
+        await cache_manager.get_search_data_cache(SearchDataType.NAMECARD, "key")
+        == "other"
+    )
+
+
+@pytest.mark.asyncio()
+async def test_parser_cache_lock(cache_manager: CacheManager):
+    # Only the first process can acquire the lock
+    assert await cache_manager.acquire_parser_cache_lock("/heroes") is True
+    assert await cache_manager.acquire_parser_cache_lock("/heroes") is False
+    assert await cache_manager.acquire_parser_cache_lock("/maps") is True
+
+    # Once released, it can be acquired again
+    await cache_manager.release_parser_cache_lock("/heroes")
+    assert await cache_manager.acquire_parser_cache_lock("/heroes") is True
+
+
+@pytest.mark.asyncio()
+async def test_parser_cache_lock_acquired_by_another_process(
+    cache_manager: CacheManager,
+):
+    lock_key = f"{settings.parser_cache_lock_key_prefix}:/heroes"
+    await cache_manager.acquire_parser_cache_lock("/heroes")
+
+    # Lock timed out, and has been acquired by another process meanwhile
+    await cache_manager.redis_server.set(lock_key, "other-token")
+
+    await cache_manager.release_parser_cache_lock("/heroes")
+    assert await cache_manager.redis_server.get(lock_key) == b"other-token"
+
+
+@pytest.mark.asyncio()
+async def test_wait_for_parser_cache_lock_released(cache_manager: CacheManager):
+    await cache_manager.acquire_parser_cache_lock("/heroes")
+
+    async def store_parser_cache_and_release_lock():
+        await asyncio.sleep(0.1)
+        await cache_manager.update_parser_cache("/heroes", [{"name": "Sojourn"}], 10)
+        await cache_manager.release_parser_cache_lock("/heroes")
+
+    parser_cache, _ = await asyncio.gather(
+        cache_manager.wait_for_parser_cache("/heroes"),
+        store_parser_cache_and_release_lock(),
+    )
+    assert parser_cache == [{"name": "Sojourn"}]
+
+
+@pytest.mark.asyncio()
+async def test_wait_for_parser_cache_shared_subscription(cache_manager: CacheManager):
+    cache_keys = ["/heroes", "/maps", "/roles"]
+    for cache_key in cache_keys:
+        await cache_manager.acquire_parser_cache_lock(cache_key)
+
+    async def store_parser_cache_and_release_locks():
+        await asyncio.sleep(0.1)
+        for cache_key in cache_keys:
+            await cache_manager.update_parser_cache(cache_key, [cache_key], 10)
+            await cache_manager.release_parser_cache_lock(cache_key)
+
+    with patch.object(
+        cache_manager.redis_server, "pubsub", wraps=cache_manager.redis_server.pubsub
+    ) as pubsub_mock:
+        *parser_caches, _ = await asyncio.gather(
+            *(cache_manager.wait_for_parser_cache(key) for key in cache_keys),
+            store_parser_cache_and_release_locks(),
+        )
+
+    # A single subscription is used by every waiting coroutine of the process
+    pubsub_mock.assert_called_once()
+    assert parser_caches == [[cache_key] for cache_key in cache_keys]
+    assert not cache_manager.parser_cache_lock_waiters
+
+
+@pytest.mark.asyncio()
+async def test_wait_for_parser_cache_without_lock(cache_manager: CacheManager):
+    # Nothing to wait for, the current Parser Cache value is returned
+    assert await cache_manager.wait_for_parser_cache("/heroes") is None
+
+    await cache_manager.update_parser_cache("/heroes", [{"name": "Sojourn"}], 10)
+    assert await cache_manager.wait_for_parser_cache("/heroes") == [{"name": "Sojourn"}]
+
+
+@pytest.mark.asyncio()
+async def test_wait_for_parser_cache_timeout(cache_manager: CacheManager):
+    await cache_manager.acquire_parser_cache_lock("/heroes")
+
+    logger_warning_mock = Mock()
+    with (
+        patch("app.common.cache_manager.settings.parser_cache_lock_timeout", 0.1),
+        patch("app.common.logging.logger.warning", logger_warning_mock),
+    ):
+        assert await cache_manager.wait_for_parser_cache("/heroes") is None
+
+    logger_warning_mock.assert_any_call("Timeout while waiting for {} lock", "/heroes")
+
+
+@pytest.mark.asyncio()
+async def test_local_parser_cache(cache_manager: CacheManager):
+    heroes_cache_key = f"HeroesParser-{settings.blizzard_host}{settings.heroes_path}"
+    player_cache_key = f"PlayerParser-{settings.blizzard_host}{settings.career_path}"
+    await cache_manager.update_parser_cache(heroes_cache_key, [{"name": "Sojourn"}], 10)
+    await cache_manager.update_parser_cache(player_cache_key, {"summary": {}}, 10)
+
+    # First retrieval is made from Redis, and only stores heroes locally
+    assert await cache_manager.get_parser_cache(heroes_cache_key) == [
+        {"name": "Sojourn"}
+    ]
+    assert await cache_manager.get_parser_cache(player_cache_key) == {"summary": {}}
+
+    # Heroes are still available locally if Redis can't be reached
+    with patch(
+        "app.common.cache_manager.aioredis.Redis.get",
+        side_effect=RedisError("Connection refused"),
+    ):
+        assert await cache_manager.get_parser_cache(heroes_cache_key) == [
+            {"name": "Sojourn"}
+        ]
+        assert await cache_manager.get_parser_cache(player_cache_key) is None
+
+    # Updating the value removes the local one
+    await cache_manager.update_parser_cache(heroes_cache_key, [{"name": "Ana"}], 10)
+    assert await cache_manager.get_parser_cache(heroes_cache_key) == [{"name": "Ana"}]
+
+
+@pytest.mark.asyncio()
+async def test_get_parser_cache_entry(cache_manager: CacheManager):
+    heroes_cache_key = f"HeroesParser-{settings.blizzard_host}{settings.heroes_path}"
+    await cache_manager.update_parser_cache(
+        heroes_cache_key,
+        [{"name": "Sojourn"}],
+        10,
+        {"parser": "HeroesParser", "kwargs": {}, "validated": True},
+    )
+
+    # Value, TTL, validation flag and metadata are retrieved from Redis
+    value, ttl, is_validated, metadata = await cache_manager.get_parser_cache_entry(
+        heroes_cache_key
+    )
+    assert value == [{"name": "Sojourn"}]
+    assert ttl > 0
+    assert is_validated
+    assert metadata == {"parser": "HeroesParser", "kwargs": {}, "validated": True}
+
+    # Flags are kept in local Parser Cache
+    assert await cache_manager.get_parser_cache_entry(heroes_cache_key) == (
+        [{"name": "Sojourn"}],
+        None,
+        True,
+        {"parser": "HeroesParser", "kwargs": {}, "validated": True},
+    )
+
+    # Values stored without metadata aren't validated
+    player_cache_key = f"PlayerParser-{settings.blizzard_host}{settings.career_path}"
+    await cache_manager.update_parser_cache(player_cache_key, {"summary": {}}, 10)
+    _, _, is_validated, metadata = await cache_manager.get_parser_cache_entry(
+        player_cache_key
+    )
+    assert not is_validated
+    assert metadata is None
+
+
+@pytest.mark.asyncio()
+async def test_get_parser_cache_entry_expired(cache_manager: CacheManager):
+    player_cache_key = f"PlayerParser-{settings.blizzard_host}{settings.career_path}"
+    await cache_manager.update_parser_cache(player_cache_key, {"summary": {}}, 10)
+
+    # A single key is stored, kept during the grace period after its expiration
+    assert (
+        await cache_manager.redis_server.ttl(
+            f"{settings.parser_cache_key_prefix}:{player_cache_key}"
+        )
+        > settings.parser_cache_stale_grace_period
+    )
+    assert await cache_manager.redis_server.keys("parser-cache-stale:*") == []
+
+    # Once expired, the value is still retrieved as stale data, with its TTL
+    with patch(
+        "app.common.cache_manager.time.time",
+        return_value=time.time() + 20,
+    ):
+        value, ttl, *_ = await cache_manager.get_parser_cache_entry(player_cache_key)
+        assert value == {"summary": {}}
+        assert ttl <= 0
+        assert await cache_manager.get_parser_cache(player_cache_key) is None
+
+
+@pytest.mark.asyncio()
+async def test_listen_cache_updates_parser_cache(cache_manager: CacheManager):
+    heroes_cache_key = f"HeroesParser-{settings.blizzard_host}{settings.heroes_path}"
+    cache_manager.local_parser_cache.set(heroes_cache_key, [{"name": "Sojourn"}], 10)
+
+    listener = asyncio.create_task(cache_manager.listen_cache_updates())
+    await asyncio.sleep(0.1)
+
+    # Another process is publishing an update notification
+    await cache_manager.redis_server.publish(
+        settings.parser_cache_invalidation_channel,
+        heroes_cache_key,
+    )
+    await asyncio.sleep(0.1)
+
+    listener.cancel()
+    assert cache_manager.local_parser_cache.get(heroes_cache_key) is None
+
+
+@pytest.mark.asyncio()
+async def test_update_parser_cache_invalidation(
+    cache_manager: CacheManager, async_redis_server: FakeAsyncRedis
+):
+    heroes_cache_key = f"HeroesParser-{settings.blizzard_host}{settings.heroes_path}"
+    player_cache_key = f"PlayerParser-{settings.blizzard_host}{settings.career_path}"
+
+    async with async_redis_server.pubsub() as pubsub:
+        await pubsub.subscribe(settings.parser_cache_invalidation_channel)
+        await pubsub.get_message(timeout=0.1)
+
+        await cache_manager.update_parser_cache(player_cache_key, {"summary": {}}, 10)
+        await cache_manager.update_parser_cache(heroes_cache_key, [], 10)
+
+        # Only values which can be stored locally are notified
+        message = await pubsub.get_message(timeout=0.1)
+        assert message["data"].decode("utf-8") == heroes_cache_key
+        assert await pubsub.get_message(timeout=0.1) is None
+
+
+@pytest.mark.asyncio()
+async def test_listen_cache_updates_search_data(
+    cache_manager: CacheManager, async_redis_server: FakeAsyncRedis
+):
+    listener = asyncio.create_task(cache_manager.listen_cache_updates())
+    await asyncio.sleep(0.1)
+
+    # Another process is updating search data
+    await async_redis_server.hset(
+        cache_manager.get_search_data_key(SearchDataType.TITLE), "key", "value"
+    )
+    await async_redis_server.publish(settings.search_data_update_channel, "")
+    await asyncio.sleep(0.1)
+
+    listener.cancel()
+    assert cache_manager.search_data[SearchDataType.TITLE] == {"key": "value"}
+
+
+@pytest.mark.asyncio()
+async def test_get_soon_expired_cache_keys_without_expiry_index(
+    cache_manager: CacheManager,
+):
+    # Parser Cache values stored without expiry index, with their grace period
+    await cache_manager.redis_server.set(
+        f"{settings.parser_cache_key_prefix}:/heroes",
+        value="[]",
+        ex=settings.expired_cache_refresh_limit
+        - 5
+        + settings.parser_cache_stale_grace_period,
+    )
+    await cache_manager.redis_server.set(
+        f"{settings.parser_cache_key_prefix}:/maps",
+        value="[]",
+        ex=settings.expired_cache_refresh_limit
+        + 5
+        + settings.parser_cache_stale_grace_period,
+    )
+    await cache_manager.redis_server.set(
+        f"{settings.parser_cache_key_prefix}:/roles",
+        value="[]",
+    )
+
+    # A value is stored with the expiry index afterwards, creating it
+    await cache_manager.update_parser_cache(
+        "/gamemodes", [], settings.expired_cache_refresh_limit - 10
+    )
+
+    # The keyspace is scanned, and the expiry index is built
+    with patch(
+        "app.common.cache_manager.aioredis.Redis.scan_iter",
+        wraps=cache_manager.redis_server.scan_iter,
+    ) as scan_iter_mock:
+        assert await get_soon_expired_cache_keys(
+            cache_manager, settings.parser_cache_key_prefix
+        ) == {"/gamemodes", "/heroes"}
+        scan_iter_mock.assert_called_once()
+
+    index_key = cache_manager.get_expiry_index_key(settings.parser_cache_key_prefix)
+    assert await cache_manager.redis_server.zrange(index_key, 0, -1) == [
+        b"/gamemodes",
+        b"/heroes",
+        b"/maps",
+    ]
+
+    # Next calls are using the expiry index
+    with patch("app.common.cache_manager.aioredis.Redis.scan_iter") as scan_iter_mock:
+        assert await get_soon_expired_cache_keys(
+            cache_manager, settings.parser_cache_key_prefix
+        ) == {"/gamemodes", "/heroes"}
+        scan_iter_mock.assert_not_called()
+
+
+@pytest.mark.asyncio()
+async def test_expiry_index_cleaning(cache_manager: CacheManager):
+    index_key = cache_manager.get_expiry_index_key(settings.parser_cache_key_prefix)
+    await cache_manager.update_parser_cache("/heroes", [], 10)
+    await cache_manager.update_parser_cache("/maps", [], 10)
+    await cache_manager.update_parser_cache("/roles", [], 10)
+
+    # Deleted keys are removed from the index
+    await cache_manager.delete_keys([f"{settings.parser_cache_key_prefix}:/maps"])
+    assert await cache_manager.redis_server.zrange(index_key, 0, -1) == [
+        b"/heroes",
+        b"/roles",
+    ]
+
+    # Expired keys are kept in the index during their grace period
+    with patch(
+        "app.common.cache_manager.time.time",
+        return_value=time.time() + 20,
+    ):
+        assert (
+            await get_soon_expired_cache_keys(
+                cache_manager, settings.parser_cache_key_prefix
+            )
+            == set()
+        )
+    assert await cache_manager.redis_server.zrange(index_key, 0, -1) == [
+        b"/heroes",
+        b"/roles",
+    ]
+
+    # Deleted keys are removed from the index when retrieving soon expired keys
+    with patch(
+        "app.common.cache_manager.time.time",
+        return_value=time.time() + 20 + settings.parser_cache_stale_grace_period,
+    ):
+        assert (
+            await get_soon_expired_cache_keys(
+                cache_manager, settings.parser_cache_key_prefix
+            )
+            == set()
+        )
+    assert await cache_manager.redis_server.zrange(index_key, 0, -1) == []
+
+
+@pytest.mark.asyncio()
+async def test_parser_cache_metadata(cache_manager: CacheManager):
+    heroes_metadata = {"parser": "HeroesParser", "kwargs": {"locale": "en-us"}}
+    await cache_manager.update_parser_cache("/heroes", [], 10, heroes_metadata)
+    await cache_manager.update_parser_cache("/maps", [], 10)
+
+    assert await cache_manager.get_parser_cache_metadata(["/heroes", "/maps"]) == {
+        "/heroes": heroes_metadata
+    }
+
+    # Metadata is deleted with the Parser Cache
+    await cache_manager.delete_keys([f"{settings.parser_cache_key_prefix}:/heroes"])
+    assert await cache_manager.get_parser_cache_metadata(["/heroes"]) == {}
+
+
+@pytest.mark.asyncio()
+async def test_extend_parser_cache_migrates_legacy_value(cache_manager: CacheManager):
+    value = [{"name": "Sojourn"}]
+    await cache_manager.redis_server.set(
+        f"{settings.parser_cache_key_prefix}:HeroesParser-heroes",
+        zlib.compress(json.dumps(value).encode("utf-8")),
+    )
+
+    assert await cache_manager.extend_parser_cache("HeroesParser-heroes", 10) == value
+
+    stored_value = await cache_manager.redis_server.get(
+        f"{settings.parser_cache_key_prefix}:HeroesParser-heroes"
+    )
+    assert stored_value[0] == json_value_codec_version
+    assert await cache_manager.get_parser_cache("HeroesParser-heroes") == value
+
+
+@pytest.mark.asyncio()
+async def test_is_unknown_player(cache_manager: CacheManager):
+    cache_key = "PlayerParser-Unknown-1234"
+    cache_manager.players_missing_filter.add(["Unknown-1234"])
+
+    # Bloom filters are only a pre-check, the "not found" entry must still exist
+    assert not await cache_manager.is_unknown_player("Unknown-1234", cache_key)
+
+    await cache_manager.update_parser_cache_not_found(cache_key, "Player not found", 10)
+    assert await cache_manager.is_unknown_player("Unknown-1234", cache_key)
+
+    # Players which aren't in the filter don't cost any Redis call
+    with patch.object(cache_manager.redis_server, "get") as redis_get_mock:
+        assert not await cache_manager.is_unknown_player(
+            "TeKrop-2217", "PlayerParser-TeKrop-2217"
+        )
+    redis_get_mock.assert_not_called()
+    assert not await cache_manager.is_unknown_player(
+        "TeKrop-2217", "PlayerParser-TeKrop-2217"
+    )
+
+
+@pytest.mark.asyncio()
+async def test_bloom_filters_known_player(cache_manager: CacheManager):
+    # Player was missing, but is now known to exist
+    cache_manager.players_missing_filter.add(["TeKrop-2217"])
+    cache_manager.players_existing_filter.add(["TeKrop-2217"])
+    await cache_manager.update_parser_cache_not_found(
+        "PlayerParser-TeKrop-2217", "Player not found", 10
+    )
+    assert not await cache_manager.is_unknown_player(
+        "TeKrop-2217", "PlayerParser-TeKrop-2217"
     )
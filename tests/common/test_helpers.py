@@ -1,3 +1,5 @@
+import json
+import zlib
 from typing import Any
 
 import pytest
@@ -88,3 +90,27 @@ def test_key_to_label(key: str, result_label: str):
 )
 def test_get_player_title(title: str | None, resulting_title: str | None):
     assert helpers.get_player_title(title) == resulting_title
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        [{"name": "Sojourn"}],
+        {"summary": {"username": "TeKrop"}, "stats": None},
+        {},
+    ],
+)
+def test_compress_and_decompress_json_value(value: dict | list):
+    compressed_value = helpers.compress_json_value(value)
+
+    assert compressed_value[0] == helpers.json_value_codec_version
+    assert not helpers.is_outdated_json_value(compressed_value)
+    assert helpers.decompress_json_value(compressed_value) == value
+
+
+def test_decompress_legacy_json_value():
+    value = {"summary": {"username": "TeKrop"}, "stats": None}
+    legacy_value = zlib.compress(json.dumps(value).encode("utf-8"))
+
+    assert helpers.is_outdated_json_value(legacy_value)
+    assert helpers.decompress_json_value(legacy_value) == value
@@ -0,0 +1,69 @@
+from unittest.mock import patch
+
+from app.common.local_cache import LocalBloomFilter, LocalCache
+
+
+def test_local_cache_get_and_set():
+    local_cache = LocalCache(max_size=10)
+    local_cache.set("/heroes", [{"name": "Sojourn"}], 10)
+
+    assert local_cache.get("/heroes") == [{"name": "Sojourn"}]
+    assert local_cache.get("/maps") is None
+    assert local_cache.stats == {"size": 1, "hits": 1, "misses": 1}
+
+    local_cache.delete("/heroes")
+    assert local_cache.get("/heroes") is None
+
+
+def test_local_cache_expiration():
+    local_cache = LocalCache(max_size=10)
+    with patch("app.common.local_cache.time.monotonic", return_value=100.0):
+        local_cache.set("/heroes", [{"name": "Sojourn"}], 10)
+
+    with patch("app.common.local_cache.time.monotonic", return_value=109.0):
+        assert local_cache.get("/heroes") == [{"name": "Sojourn"}]
+
+    with patch("app.common.local_cache.time.monotonic", return_value=110.0):
+        assert local_cache.get("/heroes") is None
+
+    assert local_cache.stats == {"size": 0, "hits": 1, "misses": 1}
+
+
+def test_local_cache_least_recently_used_eviction():
+    local_cache = LocalCache(max_size=2)
+    local_cache.set("/heroes", [{"name": "Sojourn"}], 10)
+    local_cache.set("/maps", [{"name": "Hanamura"}], 10)
+
+    # Heroes are used, so maps value is the least recently used one
+    local_cache.get("/heroes")
+    local_cache.set("/roles", [{"name": "Tank"}], 10)
+
+    assert local_cache.get("/heroes") == [{"name": "Sojourn"}]
+    assert local_cache.get("/maps") is None
+    assert local_cache.get("/roles") == [{"name": "Tank"}]
+
+
+def test_local_bloom_filter():
+    bloom_filter = LocalBloomFilter(size=1024, hash_count=3, timeout=10)
+    bloom_filter.add(["TeKrop-2217", "Dekk-2677"])
+
+    assert "TeKrop-2217" in bloom_filter
+    assert "Dekk-2677" in bloom_filter
+    assert "Unknown-1234" not in bloom_filter
+
+    # A single bit is used for each position
+    assert len(bloom_filter.bits) == bloom_filter.size // 8
+    assert sum(bin(byte).count("1") for byte in bloom_filter.bits) <= 2 * 3
+
+
+def test_local_bloom_filter_expiration():
+    with patch("app.common.local_cache.time.monotonic", return_value=100.0):
+        bloom_filter = LocalBloomFilter(size=1024, hash_count=3, timeout=10)
+        bloom_filter.add(["TeKrop-2217"])
+
+    with patch("app.common.local_cache.time.monotonic", return_value=109.0):
+        assert "TeKrop-2217" in bloom_filter
+
+    # The filter is cleared once its timeout is reached
+    with patch("app.common.local_cache.time.monotonic", return_value=110.0):
+        assert "TeKrop-2217" not in bloom_filter
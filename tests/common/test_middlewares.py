@@ -0,0 +1,114 @@
+from unittest.mock import patch
+
+import pytest
+from fastapi import status
+from fastapi.testclient import TestClient
+
+from app.common.cache_manager import CacheManager
+from app.common.middlewares import ApiCacheMiddleware
+from app.main import app
+
+client = TestClient(ApiCacheMiddleware(app))
+
+
+@pytest.fixture()
+def cache_manager():
+    return CacheManager()
+
+
+@pytest.mark.parametrize(
+    ("accept_encoding", "content_encoding"),
+    [
+        ("identity", None),
+        ("gzip, deflate", "gzip"),
+        ("gzip, deflate, br", "br"),
+    ],
+)
+@pytest.mark.asyncio()
+async def test_api_cache_middleware_hit(
+    cache_manager: CacheManager,
+    accept_encoding: str,
+    content_encoding: str | None,
+):
+    await cache_manager.update_api_cache("/heroes?role=tank", b'[{"key":"dva"}]', 10)
+
+    with patch(
+        "app.handlers.api_request_handler.APIRequestHandler.process_request"
+    ) as process_request_mock:
+        response = client.get(
+            "/heroes?role=tank",
+            headers={"Accept-Encoding": accept_encoding},
+        )
+
+    # Cached value is returned without reaching the application
+    process_request_mock.assert_not_called()
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["Content-Type"] == "application/json"
+    assert response.headers.get("Content-Encoding") == content_encoding
+    assert response.content == b'[{"key":"dva"}]'
+
+
+@pytest.mark.asyncio()
+async def test_api_cache_middleware_miss(cache_manager: CacheManager):
+    await cache_manager.update_api_cache("/heroes?role=tank", b'[{"key":"dva"}]', 10)
+
+    with patch(
+        "app.handlers.api_request_handler.APIRequestHandler.process_request",
+        return_value=[],
+    ) as process_request_mock:
+        response = client.get("/heroes?role=support")
+
+    process_request_mock.assert_called_once()
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == []
+
+
+@pytest.mark.asyncio()
+async def test_api_cache_middleware_miss_single_redis_call(
+    cache_manager: CacheManager,
+):
+    with (
+        patch.object(
+            cache_manager.redis_server, "get", wraps=cache_manager.redis_server.get
+        ) as redis_get_mock,
+        patch.object(
+            cache_manager.redis_server, "mget", wraps=cache_manager.redis_server.mget
+        ) as redis_mget_mock,
+        patch(
+            "app.handlers.api_request_handler.APIRequestHandler.process_request",
+            return_value=[],
+        ),
+    ):
+        client.get("/heroes?role=support", headers={"Accept-Encoding": "identity"})
+
+    # API Cache and "not found" keys are retrieved at once
+    redis_mget_mock.assert_called_once_with(
+        "api-cache:/heroes?role=support", "api-cache-not-found:/heroes?role=support"
+    )
+    redis_get_mock.assert_not_called()
+
+
+@pytest.mark.parametrize("path", ["/docs", "/static/favicon.png", "/openapi.json"])
+def test_api_cache_middleware_non_api_path(cache_manager: CacheManager, path: str):
+    with patch.object(cache_manager.redis_server, "mget") as redis_mget_mock:
+        response = client.get(path)
+
+    # Requests outside of the API routes don't reach Redis
+    redis_mget_mock.assert_not_called()
+    assert response.status_code == status.HTTP_200_OK
+
+
+@pytest.mark.asyncio()
+async def test_api_cache_middleware_not_found(cache_manager: CacheManager):
+    await cache_manager.update_api_cache_not_found(
+        "/players/Unknown-1234", b'{"error":"Player not found"}', 10
+    )
+
+    with patch(
+        "app.handlers.api_request_handler.APIRequestHandler.process_request"
+    ) as process_request_mock:
+        response = client.get("/players/Unknown-1234")
+
+    process_request_mock.assert_not_called()
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+    assert response.json() == {"error": "Player not found"}
@@ -1,32 +1,60 @@
+from types import MappingProxyType
 from unittest.mock import patch
 
 import fakeredis
 import pytest
 from _pytest.fixtures import SubRequest
 
+from app.common.cache_manager import CacheManager
 from app.common.helpers import read_html_file, read_json_file
+from app.parsers.generics.abstract_parser import AbstractParser
+from app.parsers.search_data_parser import SearchDataResolver
 
 
 @pytest.fixture(scope="session")
-def redis_server():
-    return fakeredis.FakeStrictRedis()
+def fake_redis_server():
+    return fakeredis.FakeServer()
+
+
+@pytest.fixture(scope="session")
+def redis_server(fake_redis_server: fakeredis.FakeServer):
+    return fakeredis.FakeStrictRedis(server=fake_redis_server)
+
+
+@pytest.fixture(scope="session")
+def async_redis_server(fake_redis_server: fakeredis.FakeServer):
+    return fakeredis.FakeAsyncRedis(server=fake_redis_server)
 
 
 @pytest.fixture(autouse=True)
-def _patch_before_every_test(redis_server: fakeredis.FakeStrictRedis):
-    # Flush Redis before and after every tests
+def _patch_before_every_test(
+    redis_server: fakeredis.FakeStrictRedis,
+    async_redis_server: fakeredis.FakeAsyncRedis,
+):
+    # Flush Redis and local cache before and after every tests
     redis_server.flushdb()
+    CacheManager.local_parser_cache.clear()
+    CacheManager.parser_cache_lock_tokens.clear()
+    CacheManager.parser_cache_lock_waiters.clear()
+    CacheManager.parser_cache_locks_listener = None
+    CacheManager.search_data = MappingProxyType({})
+    SearchDataResolver.unknown_values.clear()
+    AbstractParser.postponed_retrievals.clear()
+    CacheManager.players_missing_filter.clear()
+    CacheManager.players_existing_filter.clear()
 
     with (
         patch("app.common.helpers.settings.discord_webhook_enabled", False),
         patch(
             "app.common.cache_manager.CacheManager.redis_server",
-            redis_server,
+            async_redis_server,
         ),
     ):
         yield
 
     redis_server.flushdb()
+    CacheManager.local_parser_cache.clear()
+    CacheManager.search_data = MappingProxyType({})
 
 
 @pytest.fixture(scope="session")
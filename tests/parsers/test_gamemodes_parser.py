@@ -14,7 +14,7 @@ async def test_gamemodes_page_parsing(home_html_data: str):
     with patch.object(
         overfast_client,
         "get",
-        return_value=Mock(status_code=200, text=home_html_data),
+        return_value=Mock(status_code=200, text=home_html_data, headers={}),
     ):
         try:
             await parser.parse()
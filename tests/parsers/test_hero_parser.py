@@ -23,7 +23,7 @@ async def test_hero_page_parsing(hero_key: str, hero_html_data: str):
     with patch.object(
         overfast_client,
         "get",
-        return_value=Mock(status_code=200, text=hero_html_data),
+        return_value=Mock(status_code=200, text=hero_html_data, headers={}),
     ):
         try:
             await parser.parse()
@@ -41,7 +41,7 @@ async def test_not_released_hero_parser_blizzard_error(hero_html_data: str):
         patch.object(
             overfast_client,
             "get",
-            return_value=Mock(status_code=404, text=hero_html_data),
+            return_value=Mock(status_code=404, text=hero_html_data, headers={}),
         ),
     ):
         await parser.parse()
@@ -1,10 +1,13 @@
-from unittest.mock import Mock, patch
+import asyncio
+import time
+from unittest.mock import AsyncMock, Mock, call, patch
 
 import pytest
 
 from app.common.enums import HeroKey
 from app.common.exceptions import OverfastError
 from app.common.helpers import overfast_client
+from app.config import settings
 from app.parsers.heroes_parser import HeroesParser
 
 
@@ -15,7 +18,7 @@ async def test_heroes_page_parsing(heroes_html_data: str):
     with patch.object(
         overfast_client,
         "get",
-        return_value=Mock(status_code=200, text=heroes_html_data),
+        return_value=Mock(status_code=200, text=heroes_html_data, headers={}),
     ):
         try:
             await parser.parse()
@@ -23,3 +26,323 @@ async def test_heroes_page_parsing(heroes_html_data: str):
             pytest.fail("Heroes list parsing failed")
 
     assert all(hero["key"] in iter(HeroKey) for hero in parser.data)
+
+
+@pytest.mark.asyncio()
+async def test_heroes_page_concurrent_parsing(heroes_html_data: str):
+    parsers = [HeroesParser() for _ in range(3)]
+
+    with patch.object(
+        overfast_client,
+        "get",
+        return_value=Mock(status_code=200, text=heroes_html_data, headers={}),
+    ) as overfast_client_get_mock:
+        await asyncio.gather(*(parser.parse() for parser in parsers))
+
+    # Blizzard page has only been retrieved and parsed once
+    overfast_client_get_mock.assert_called_once()
+    assert all(parser.data == parsers[0].data for parser in parsers)
+    assert not HeroesParser.running_retrievals
+
+
+@pytest.mark.asyncio()
+async def test_heroes_page_parsing_by_another_process(heroes_json_data: list):
+    parser = HeroesParser()
+
+    # Another process is retrieving the data
+    await parser.cache_manager.acquire_parser_cache_lock(parser.cache_key)
+
+    async def store_parser_cache_and_release_lock():
+        await asyncio.sleep(0.1)
+        await parser.cache_manager.update_parser_cache(
+            parser.cache_key, heroes_json_data, 10
+        )
+        await parser.cache_manager.release_parser_cache_lock(parser.cache_key)
+
+    with patch.object(overfast_client, "get") as overfast_client_get_mock:
+        await asyncio.gather(parser.parse(), store_parser_cache_and_release_lock())
+
+    overfast_client_get_mock.assert_not_called()
+    assert parser.data == heroes_json_data
+
+
+@pytest.mark.asyncio()
+async def test_heroes_page_parsing_stale_data_blizzard_error(
+    heroes_json_data: list,
+):
+    parser = HeroesParser()
+
+    # Expired Parser Cache, kept as stale data
+    await parser.cache_manager.update_parser_cache(
+        parser.cache_key, heroes_json_data, 10
+    )
+    await parser.cache_manager.redis_server.zadd(
+        parser.cache_manager.get_expiry_index_key(settings.parser_cache_key_prefix),
+        {parser.cache_key: time.time() - 1},
+    )
+
+    with patch.object(
+        overfast_client,
+        "get",
+        return_value=Mock(status_code=503, text="Service Unavailable", headers={}),
+    ) as overfast_client_get_mock:
+        await parser.parse()
+
+        assert parser.data == heroes_json_data
+        assert parser.is_stale_data is True
+
+        # Stale data is directly returned to next requests for a while
+        other_parser = HeroesParser()
+        await other_parser.parse()
+
+    overfast_client_get_mock.assert_called_once()
+    assert other_parser.data == heroes_json_data
+    assert other_parser.is_stale_data is True
+
+
+@pytest.mark.asyncio()
+async def test_heroes_page_parsing_stale_data_latency_budget(
+    heroes_html_data: str,
+    heroes_json_data: list,
+):
+    parser = HeroesParser()
+    stale_heroes_data = heroes_json_data[:1]
+
+    await parser.cache_manager.update_parser_cache(
+        parser.cache_key, stale_heroes_data, 10
+    )
+    await parser.cache_manager.redis_server.zadd(
+        parser.cache_manager.get_expiry_index_key(settings.parser_cache_key_prefix),
+        {parser.cache_key: time.time() - 1},
+    )
+
+    async def slow_overfast_client_get(*_, **__) -> Mock:
+        await asyncio.sleep(0.2)
+        return Mock(status_code=200, text=heroes_html_data, headers={})
+
+    with (
+        patch.object(overfast_client, "get", side_effect=slow_overfast_client_get),
+        patch(
+            "app.parsers.generics.abstract_parser.settings.parser_cache_stale_latency_budget",
+            0.1,
+        ),
+    ):
+        await parser.parse()
+
+        # Stale data is returned while the retrieval continues in the background
+        assert parser.data == stale_heroes_data
+        assert parser.is_stale_data is True
+
+        await asyncio.sleep(0.2)
+
+    assert await parser.cache_manager.get_parser_cache(parser.cache_key) == (
+        heroes_json_data
+    )
+
+
+@pytest.mark.parametrize(
+    ("parser_cache_timeout", "is_refreshed"),
+    [
+        (settings.parser_cache_refresh_ahead_limit - 10, True),
+        (settings.parser_cache_refresh_ahead_limit + 10, False),
+    ],
+)
+@pytest.mark.asyncio()
+async def test_heroes_page_parsing_refresh_ahead(
+    heroes_html_data: str,
+    heroes_json_data: list,
+    parser_cache_timeout: int,
+    is_refreshed: bool,
+):
+    parser = HeroesParser()
+    cached_heroes_data = heroes_json_data[:1]
+
+    with patch(
+        "app.common.cache_manager.settings.parser_cache_expiration_spreading_percentage",
+        0,
+    ):
+        await parser.cache_manager.update_parser_cache(
+            parser.cache_key, cached_heroes_data, parser_cache_timeout
+        )
+
+    get_mock = Mock(
+        return_value=Mock(status_code=200, text=heroes_html_data, headers={})
+    )
+    with patch.object(overfast_client, "get", side_effect=get_mock):
+        await parser.parse()
+
+        # Cached data is returned right away, even if it's about to expire
+        assert parser.data == cached_heroes_data
+        assert parser.is_stale_data is False
+
+        await asyncio.sleep(0.1)
+
+    assert get_mock.called is is_refreshed
+    assert await parser.cache_manager.get_parser_cache(parser.cache_key) == (
+        heroes_json_data if is_refreshed else cached_heroes_data
+    )
+
+
+@pytest.mark.asyncio()
+async def test_heroes_page_unchanged_content(
+    heroes_html_data: str,
+    heroes_json_data: list,
+):
+    parser = HeroesParser()
+    parser_cache_key = f"{settings.parser_cache_key_prefix}:{parser.cache_key}"
+    parser_cache_ttl = 10
+
+    with patch.object(
+        overfast_client,
+        "get",
+        return_value=Mock(status_code=200, text=heroes_html_data, headers={}),
+    ):
+        await parser.retrieve_and_parse_data()
+        await parser.cache_manager.redis_server.expire(
+            parser_cache_key, parser_cache_ttl
+        )
+
+        # Same Blizzard page : no parsing, the Parser Cache is only extended
+        with patch.object(parser, "parse_data") as parse_data_mock:
+            await parser.retrieve_and_parse_data()
+        parse_data_mock.assert_not_called()
+        assert parser.data == heroes_json_data
+        assert (
+            await parser.cache_manager.redis_server.ttl(parser_cache_key)
+            > parser_cache_ttl
+        )
+
+        # Expired Parser Cache is extended during its grace period
+        await parser.cache_manager.redis_server.zadd(
+            parser.cache_manager.get_expiry_index_key(settings.parser_cache_key_prefix),
+            {parser.cache_key: time.time() - 1},
+        )
+        with patch.object(parser, "parse_data") as parse_data_mock:
+            await parser.retrieve_and_parse_data()
+        parse_data_mock.assert_not_called()
+        assert (
+            await parser.cache_manager.get_parser_cache(parser.cache_key)
+            == heroes_json_data
+        )
+
+    # Blizzard page changed, it's parsed again
+    with (
+        patch.object(
+            overfast_client,
+            "get",
+            return_value=Mock(
+                status_code=200, text=f"{heroes_html_data}\n", headers={}
+            ),
+        ),
+        patch.object(parser, "parse_data", return_value=[]) as parse_data_mock,
+    ):
+        await parser.retrieve_and_parse_data()
+    parse_data_mock.assert_called_once()
+    assert await parser.cache_manager.get_parser_cache(parser.cache_key) == []
+
+
+@pytest.mark.asyncio()
+async def test_heroes_page_conditional_request(
+    heroes_html_data: str,
+    heroes_json_data: list,
+):
+    parser = HeroesParser()
+    validators = {"ETag": '"abcdef"', "Last-Modified": "Wed, 01 May 2024 10:00:00 GMT"}
+
+    with patch.object(
+        overfast_client,
+        "get",
+        return_value=Mock(status_code=200, text=heroes_html_data, headers=validators),
+    ):
+        await parser.retrieve_and_parse_data()
+
+    # Page not modified, validators are sent and Parser Cache is extended
+    get_mock = AsyncMock(return_value=Mock(status_code=304, text="", headers={}))
+    with (
+        patch.object(overfast_client, "get", get_mock),
+        patch.object(parser, "parse_data") as parse_data_mock,
+    ):
+        await parser.retrieve_and_parse_data()
+
+    get_mock.assert_called_once_with(
+        parser.blizzard_url,
+        headers={
+            "If-None-Match": '"abcdef"',
+            "If-Modified-Since": "Wed, 01 May 2024 10:00:00 GMT",
+        },
+    )
+    parse_data_mock.assert_not_called()
+    assert parser.data == heroes_json_data
+
+    # Nothing to extend anymore, the whole page is requested again
+    await parser.cache_manager.redis_server.delete(
+        f"{settings.parser_cache_key_prefix}:{parser.cache_key}",
+    )
+    get_mock = AsyncMock(
+        side_effect=[
+            Mock(status_code=304, text="", headers={}),
+            Mock(status_code=200, text=heroes_html_data, headers={}),
+        ],
+    )
+    with patch.object(overfast_client, "get", get_mock):
+        await parser.retrieve_and_parse_data()
+
+    assert get_mock.call_args_list == [
+        call(
+            parser.blizzard_url,
+            headers={
+                "If-None-Match": '"abcdef"',
+                "If-Modified-Since": "Wed, 01 May 2024 10:00:00 GMT",
+            },
+        ),
+        call(parser.blizzard_url, headers=None),
+    ]
+    assert parser.data == heroes_json_data
+
+
+@pytest.mark.asyncio()
+async def test_heroes_page_parsing_validated_data(heroes_html_data: str):
+    parser = HeroesParser()
+
+    with patch.object(
+        overfast_client,
+        "get",
+        return_value=Mock(status_code=200, text=heroes_html_data, headers={}),
+    ):
+        await parser.parse()
+
+    # Data has been validated once, and it's known by the next parsers
+    assert parser.is_validated_data
+
+    other_parser = HeroesParser()
+    with patch.object(overfast_client, "get") as overfast_client_get_mock:
+        await other_parser.parse()
+
+    overfast_client_get_mock.assert_not_called()
+    assert other_parser.is_validated_data
+
+
+@pytest.mark.asyncio()
+async def test_heroes_page_parsing_invalid_data(heroes_html_data: str):
+    parser = HeroesParser()
+
+    logger_critical_mock = Mock()
+    with (
+        patch.object(
+            overfast_client,
+            "get",
+            return_value=Mock(status_code=200, text=heroes_html_data, headers={}),
+        ),
+        patch.object(
+            parser,
+            "get_validation_views",
+            return_value=[(list[dict[str, int]], [{"name": "Ana"}], {})],
+        ),
+        patch("app.common.logging.logger.critical", logger_critical_mock),
+    ):
+        await parser.parse()
+
+    # Data is still stored and returned, but will be validated on every request
+    assert not parser.is_validated_data
+    assert all(hero["key"] in iter(HeroKey) for hero in parser.data)
+    logger_critical_mock.assert_called_once()
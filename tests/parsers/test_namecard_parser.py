@@ -1,5 +1,5 @@
 import json
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 import httpx
 import pytest
@@ -18,21 +18,21 @@ async def test_namecard_parser_no_cache(
     search_data_json_data: dict,
 ):
     parser = NamecardParser(player_id="Dekk-2677")
-    update_parser_cache_last_update_mock = Mock()
+    update_parser_cache_last_update_mock = AsyncMock()
 
     with (
         patch.object(
             overfast_client,
             "get",
-            return_value=Mock(
-                status_code=status.HTTP_200_OK,
-                text=json.dumps(search_players_blizzard_json_data),
-                json=lambda: search_players_blizzard_json_data,
-            ),
-        ),
-        patch(
-            "httpx.get",
-            return_value=Mock(status_code=status.HTTP_200_OK, text=search_html_data),
+            side_effect=[
+                Mock(
+                    status_code=status.HTTP_200_OK,
+                    text=json.dumps(search_players_blizzard_json_data),
+                    json=lambda: search_players_blizzard_json_data,
+                ),
+                # Search HTML page for namecard retrieval
+                Mock(status_code=status.HTTP_200_OK, text=search_html_data),
+            ],
         ),
         patch.object(
             parser.cache_manager,
@@ -169,13 +169,16 @@ async def test_namecard_parser_no_cache_no_namecard(
         patch.object(
             overfast_client,
             "get",
-            return_value=Mock(
-                status_code=status.HTTP_200_OK,
-                text=json.dumps(search_players_blizzard_json_data),
-                json=lambda: search_players_blizzard_json_data,
-            ),
+            side_effect=[
+                Mock(
+                    status_code=status.HTTP_200_OK,
+                    text=json.dumps(search_players_blizzard_json_data),
+                    json=lambda: search_players_blizzard_json_data,
+                ),
+                # Search HTML page for namecard retrieval
+                httpx.RequestError("error"),
+            ],
         ),
-        patch("httpx.get", side_effect=httpx.RequestError("error")),
         patch(
             "app.common.logging.logger.warning",
             logger_warning_mock,
@@ -184,17 +187,15 @@ async def test_namecard_parser_no_cache_no_namecard(
         await parser.parse()
 
     logger_warning_mock.assert_any_call(
-        "URL for {} {} of player {} not found in the cache",
+        "URL for {} {} not found in the cache",
         SearchDataType.NAMECARD,
         "0x0250000000005510",
-        "Dekk-2677",
     )
 
     logger_warning_mock.assert_any_call(
-        "URL for {} {} of player {} not found at all",
+        "URL for {} {} not found at all",
         SearchDataType.NAMECARD,
         "0x0250000000005510",
-        "Dekk-2677",
     )
 
     assert parser.data == {"namecard": None}
@@ -1,4 +1,4 @@
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
@@ -23,13 +23,13 @@ async def test_player_page_parsing_with_filters(
     player_career_json_data: dict,
 ):
     parser = PlayerCareerParser(player_id=player_id)
-    update_parser_cache_last_update_mock = Mock()
+    update_parser_cache_last_update_mock = AsyncMock()
 
     with (
         patch.object(
             overfast_client,
             "get",
-            return_value=Mock(status_code=200, text=player_html_data),
+            return_value=Mock(status_code=200, text=player_html_data, headers={}),
         ),
         patch.object(
             parser.cache_manager,
@@ -55,7 +55,7 @@ async def test_unknown_player_parser_blizzard_error(player_html_data: str):
         patch.object(
             overfast_client,
             "get",
-            return_value=Mock(status_code=200, text=player_html_data),
+            return_value=Mock(status_code=200, text=player_html_data, headers={}),
         ),
     ):
         await parser.parse()
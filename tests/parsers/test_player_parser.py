@@ -1,7 +1,8 @@
 import re
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
+from fastapi import status
 
 from app.common.exceptions import ParserBlizzardError, ParserParsingError
 from app.common.helpers import overfast_client, players_ids
@@ -30,13 +31,13 @@ async def test_player_page_parsing_with_filters(
     del player_data["summary"]["namecard"]
 
     parser = PlayerParser(player_id=player_id)
-    update_parser_cache_last_update_mock = Mock()
+    update_parser_cache_last_update_mock = AsyncMock()
 
     with (
         patch.object(
             overfast_client,
             "get",
-            return_value=Mock(status_code=200, text=player_html_data),
+            return_value=Mock(status_code=200, text=player_html_data, headers={}),
         ),
         patch.object(
             parser.cache_manager,
@@ -62,12 +63,48 @@ async def test_unknown_player_parser_blizzard_error(player_html_data: str):
         patch.object(
             overfast_client,
             "get",
-            return_value=Mock(status_code=200, text=player_html_data),
+            return_value=Mock(status_code=200, text=player_html_data, headers={}),
         ),
     ):
         await parser.parse()
 
 
+@pytest.mark.parametrize("player_html_data", ["Unknown-1234"], indirect=True)
+@pytest.mark.asyncio()
+async def test_unknown_player_parser_not_found_cache(player_html_data: str):
+    with patch.object(
+        overfast_client,
+        "get",
+        return_value=Mock(status_code=404, text=player_html_data, headers={}),
+    ) as overfast_client_get_mock:
+        for _ in range(2):
+            with pytest.raises(ParserBlizzardError) as error:
+                await PlayerParser(player_id="Unknown-1234").parse()
+
+            assert error.value.status_code == status.HTTP_404_NOT_FOUND
+            assert error.value.message == "Player not found"
+
+    # Unknown player is remembered, Blizzard page has only been retrieved once
+    overfast_client_get_mock.assert_called_once()
+
+
+@pytest.mark.parametrize("player_html_data", ["TeKrop-2217"], indirect=True)
+@pytest.mark.asyncio()
+async def test_player_parser_players_bloom_filters(player_html_data: str):
+    parser = PlayerParser(player_id="TeKrop-2217")
+
+    with patch.object(
+        overfast_client,
+        "get",
+        return_value=Mock(status_code=200, text=player_html_data, headers={}),
+    ):
+        await parser.parse()
+
+    # Parsed players are known to exist
+    assert "TeKrop-2217" in parser.cache_manager.players_existing_filter
+    assert "TeKrop-2217" not in parser.cache_manager.players_missing_filter
+
+
 @pytest.mark.parametrize("player_html_data", ["TeKrop-2217"], indirect=True)
 @pytest.mark.asyncio()
 async def test_player_parser_parsing_error_attribute_error(player_html_data: str):
@@ -81,7 +118,7 @@ async def test_player_parser_parsing_error_attribute_error(player_html_data: str
         patch.object(
             overfast_client,
             "get",
-            return_value=Mock(status_code=200, text=player_attr_error),
+            return_value=Mock(status_code=200, text=player_attr_error, headers={}),
         ),
         pytest.raises(ParserParsingError) as error,
     ):
@@ -107,7 +144,7 @@ async def test_player_parser_parsing_error_key_error(player_html_data: str):
         patch.object(
             overfast_client,
             "get",
-            return_value=Mock(status_code=200, text=player_key_error),
+            return_value=Mock(status_code=200, text=player_key_error, headers={}),
         ),
         pytest.raises(ParserParsingError) as error,
     ):
@@ -129,7 +166,7 @@ async def test_player_parser_parsing_error_type_error(player_html_data: str):
         patch.object(
             overfast_client,
             "get",
-            return_value=Mock(status_code=200, text=player_type_error),
+            return_value=Mock(status_code=200, text=player_type_error, headers={}),
         ),
         pytest.raises(ParserParsingError) as error,
     ):
@@ -1,9 +1,11 @@
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
 from app.common.exceptions import ParserBlizzardError
 from app.common.helpers import overfast_client, players_ids
+from app.parsers.player_career_parser import PlayerCareerParser
+from app.parsers.player_parser import PlayerParser
 from app.parsers.player_stats_summary_parser import PlayerStatsSummaryParser
 
 
@@ -23,13 +25,13 @@ async def test_player_page_parsing(
     player_stats_json_data: dict,
 ):
     parser = PlayerStatsSummaryParser(player_id=player_id)
-    update_parser_cache_last_update_mock = Mock()
+    update_parser_cache_last_update_mock = AsyncMock()
 
     with (
         patch.object(
             overfast_client,
             "get",
-            return_value=Mock(status_code=200, text=player_html_data),
+            return_value=Mock(status_code=200, text=player_html_data, headers={}),
         ),
         patch.object(
             parser.cache_manager,
@@ -43,6 +45,38 @@ async def test_player_page_parsing(
     update_parser_cache_last_update_mock.assert_called_once()
 
 
+@pytest.mark.parametrize(
+    ("player_html_data", "player_stats_json_data"),
+    [("TeKrop-2217", "TeKrop-2217")],
+    indirect=["player_html_data", "player_stats_json_data"],
+)
+@pytest.mark.asyncio()
+async def test_player_page_parsing_shared_career_page(
+    player_html_data: str,
+    player_stats_json_data: dict,
+):
+    # Player parsers are using the same career page Parser Cache
+    parser = PlayerParser(player_id="TeKrop-2217")
+    career_parser = PlayerCareerParser(player_id="TeKrop-2217")
+    stats_parser = PlayerStatsSummaryParser(player_id="TeKrop-2217")
+    assert parser.cache_key == career_parser.cache_key == stats_parser.cache_key
+
+    get_mock = AsyncMock(
+        return_value=Mock(status_code=200, text=player_html_data, headers={})
+    )
+    with patch.object(overfast_client, "get", get_mock):
+        await parser.parse()
+        await career_parser.parse()
+        await stats_parser.parse()
+
+    # Blizzard career page has only been retrieved once
+    get_mock.assert_called_once()
+
+    assert set(parser.data.keys()) == {"summary", "stats"}
+    assert set(career_parser.data.keys()) == {"stats"}
+    assert stats_parser.data == player_stats_json_data
+
+
 @pytest.mark.parametrize("player_html_data", ["Unknown-1234"], indirect=True)
 @pytest.mark.asyncio()
 async def test_unknown_player_parser_blizzard_error(player_html_data: str):
@@ -52,7 +86,7 @@ async def test_unknown_player_parser_blizzard_error(player_html_data: str):
         patch.object(
             overfast_client,
             "get",
-            return_value=Mock(status_code=200, text=player_html_data),
+            return_value=Mock(status_code=200, text=player_html_data, headers={}),
         ),
     ):
         await parser.parse()
@@ -15,7 +15,7 @@ async def test_roles_page_parsing(home_html_data: str):
     with patch.object(
         overfast_client,
         "get",
-        return_value=Mock(status_code=200, text=home_html_data),
+        return_value=Mock(status_code=200, text=home_html_data, headers={}),
     ):
         try:
             await parser.parse()
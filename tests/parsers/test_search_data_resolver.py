@@ -0,0 +1,103 @@
+import asyncio
+from unittest.mock import Mock, patch
+
+import httpx
+import pytest
+from fastapi import status
+
+from app.common.enums import SearchDataType
+from app.common.helpers import overfast_client
+from app.parsers.search_data_parser import SearchDataResolver
+
+player = {
+    "battleTag": "Dekk#2677",
+    "namecard": "0x0250000000005510",
+    "portrait": "0x0250000000001598",
+    "title": "0x0000000000000000",
+}
+
+
+@pytest.mark.asyncio()
+async def test_search_data_resolver_concurrent_refresh(
+    search_html_data: str, search_data_json_data: dict
+):
+    resolvers = [SearchDataResolver() for _ in range(3)]
+
+    with patch.object(
+        overfast_client,
+        "get",
+        return_value=Mock(status_code=status.HTTP_200_OK, text=search_html_data),
+    ) as overfast_client_get_mock:
+        await asyncio.gather(*(resolver.resolve([player]) for resolver in resolvers))
+
+    # Search page has only been retrieved once, and the cache has been updated
+    overfast_client_get_mock.assert_called_once()
+    assert SearchDataResolver.running_refresh is None
+    assert all(
+        resolver.get_data_value(player, SearchDataType.NAMECARD)
+        == search_data_json_data[SearchDataType.NAMECARD]["0x0250000000005510"]
+        for resolver in resolvers
+    )
+    assert (
+        await resolvers[0].cache_manager.get_search_data_cache(
+            SearchDataType.PORTRAIT, "0x0250000000001598"
+        )
+        == search_data_json_data[SearchDataType.PORTRAIT]["0x0250000000001598"]
+    )
+
+
+@pytest.mark.asyncio()
+async def test_search_data_resolver_unknown_values(
+    search_html_data: str, search_data_json_data: dict
+):
+    await SearchDataResolver.cache_manager.update_search_data_cache(
+        search_data_json_data
+    )
+    unknown_player = {**player, "namecard": "0x0250000000001234"}
+
+    with patch.object(
+        overfast_client,
+        "get",
+        return_value=Mock(status_code=status.HTTP_200_OK, text=search_html_data),
+    ) as overfast_client_get_mock:
+        resolver = SearchDataResolver()
+        await resolver.resolve([unknown_player])
+        assert resolver.get_data_value(unknown_player, SearchDataType.NAMECARD) is None
+        assert (
+            resolver.get_data_value(unknown_player, SearchDataType.PORTRAIT)
+            == search_data_json_data[SearchDataType.PORTRAIT]["0x0250000000001598"]
+        )
+
+        # Unknown value doesn't trigger another refresh for a while
+        other_resolver = SearchDataResolver()
+        await other_resolver.resolve([unknown_player])
+        assert (
+            other_resolver.get_data_value(unknown_player, SearchDataType.NAMECARD)
+            is None
+        )
+
+    overfast_client_get_mock.assert_called_once()
+
+
+@pytest.mark.asyncio()
+async def test_search_data_resolver_refresh_error(search_data_json_data: dict):
+    await SearchDataResolver.cache_manager.update_search_data_cache(
+        search_data_json_data
+    )
+    unknown_player = {**player, "namecard": "0x0250000000001234"}
+
+    with patch.object(
+        overfast_client, "get", side_effect=httpx.RequestError("error")
+    ) as overfast_client_get_mock:
+        resolver = SearchDataResolver()
+        await resolver.resolve([unknown_player])
+        assert resolver.get_data_value(unknown_player, SearchDataType.NAMECARD) is None
+
+        overfast_client_get_mock.assert_called_once()
+        overfast_client_get_mock.reset_mock()
+
+        # Value isn't remembered as unknown, as search data couldn't be retrieved
+        other_resolver = SearchDataResolver()
+        await other_resolver.resolve([unknown_player])
+
+    overfast_client_get_mock.assert_called_once()
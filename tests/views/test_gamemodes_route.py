@@ -15,7 +15,9 @@ def _setup_gamemodes_test(home_html_data: str):
     with patch.object(
         overfast_client,
         "get",
-        return_value=Mock(status_code=status.HTTP_200_OK, text=home_html_data),
+        return_value=Mock(
+            status_code=status.HTTP_200_OK, text=home_html_data, headers={}
+        ),
     ):
         yield
 
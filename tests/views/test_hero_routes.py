@@ -1,3 +1,4 @@
+import asyncio
 from unittest.mock import Mock, patch
 
 import pytest
@@ -29,8 +30,8 @@ def test_get_hero(
         overfast_client,
         "get",
         side_effect=[
-            Mock(status_code=status.HTTP_200_OK, text=hero_html_data),
-            Mock(status_code=status.HTTP_200_OK, text=heroes_html_data),
+            Mock(status_code=status.HTTP_200_OK, text=hero_html_data, headers={}),
+            Mock(status_code=status.HTTP_200_OK, text=heroes_html_data, headers={}),
         ],
     ):
         response = client.get(f"/heroes/{hero_name}")
@@ -55,7 +56,9 @@ def test_get_unreleased_hero(hero_name: str, hero_html_data: str):
         overfast_client,
         "get",
         side_effect=[
-            Mock(status_code=status.HTTP_404_NOT_FOUND, text=hero_html_data),
+            Mock(
+                status_code=status.HTTP_404_NOT_FOUND, text=hero_html_data, headers={}
+            ),
         ],
     ):
         response = client.get(f"/heroes/{hero_name}")
@@ -70,6 +73,7 @@ def test_get_hero_blizzard_error():
         return_value=Mock(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             text="Service Unavailable",
+            headers={},
         ),
     ):
         response = client.get(f"/heroes/{HeroKey.ANA}")
@@ -80,6 +84,58 @@ def test_get_hero_blizzard_error():
     }
 
 
+@pytest.mark.parametrize(
+    ("hero_html_data"),
+    [HeroKey.ANA],
+    indirect=["hero_html_data"],
+)
+def test_get_hero_parsers_run_concurrently(
+    hero_html_data: str,
+    heroes_html_data: str,
+):
+    running_requests = 0
+    max_running_requests = 0
+
+    async def overfast_client_get(url: str, **_) -> Mock:
+        nonlocal running_requests, max_running_requests
+        running_requests += 1
+        max_running_requests = max(max_running_requests, running_requests)
+        await asyncio.sleep(0.1)
+        running_requests -= 1
+        return Mock(
+            status_code=status.HTTP_200_OK,
+            text=hero_html_data
+            if url.endswith(f"/{HeroKey.ANA}")
+            else heroes_html_data,
+            headers={},
+        )
+
+    with patch.object(overfast_client, "get", side_effect=overfast_client_get):
+        response = client.get(f"/heroes/{HeroKey.ANA}")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert max_running_requests > 1
+
+
+def test_get_hero_one_parser_blizzard_error(heroes_html_data: str):
+    async def overfast_client_get(url: str, **_) -> Mock:
+        if url.endswith(f"/{HeroKey.ANA}"):
+            return Mock(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                text="Service Unavailable",
+                headers={},
+            )
+        return Mock(status_code=status.HTTP_200_OK, text=heroes_html_data, headers={})
+
+    with patch.object(overfast_client, "get", side_effect=overfast_client_get):
+        response = client.get(f"/heroes/{HeroKey.ANA}")
+
+    assert response.status_code == status.HTTP_504_GATEWAY_TIMEOUT
+    assert response.json() == {
+        "error": "Couldn't get Blizzard page (HTTP 503 error) : Service Unavailable",
+    }
+
+
 def test_get_hero_internal_error():
     with patch(
         "app.handlers.get_hero_request_handler.GetHeroRequestHandler.process_request",
@@ -117,8 +173,8 @@ def test_get_hero_no_portrait(
             overfast_client,
             "get",
             side_effect=[
-                Mock(status_code=status.HTTP_200_OK, text=hero_html_data),
-                Mock(status_code=status.HTTP_200_OK, text=heroes_html_data),
+                Mock(status_code=status.HTTP_200_OK, text=hero_html_data, headers={}),
+                Mock(status_code=status.HTTP_200_OK, text=heroes_html_data, headers={}),
             ],
         ),
         patch(
@@ -152,8 +208,8 @@ def test_get_hero_no_hitpoints(
             overfast_client,
             "get",
             side_effect=[
-                Mock(status_code=status.HTTP_200_OK, text=hero_html_data),
-                Mock(status_code=status.HTTP_200_OK, text=heroes_html_data),
+                Mock(status_code=status.HTTP_200_OK, text=hero_html_data, headers={}),
+                Mock(status_code=status.HTTP_200_OK, text=heroes_html_data, headers={}),
             ],
         ),
         patch(
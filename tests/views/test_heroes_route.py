@@ -1,3 +1,4 @@
+import time
 from unittest.mock import Mock, patch
 
 import pytest
@@ -18,7 +19,9 @@ def _setup_heroes_test(heroes_html_data: str):
     with patch.object(
         overfast_client,
         "get",
-        return_value=Mock(status_code=status.HTTP_200_OK, text=heroes_html_data),
+        return_value=Mock(
+            status_code=status.HTTP_200_OK, text=heroes_html_data, headers={}
+        ),
     ):
         yield
 
@@ -29,9 +32,20 @@ def test_get_heroes(heroes_json_data: list):
     assert response.json() == heroes_json_data
 
 
-def test_get_heroes_from_parser_cache(heroes_json_data: list):
+@pytest.mark.asyncio()
+async def test_get_heroes_stored_in_api_cache():
+    response = client.get("/heroes")
+    assert response.status_code == status.HTTP_200_OK
+
+    # The exact response content is stored in API Cache
     cache_manager = CacheManager()
-    cache_manager.update_parser_cache(
+    assert await cache_manager.get_api_cache("/heroes") == response.content
+
+
+@pytest.mark.asyncio()
+async def test_get_heroes_from_parser_cache(heroes_json_data: list):
+    cache_manager = CacheManager()
+    await cache_manager.update_parser_cache(
         f"HeroesParser-{settings.blizzard_host}/{Locale.ENGLISH_US}{settings.heroes_path}",
         heroes_json_data,
         100,
@@ -42,6 +56,37 @@ def test_get_heroes_from_parser_cache(heroes_json_data: list):
     assert response.json() == heroes_json_data
 
 
+@pytest.mark.asyncio()
+async def test_get_heroes_from_stale_parser_cache(heroes_json_data: list):
+    cache_manager = CacheManager()
+    cache_key = f"HeroesParser-{settings.blizzard_host}/{Locale.ENGLISH_US}{settings.heroes_path}"
+
+    # Expired Parser Cache, kept as stale data
+    await cache_manager.update_parser_cache(cache_key, heroes_json_data, 100)
+    await cache_manager.redis_server.zadd(
+        cache_manager.get_expiry_index_key(settings.parser_cache_key_prefix),
+        {cache_key: time.time() - 1},
+    )
+
+    with patch.object(
+        overfast_client,
+        "get",
+        return_value=Mock(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            text="Service Unavailable",
+            headers={},
+        ),
+    ):
+        response = client.get("/heroes")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == heroes_json_data
+    assert response.headers[settings.stale_data_header] == "stale"
+
+    # Stale data isn't stored in API Cache
+    assert await cache_manager.get_api_cache("/heroes") is None
+
+
 @pytest.mark.parametrize(
     "role",
     [r.value for r in Role],
@@ -54,6 +99,19 @@ def test_get_heroes_filter_by_role(role: Role, heroes_json_data: list):
     ]
 
 
+@pytest.mark.asyncio()
+async def test_get_heroes_filter_by_role_canonical_cache_key(heroes_json_data: list):
+    response = client.get("/heroes?locale=en-us&role=TANK")
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == [
+        hero for hero in heroes_json_data if hero["role"] == Role.TANK
+    ]
+
+    # Response is stored in API Cache using the canonical cache key
+    cache_manager = CacheManager()
+    assert await cache_manager.get_api_cache("/heroes?role=tank") == response.content
+
+
 def test_get_heroes_invalid_role():
     response = client.get("/heroes?role=invalid")
     assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
@@ -78,6 +136,7 @@ def test_get_heroes_blizzard_error():
         return_value=Mock(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             text="Service Unavailable",
+            headers={},
         ),
     ):
         response = client.get("/heroes")
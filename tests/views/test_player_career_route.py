@@ -1,3 +1,4 @@
+import asyncio
 import json
 from unittest.mock import Mock, patch
 
@@ -6,8 +7,11 @@ from fastapi import status
 from fastapi.testclient import TestClient
 from httpx import TimeoutException
 
+from app.common.cache_manager import CacheManager
 from app.common.helpers import overfast_client, players_ids
+from app.config import settings
 from app.main import app
+from app.parsers.player_parser import PlayerParser
 
 client = TestClient(app)
 
@@ -34,20 +38,18 @@ def test_get_player_career(
             "get",
             side_effect=[
                 # Player HTML page
-                Mock(status_code=status.HTTP_200_OK, text=player_html_data),
+                Mock(status_code=status.HTTP_200_OK, text=player_html_data, headers={}),
                 # Search results related to the player
                 Mock(
                     status_code=status.HTTP_200_OK,
                     text=json.dumps(search_tekrop_blizzard_json_data),
                     json=lambda: search_tekrop_blizzard_json_data,
+                    headers={},
                 ),
+                # Search HTML page for namecard retrieval
+                Mock(status_code=status.HTTP_200_OK, text=search_html_data, headers={}),
             ],
         ),
-        patch(
-            "httpx.get",
-            # Search HTML page for namecard retrieval
-            return_value=Mock(status_code=status.HTTP_200_OK, text=search_html_data),
-        ),
     ):
         response = client.get(f"/players/{player_id}")
 
@@ -66,6 +68,7 @@ def test_get_player_career_blizzard_error():
         return_value=Mock(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             text="Service Unavailable",
+            headers={},
         ),
     ):
         response = client.get("/players/TeKrop-2217")
@@ -118,13 +121,34 @@ def test_get_player_parser_init_error(player_html_data: str):
     with patch.object(
         overfast_client,
         "get",
-        return_value=Mock(status_code=status.HTTP_200_OK, text=player_html_data),
+        return_value=Mock(
+            status_code=status.HTTP_200_OK, text=player_html_data, headers={}
+        ),
     ):
         response = client.get("/players/TeKrop-2217")
         assert response.status_code == status.HTTP_404_NOT_FOUND
         assert response.json() == {"error": "Player not found"}
 
 
+@pytest.mark.parametrize("player_html_data", ["Unknown-1234"], indirect=True)
+@pytest.mark.asyncio()
+async def test_get_player_not_found_stored_in_api_cache(player_html_data: str):
+    with patch.object(
+        overfast_client,
+        "get",
+        return_value=Mock(
+            status_code=status.HTTP_404_NOT_FOUND, text=player_html_data, headers={}
+        ),
+    ):
+        response = client.get("/players/Unknown-1234/summary")
+
+    # The exact "not found" response content is stored in API Cache
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+    assert await CacheManager().get_api_cache_or_not_found(
+        "/players/Unknown-1234/summary"
+    ) == (None, response.content)
+
+
 @pytest.mark.parametrize("player_html_data", ["TeKrop-2217"], indirect=True)
 def test_get_player_parser_parsing_error(player_html_data: str):
     player_attr_error = player_html_data.replace(
@@ -134,7 +158,9 @@ def test_get_player_parser_parsing_error(player_html_data: str):
     with patch.object(
         overfast_client,
         "get",
-        return_value=Mock(status_code=status.HTTP_200_OK, text=player_attr_error),
+        return_value=Mock(
+            status_code=status.HTTP_200_OK, text=player_attr_error, headers={}
+        ),
     ):
         response = client.get("/players/TeKrop-2217")
         assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
@@ -146,3 +172,82 @@ def test_get_player_parser_parsing_error(player_html_data: str):
                 "https://github.com/TeKrop/overfast-api/issues"
             ),
         }
+
+
+@pytest.mark.asyncio()
+async def test_get_unknown_player_rejected():
+    CacheManager().players_missing_filter.add(["Unknown-1234"])
+    await CacheManager().update_parser_cache_not_found(
+        PlayerParser(player_id="Unknown-1234").cache_key, "Player not found", 10
+    )
+
+    with patch.object(overfast_client, "get") as overfast_client_get_mock:
+        response = client.get("/players/Unknown-1234")
+
+    # Blizzard isn't requested for players known to be missing
+    overfast_client_get_mock.assert_not_called()
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+    assert response.json() == {"error": "Player not found"}
+
+
+@pytest.mark.parametrize("player_html_data", ["Unknown-1234"], indirect=True)
+@pytest.mark.asyncio()
+async def test_get_player_not_found_bloom_filter(player_html_data: str):
+    with patch.object(
+        overfast_client,
+        "get",
+        return_value=Mock(
+            status_code=status.HTTP_404_NOT_FOUND, text=player_html_data, headers={}
+        ),
+    ):
+        client.get("/players/Unknown-1234")
+
+    assert await CacheManager().is_unknown_player(
+        "Unknown-1234", PlayerParser(player_id="Unknown-1234").cache_key
+    )
+
+
+@pytest.mark.asyncio()
+async def test_get_player_expired_not_found_entry():
+    # Player was missing, but its "not found" entry expired meanwhile
+    CacheManager().players_missing_filter.add(["Unknown-1234"])
+
+    with patch.object(
+        overfast_client,
+        "get",
+        return_value=Mock(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            text="Service Unavailable",
+            headers={},
+        ),
+    ) as overfast_client_get_mock:
+        response = client.get("/players/Unknown-1234")
+
+    # Blizzard is requested again, the player isn't rejected
+    overfast_client_get_mock.assert_called()
+    assert response.status_code == status.HTTP_504_GATEWAY_TIMEOUT
+
+
+@pytest.mark.parametrize("player_html_data", ["Unknown-1234"], indirect=True)
+def test_get_unknown_player_namecard_blizzard_error(player_html_data: str):
+    async def overfast_client_get(url: str, **_) -> Mock:
+        # Career page is slower than the search used for the namecard
+        if url.startswith(f"{settings.blizzard_host}/en-us{settings.career_path}"):
+            await asyncio.sleep(0.1)
+            return Mock(
+                status_code=status.HTTP_404_NOT_FOUND,
+                text=player_html_data,
+                headers={},
+            )
+        return Mock(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            text="Service Unavailable",
+            headers={},
+        )
+
+    with patch.object(overfast_client, "get", side_effect=overfast_client_get):
+        response = client.get("/players/Unknown-1234")
+
+    # Unknown player error wins over the transient error of the other parser
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+    assert response.json() == {"error": "Player not found"}
@@ -51,18 +51,22 @@ def test_get_player_stats(
     platform: PlayerPlatform | None,
     hero: HeroKeyCareerFilter | None,
     search_tekrop_blizzard_json_data: dict,
+    search_html_data: str,
     uri: str,
 ):
     with patch.object(
         overfast_client,
         "get",
         side_effect=[
-            Mock(status_code=status.HTTP_200_OK, text=player_html_data),
+            Mock(status_code=status.HTTP_200_OK, text=player_html_data, headers={}),
             Mock(
                 status_code=status.HTTP_200_OK,
                 text=json.dumps(search_tekrop_blizzard_json_data),
                 json=lambda: search_tekrop_blizzard_json_data,
+                headers={},
             ),
+            # Search HTML page for namecard retrieval
+            Mock(status_code=status.HTTP_200_OK, text=search_html_data, headers={}),
         ],
     ):
         query_params = "&".join(
@@ -124,6 +128,7 @@ def test_get_player_stats_blizzard_error(uri: str):
         return_value=Mock(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             text="Service Unavailable",
+            headers={},
         ),
     ):
         response = client.get(
@@ -31,7 +31,9 @@ def test_get_player_stats(
     with patch.object(
         overfast_client,
         "get",
-        return_value=Mock(status_code=status.HTTP_200_OK, text=player_html_data),
+        return_value=Mock(
+            status_code=status.HTTP_200_OK, text=player_html_data, headers={}
+        ),
     ):
         query_params = "&".join(
             [
@@ -62,6 +64,7 @@ def test_get_player_stats_blizzard_error():
         return_value=Mock(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             text="Service Unavailable",
+            headers={},
         ),
     ):
         response = client.get(
@@ -34,20 +34,18 @@ def test_get_player_summary(
             "get",
             side_effect=[
                 # Player HTML page
-                Mock(status_code=status.HTTP_200_OK, text=player_html_data),
+                Mock(status_code=status.HTTP_200_OK, text=player_html_data, headers={}),
                 # Search results related to the player
                 Mock(
                     status_code=status.HTTP_200_OK,
                     text=json.dumps(search_tekrop_blizzard_json_data),
                     json=lambda: search_tekrop_blizzard_json_data,
+                    headers={},
                 ),
+                # Search HTML page for namecard retrieval
+                Mock(status_code=status.HTTP_200_OK, text=search_html_data, headers={}),
             ],
         ),
-        patch(
-            "httpx.get",
-            # Search HTML page for namecard retrieval
-            return_value=Mock(status_code=status.HTTP_200_OK, text=search_html_data),
-        ),
     ):
         response = client.get(f"/players/{player_id}/summary")
     assert response.status_code == status.HTTP_200_OK
@@ -61,6 +59,7 @@ def test_get_player_summary_blizzard_error():
         return_value=Mock(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             text="Service Unavailable",
+            headers={},
         ),
     ):
         response = client.get("/players/TeKrop-2217/summary")
@@ -15,7 +15,9 @@ def _setup_roles_test(home_html_data: str):
     with patch.object(
         overfast_client,
         "get",
-        return_value=Mock(status_code=status.HTTP_200_OK, text=home_html_data),
+        return_value=Mock(
+            status_code=status.HTTP_200_OK, text=home_html_data, headers={}
+        ),
     ):
         yield
 
@@ -42,6 +44,7 @@ def test_get_roles_blizzard_error():
         return_value=Mock(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             text="Service Unavailable",
+            headers={},
         ),
     ):
         response = client.get("/roles")
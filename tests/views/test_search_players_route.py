@@ -1,5 +1,7 @@
+import asyncio
 import json
-from unittest.mock import Mock, patch
+from collections import deque
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 from fastapi import status
@@ -8,7 +10,11 @@ from httpx import TimeoutException
 
 from app.common.cache_manager import CacheManager
 from app.common.helpers import overfast_client
+from app.config import settings
+from app.handlers.search_players_request_handler import SearchPlayersRequestHandler
 from app.main import app
+from app.parsers.player_parser import PlayerParser
+from app.parsers.search_data_parser import NamecardParser, PortraitParser
 
 client = TestClient(app)
 
@@ -99,12 +105,13 @@ def test_search_players_blizzard_timeout():
     }
 
 
-def test_search_players(
+@pytest.mark.asyncio()
+async def test_search_players(
     search_players_api_json_data: dict, search_data_json_data: dict
 ):
     # Add search data in cache as if we launched the server
     cache_manager = CacheManager()
-    cache_manager.update_search_data_cache(search_data_json_data)
+    await cache_manager.update_search_data_cache(search_data_json_data)
 
     response = client.get("/players?name=Test")
     assert response.status_code == status.HTTP_200_OK
@@ -120,6 +127,38 @@ def test_search_players(
     )
 
 
+@pytest.mark.asyncio()
+async def test_search_players_known_players(search_players_api_json_data: dict):
+    response = client.get("/players?name=Test")
+    assert response.status_code == status.HTTP_200_OK
+
+    # Every found player is known to exist
+    cache_manager = CacheManager()
+    assert all(
+        player["player_id"] in cache_manager.players_existing_filter
+        for player in search_players_api_json_data["results"]
+    )
+
+
+@pytest.mark.asyncio()
+async def test_search_players_search_data_in_process(search_data_json_data: dict):
+    cache_manager = CacheManager()
+    await cache_manager.update_search_data_cache(search_data_json_data)
+
+    with (
+        patch.object(
+            cache_manager.redis_server, "get", AsyncMock(return_value=None)
+        ) as get_mock,
+        patch.object(cache_manager.redis_server, "hgetall") as hgetall_mock,
+    ):
+        response = client.get("/players?name=Test")
+
+    # Search data of found players is directly retrieved from the process
+    assert response.status_code == status.HTTP_200_OK
+    get_mock.assert_called_once_with(f"{settings.search_results_cache_key_prefix}:Test")
+    hgetall_mock.assert_not_called()
+
+
 @pytest.mark.parametrize(
     ("offset", "limit"),
     [
@@ -129,7 +168,8 @@ def test_search_players(
         (100, 20),
     ],
 )
-def test_search_players_with_offset_and_limit(
+@pytest.mark.asyncio()
+async def test_search_players_with_offset_and_limit(
     search_players_api_json_data: dict,
     search_data_json_data: dict,
     offset: int,
@@ -137,7 +177,7 @@ def test_search_players_with_offset_and_limit(
 ):
     # Add search data in cache as if we launched the server
     cache_manager = CacheManager()
-    cache_manager.update_search_data_cache(search_data_json_data)
+    await cache_manager.update_search_data_cache(search_data_json_data)
 
     response = client.get(f"/players?name=Test&offset={offset}&limit={limit}")
     assert response.status_code == status.HTTP_200_OK
@@ -153,13 +193,80 @@ def test_search_players_with_offset_and_limit(
     )
 
 
+@pytest.mark.asyncio()
+async def test_search_players_cached_search_results(
+    search_players_blizzard_json_data: list[dict],
+    search_players_api_json_data: dict,
+    search_data_json_data: dict,
+):
+    await CacheManager().update_search_data_cache(search_data_json_data)
+
+    with patch.object(
+        overfast_client,
+        "get",
+        return_value=Mock(
+            status_code=status.HTTP_200_OK,
+            text=json.dumps(search_players_blizzard_json_data),
+            json=lambda: search_players_blizzard_json_data,
+        ),
+    ) as overfast_client_get_mock:
+        responses = [
+            client.get(f"/players?name=Test&offset={offset}&limit=5")
+            for offset in range(0, search_players_api_json_data["total"], 5)
+        ]
+
+    # Blizzard has only been requested once for every page of results
+    overfast_client_get_mock.assert_called_once()
+    assert [
+        player["player_id"]
+        for response in responses
+        for player in response.json()["results"]
+    ] == sorted(
+        player["player_id"] for player in search_players_api_json_data["results"]
+    )
+
+
+@pytest.mark.asyncio()
+async def test_search_players_search_data_parser_cache(
+    search_players_api_json_data: dict, search_data_json_data: dict
+):
+    cache_manager = CacheManager()
+    await cache_manager.update_search_data_cache(search_data_json_data)
+
+    response = client.get("/players?name=Test")
+    assert response.status_code == status.HTTP_200_OK
+
+    # Search data parsers of found players don't need to search them again
+    with patch.object(overfast_client, "get") as overfast_client_get_mock:
+        for player in search_players_api_json_data["results"]:
+            namecard_parser = NamecardParser(player_id=player["player_id"])
+            portrait_parser = PortraitParser(player_id=player["player_id"])
+            await namecard_parser.parse()
+            await portrait_parser.parse()
+
+            assert namecard_parser.data == {"namecard": player["namecard"]}
+            assert portrait_parser.data == {"portrait": player["avatar"]}
+
+    overfast_client_get_mock.assert_not_called()
+
+    # Used seeded values are stored again as regular Parser Cache values
+    metadata = await cache_manager.get_parser_cache_metadata(
+        [namecard_parser.cache_key]
+    )
+    assert metadata[namecard_parser.cache_key]["parser"] == "NamecardParser"
+    assert await cache_manager.redis_server.exists(
+        f"{settings.parser_cache_last_update_key_prefix}:{namecard_parser.cache_key}"
+    )
+
+
 @pytest.mark.parametrize("order_by", ["name:asc", "name:desc"])
-def test_search_players_ordering(
+@pytest.mark.asyncio()
+async def test_search_players_ordering(
     search_players_api_json_data: dict, search_data_json_data: dict, order_by: str
 ):
     # Add search data in cache as if we launched the server
     cache_manager = CacheManager()
-    cache_manager.update_search_data_cache(search_data_json_data)
+    await cache_manager.update_search_data_cache(search_data_json_data)
 
     response = client.get(f"/players?name=Test&order_by={order_by}")
 
@@ -176,6 +283,91 @@ def test_search_players_ordering(
     }
 
 
+@pytest.mark.asyncio()
+async def test_search_players_career_prefetch(search_players_api_json_data: dict):
+    players = search_players_api_json_data["results"]
+    handler = SearchPlayersRequestHandler(Mock())
+
+    # Career page of the first player is already cached
+    cached_parser = PlayerParser(player_id=players[0]["player_id"])
+    await handler.cache_manager.update_parser_cache(cached_parser.cache_key, {}, 10)
+
+    with (
+        patch.object(PlayerParser, "parse", autospec=True) as parse_mock,
+        patch.object(SearchPlayersRequestHandler, "prefetch_history", deque()),
+        patch(
+            "app.handlers.search_players_request_handler.settings.career_prefetch_players_count",
+            3,
+        ),
+        patch(
+            "app.handlers.search_players_request_handler.settings.career_prefetch_max_per_minute",
+            1,
+        ),
+    ):
+        await handler.prefetch_careers(players)
+        await asyncio.gather(*SearchPlayersRequestHandler.running_prefetches)
+
+    # Only the second player is prefetched, the budget is exhausted afterwards
+    parse_mock.assert_called_once()
+    assert parse_mock.call_args.args[0].player_id == players[1]["player_id"]
+    assert not SearchPlayersRequestHandler.running_prefetches
+
+
+@pytest.mark.asyncio()
+async def test_search_players_career_prefetch_expiration():
+    parser = PlayerParser(player_id="TeKrop-2217")
+
+    with (
+        patch.object(PlayerParser, "retrieve_and_parse_data"),
+        patch.object(
+            parser.cache_manager, "update_parser_cache_last_update", AsyncMock()
+        ) as update_parser_cache_last_update_mock,
+    ):
+        await SearchPlayersRequestHandler.prefetch_career(parser)
+
+    # Prefetched career pages aren't kept up-to-date for a long time
+    update_parser_cache_last_update_mock.assert_called_once_with(
+        parser.cache_key, settings.career_prefetch_expiration_timeout
+    )
+
+
+@pytest.mark.asyncio()
+async def test_search_players_career_prefetch_requested():
+    prefetch_parser = PlayerParser(player_id="TeKrop-2217")
+    prefetch_parser.is_prefetch = True
+    cache_manager = prefetch_parser.cache_manager
+    await cache_manager.update_parser_cache(
+        prefetch_parser.cache_key,
+        {},
+        settings.career_path_cache_timeout,
+        prefetch_parser.cache_metadata,
+    )
+
+    # First user request of the prefetched career page extends its expiration
+    with patch.object(PlayerParser, "compute_career_page_data"):
+        await PlayerParser(player_id="TeKrop-2217").parse()
+
+    last_update_ttl = await cache_manager.redis_server.ttl(
+        f"{settings.parser_cache_last_update_key_prefix}:{prefetch_parser.cache_key}"
+    )
+    assert last_update_ttl > settings.career_prefetch_expiration_timeout
+    metadata = await cache_manager.get_parser_cache_metadata(
+        [prefetch_parser.cache_key]
+    )
+    assert not metadata[prefetch_parser.cache_key]["prefetched"]
+
+    # Next requests are using the Parser Cache as usual
+    with (
+        patch.object(PlayerParser, "compute_career_page_data"),
+        patch.object(
+            cache_manager, "update_parser_cache_last_update", AsyncMock()
+        ) as update_parser_cache_last_update_mock,
+    ):
+        await PlayerParser(player_id="TeKrop-2217").parse()
+
+    update_parser_cache_last_update_mock.assert_not_called()
+
+
 def test_search_players_internal_error():
     with patch(
         "app.handlers.search_players_request_handler.SearchPlayersRequestHandler.process_request",